@@ -0,0 +1,190 @@
+"""
+Drag coefficient correlations of nonspherical particles with a common
+interface. Each correlation in DRAG has
+    cd(Re, sp) = drag coefficient as a function of Reynolds number and
+                 sphericity, broadcast over both
+    ut(dp, rhos, sp, rhog, mug, g) = explicit terminal velocity, or None
+                 when it is solved from the drag balance with terminal.py
+    valid(Re, sp) = mask of the Re and sphericity where the correlation
+                    applies
+and cd() and ut() return the mask with the results so values outside the
+range of a correlation can be found instead of being used silently. The
+correlations are
+    'ganser' = Ganser 1993, Eq 18, for sp 0.09 to 1 and Re*K1*K2 < 1e5
+    'haider' = Haider and Levenspiel, Kunii 1991 pg 80, Eqs 28-29, for
+               sp 0.026 to 1 and Re < 2.6e5
+    'kunii' = dimensionless ut* and dp* fit of Kunii 1991 pg 80-83, Eqs 31-33,
+              for sp 0.5 to 1
+    'santos' = Stokes, intermediate, and Newton regimes of Santos 2010 pg 86,
+               Eqs 4.12-4.15, for near spherical particles, sp >= 0.95 is
+               used here, and Re < 2e5
+
+Example:
+    Cd, ok = cd('haider', Re, 0.8)
+    ut, ok = ut('kunii', dp, rhos, sp, rhog, mug)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+from terminal import terminal, ganser, haider
+
+# Drag coefficients
+# -----------------------------------------------------------------------------
+
+def kunii(Re, sp):
+    """
+    Drag coefficient of the ut* and dp* fit of Kunii 1991, Eq 33. With
+    z = dp*^1.5 and a = 2.335 - 1.744*sp the fit is Re = z^2/(18 + a*z), so z
+    is the positive root of a quadratic and Cd = 4*dp*^3/(3*Re^2).
+
+    Example:
+        Cd = kunii(Re, 0.8)
+    """
+    Re = np.asarray(Re, dtype=float)
+    a = 2.335 - 1.744*np.asarray(sp, dtype=float)
+    z = (a*Re + np.sqrt((a*Re)**2 + 72*Re))/2
+    return 24/Re + 4*a*z/(3*Re)
+
+
+def santos(Re, sp):
+    """
+    Drag coefficient of a near spherical particle in the Stokes, Re <= 2,
+    intermediate, 2 < Re <= 500, and Newton, Re > 500, regimes of Santos 2010,
+    the Cd of Eqs 4.12-4.15. The sphericity is not used.
+
+    Example:
+        Cd = santos(Re, 1)
+    """
+    Re, sp = np.broadcast_arrays(np.asarray(Re, dtype=float),
+                                 np.asarray(sp, dtype=float))
+    return np.where(Re <= 2, 24/Re, np.where(Re <= 500, 18.5/Re**0.6, 0.44))
+
+# Explicit terminal velocities
+# -----------------------------------------------------------------------------
+
+def ut_kunii(dp, rhos, sp, rhog, mug, g=9.81):
+    """
+    Terminal velocity from ut* and dp* of Kunii 1991, Eqs 31-33, as in
+    ut_Kunnii1991_a.py.
+
+    Example:
+        ut = ut_kunii(0.000207, 2500, 0.8, 1.17, 1.85e-5)
+    """
+    dps = dp*((rhog*(rhos - rhog)*g)/(mug**2))**(1/3)
+    uts = (18/(dps**2) + (2.335 - 1.744*sp)/(dps**0.5))**-1
+    return uts*((mug*(rhos - rhog)*g)/(rhog**2))**(1/3)
+
+
+def ut_santos(dp, rhos, sp, rhog, mug, g=9.81):
+    """
+    Terminal velocity of Santos 2010, Eqs 4.12-4.15, as in ut_Santos2010.py
+    where the regime is picked from the Re of the Stokes velocity: Stokes for
+    Re <= 2, intermediate for 2 < Re <= 500, and Newton for Re > 500.
+
+    Example:
+        ut = ut_santos(0.000207, 2500, 1, 1.17, 1.85e-5)
+    """
+    dp, rhos, sp, rhog, mug = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (dp, rhos, sp, rhog, mug)])
+    ut1 = (g*(dp**2)*(rhos - rhog))/(18*mug)
+    ut2 = ((g*(dp**1.6)*(rhos - rhog))/(13.9*(rhog**0.4)*(mug**0.6)))**0.71
+    ut3 = ((3.03*g*dp*(rhos - rhog))/rhog)**0.5
+    Re1 = dp*rhog*ut1/mug
+    return np.where(Re1 <= 2, ut1, np.where(Re1 <= 500, ut2, ut3))
+
+# Validity ranges
+# -----------------------------------------------------------------------------
+
+def _between(x, lo, hi):
+    x = np.asarray(x, dtype=float)
+    return (x >= lo) & (x <= hi)
+
+
+def valid_ganser(Re, sp):
+    """
+    Validity mask of Ganser 1993, sp 0.09 to 1 and Re*K1*K2 < 1e5.
+    """
+    sp = np.asarray(sp, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        K1 = (1/3 + 2/3*(sp**-0.5))**(-1)
+        K2 = 10**(1.8148*((-np.log(sp))**0.5743))
+        return _between(sp, 0.09, 1) & (np.asarray(Re)*K1*K2 < 1e5)
+
+
+def valid_haider(Re, sp):
+    """
+    Validity mask of Haider and Levenspiel, sp 0.026 to 1 and Re < 2.6e5.
+    """
+    return _between(sp, 0.026, 1) & (np.asarray(Re) < 2.6e5)
+
+
+def valid_kunii(Re, sp):
+    """
+    Validity mask of Kunii 1991 ut* and dp* fit, sp 0.5 to 1.
+    """
+    return _between(sp, 0.5, 1) & np.isfinite(Re)
+
+
+def valid_santos(Re, sp):
+    """
+    Validity mask of Santos 2010, sp 0.95 to 1 and Re < 2e5.
+    """
+    return _between(sp, 0.95, 1) & (np.asarray(Re) < 2e5)
+
+
+DRAG = {'ganser': {'cd': ganser, 'ut': None, 'valid': valid_ganser},
+        'haider': {'cd': haider, 'ut': None, 'valid': valid_haider},
+        'kunii': {'cd': kunii, 'ut': ut_kunii, 'valid': valid_kunii},
+        'santos': {'cd': santos, 'ut': ut_santos, 'valid': valid_santos}}
+
+# Common interface
+# -----------------------------------------------------------------------------
+
+def cd(name, Re, sp):
+    """
+    Drag coefficient of a correlation in DRAG and its validity mask.
+
+    Example:
+        Cd, ok = cd('ganser', np.logspace(-1, 4), 0.8)
+    Inputs:
+        name = name of the correlation in DRAG
+        Re = Reynolds number, (-)
+        sp = sphericity of the particle, perfect sphere = 1.0
+    Output:
+        Cd = drag coefficient, (-)
+        ok = True where Re and sp are in the range of the correlation
+    """
+    corr = DRAG[name]
+    Re, sp = np.broadcast_arrays(np.asarray(Re, dtype=float),
+                                 np.asarray(sp, dtype=float))
+    return corr['cd'](Re, sp), corr['valid'](Re, sp)
+
+
+def ut(name, dp, rhos, sp, rhog, mug, g=9.81):
+    """
+    Terminal velocity of a correlation in DRAG and its validity mask at the
+    Reynolds number of the terminal velocity. Correlations without an explicit
+    ut are solved with terminal() of terminal.py.
+
+    Example:
+        ut, ok = ut('santos', 0.000207, 2500, 1, 1.17, 1.85e-5)
+    Inputs:
+        name = name of the correlation in DRAG
+        dp = diameter of particle, m
+        rhos = density of particle, kg/m^3
+        sp = sphericity of the particle, perfect sphere = 1.0
+        rhog = density of gas, kg/m^3
+        mug = dynamic viscosity of gas, kg/ms
+        g = gravity, m/s^2
+    Output:
+        ut = terminal velocity, m/s
+        ok = True where Re and sp are in the range of the correlation
+    """
+    corr = DRAG[name]
+    if corr['ut'] is None:
+        u = terminal(dp, rhos, sp, rhog, mug, cd=corr['cd'], g=g)[0]
+    else:
+        u = corr['ut'](dp, rhos, sp, rhog, mug, g)
+    Re = dp*rhog*u/mug
+    return u, corr['valid'](Re, sp)
@@ -0,0 +1,67 @@
+"""
+Comparison of the drag correlations of drag.py for a population of particles
+with random size, density, and sphericity in air at 300 K. The terminal
+velocity of each correlation is compared to Ganser 1993 where both are valid,
+and the throughput of the Cd and ut evaluations is measured for a million
+particles. The Cd curves are plotted with dashed lines outside the validity
+range of each correlation.
+"""
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+from drag import DRAG, cd, ut
+
+# Parameters
+#------------------------------------------------------------------------------
+
+rhog = 1.17     # density of air at T = 300K, P = 1 atm (kg/m^3)
+mug = 1.85e-5   # dynamic viscosity of air (kg/ms)
+N = 1000000     # number of particles
+
+rng = np.random.default_rng(0)
+dp = 10**rng.uniform(-5, -2, N)     # diameter of particle (m)
+rhos = rng.uniform(500, 8000, N)    # density of particle (kg/m^3)
+sp = rng.uniform(0.5, 1, N)         # sphericity of the particle (-)
+Re = 10**rng.uniform(-1, 4, N)      # Reynolds numbers of the Cd timing (-)
+
+# Accuracy and throughput
+#------------------------------------------------------------------------------
+
+ref, okref = ut('ganser', dp, rhos, sp, rhog, mug)
+
+print('{:>8} {:>12} {:>12} {:>10} {:>10} {:>8}'.format(
+    'name', 'Cd per s', 'ut per s', 'mean dev', 'max dev', 'valid'))
+for name in DRAG:
+    t0 = time.time()
+    cd(name, Re, sp)
+    tcd = time.time() - t0
+
+    t0 = time.time()
+    u, ok = ut(name, dp, rhos, sp, rhog, mug)
+    tut = time.time() - t0
+
+    both = ok & okref
+    dev = np.abs(u[both] - ref[both])/ref[both]
+    print('{:>8} {:12.3e} {:12.3e} {:10.4f} {:10.4f} {:8.3f}'.format(
+        name, N/tcd, N/tut, dev.mean(), dev.max(), ok.mean()))
+
+# Plot of Cd for a sphere and a nonspherical particle
+#------------------------------------------------------------------------------
+
+Res = np.logspace(-1, 6, 400)
+
+py.figure(1)
+for k, s in enumerate([1.0, 0.8]):
+    py.subplot(1, 2, k + 1)
+    for name in DRAG:
+        Cd, ok = cd(name, Res, s)
+        line = py.loglog(Res, np.where(ok, Cd, np.nan), label=name)[0]
+        py.loglog(Res, np.where(ok, np.nan, Cd), '--', color=line.get_color())
+    py.title('Sphericity = {:.1f}'.format(s))
+    py.xlabel('Reynolds number, Re')
+    py.ylabel('Drag coefficient, Cd')
+    py.legend(loc='best')
+    py.grid(True, which='both', ls='-', alpha=0.4)
+
+py.show()
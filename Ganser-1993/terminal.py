@@ -0,0 +1,181 @@
+"""
+Terminal velocity, ut, of particles from the balance of drag and gravity
+    Cd(Re, sp) = 4*g*dp*(rhos - rhog) / (3*ut^2*rhog),  Re = dp*rhog*ut/mug
+which is solved for every particle at once. The balance is written with the
+Archimedes number Ar = g*dp^3*rhog*(rhos - rhog)/mug^2 as
+    h(x) = ln(Cd(Re)) + 2*x - ln(4*Ar/3) = 0,  x = ln(Re)
+where Cd*Re^2 increases with Re so the root is bracketed. Each iteration takes
+a Newton step in x with h'(x) = 2 + dln(Cd)/dln(Re), which is analytic for
+ganser() and haider() and a central difference for any other drag
+coefficient, and falls back to bisection when the step leaves the bracket, so
+it converges to machine precision in a few iterations for any particle size
+and velocity. Scripts in the other folders import the solver
+with
+    import sys
+    sys.path.append('../Ganser-1993')
+    from terminal import terminal, ganser, haider
+
+Example:
+    ut, info = terminal(dp, rhos, sp, rhog, mug)
+    ut, info = terminal(dp, rhos, sp, rhog, mug, cd=haider)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+
+# Drag coefficients
+# -----------------------------------------------------------------------------
+
+def ganser(Re, sp):
+    """
+    Drag coefficient of Ganser 1993, Eq 18 with the Stokes' and Newton's shape
+    factors K1 and K2, as in cd_Ganser1993.py and ut_Ganser1993.py.
+
+    Example:
+        Cd = ganser(Re, 0.8)
+    """
+    K1 = (1/3 + 2/3*(sp**-0.5))**(-1)
+    K2 = 10**(1.8148*((-np.log(sp))**0.5743))
+    ReK = Re*K1*K2
+    return (24/(Re*K1))*(1 + 0.1118*(ReK**0.6567)) + (0.4305*K2)/(1 + 3305/ReK)
+
+
+def haider(Re, sp):
+    """
+    Drag coefficient of Haider and Levenspiel from pg 80, Eqs 28-29 in Kunii
+    1991 book, as in ut_Kunnii1991_b.py.
+
+    Example:
+        Cd = haider(Re, 0.8)
+    """
+    return ((24/Re)*(1 + (8.1716*np.exp(-4.0655*sp))*Re**(0.0964 + 0.5565*sp))
+            + (73.69*np.exp(-5.0748*sp)*Re)/(Re + 5.378*np.exp(6.2122*sp)))
+
+
+def dganser(Re, sp):
+    """
+    Logarithmic derivative dln(Cd)/dln(Re) of ganser().
+
+    Example:
+        dlnCd = dganser(Re, 0.8)
+    """
+    K1 = (1/3 + 2/3*(sp**-0.5))**(-1)
+    K2 = 10**(1.8148*((-np.log(sp))**0.5743))
+    ReK = Re*K1*K2
+    a = (24/(Re*K1))*0.1118*(ReK**0.6567)
+    Cd1 = 24/(Re*K1) + a
+    Cd2 = (0.4305*K2)/(1 + 3305/ReK)
+    dCd1 = -Cd1 + 0.6567*a
+    dCd2 = Cd2*(3305/ReK)/(1 + 3305/ReK)
+    return (dCd1 + dCd2)/(Cd1 + Cd2)
+
+
+def dhaider(Re, sp):
+    """
+    Logarithmic derivative dln(Cd)/dln(Re) of haider().
+
+    Example:
+        dlnCd = dhaider(Re, 0.8)
+    """
+    A = 8.1716*np.exp(-4.0655*sp)
+    m = 0.0964 + 0.5565*sp
+    B = 73.69*np.exp(-5.0748*sp)
+    C = 5.378*np.exp(6.2122*sp)
+    Cd1 = (24/Re)*(1 + A*Re**m)
+    Cd2 = B*Re/(Re + C)
+    dCd1 = (24/Re)*(A*(m - 1)*Re**m - 1)
+    dCd2 = Cd2*C/(Re + C)
+    return (dCd1 + dCd2)/(Cd1 + Cd2)
+
+
+# analytic dln(Cd)/dln(Re) of the drag coefficients
+DERIVATIVES = {ganser: dganser, haider: dhaider}
+
+# Terminal velocity
+# -----------------------------------------------------------------------------
+
+def terminal(dp, rhos, sp, rhog, mug, cd=ganser, g=9.81, tol=1e-14,
+             maxiter=100, dcd=None):
+    """
+    Terminal velocity of particles by a bracketed Newton iteration of the drag
+    balance in log(Re). All inputs broadcast against each other.
+
+    Example:
+        ut, info = terminal(0.000207, 2500, 0.8, 1.17, 1.85e-5)
+    Inputs:
+        dp = diameter of particle, m
+        rhos = density of particle, kg/m^3
+        sp = sphericity of the particle, perfect sphere = 1.0
+        rhog = density of gas, kg/m^3
+        mug = dynamic viscosity of gas, kg/ms
+        cd = drag coefficient as a function of (Re, sp)
+        g = gravity, m/s^2
+        tol = tolerance of the step in ln(Re) and of the residual h
+        maxiter = largest number of iterations
+        dcd = dln(Cd)/dln(Re) as a function of (Re, sp), default is the one of
+              DERIVATIVES or a central difference of cd
+    Output:
+        ut = terminal velocity, m/s
+        info = dictionary of Re, Cd, iterations of each particle, and residual
+               as the relative difference of Cd from the balance
+    """
+    dp, rhos, sp, rhog, mug = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (dp, rhos, sp, rhog, mug)])
+    shape = dp.shape
+    dp, rhos, sp, rhog, mug = [v.ravel() for v in (dp, rhos, sp, rhog, mug)]
+
+    Ar = g*dp**3*rhog*(rhos - rhog)/mug**2
+    rhs = np.log(4*Ar/3)
+
+    def h(x, j):
+        return np.log(cd(np.exp(x), sp[j])) + 2*x - rhs[j]
+
+    if dcd is None:
+        dcd = DERIVATIVES.get(cd)
+
+    def dh(x, j):
+        if dcd is None:
+            d = 1e-6
+            return (h(x + d, j) - h(x - d, j))/(2*d)
+        return 2 + dcd(np.exp(x), sp[j])
+
+    # bracket in x = ln(Re) and a start between the Stokes and Newton limits
+    lo = np.full(len(dp), np.log(1e-30))
+    hi = np.full(len(dp), np.log(1e12))
+    x = np.log(np.minimum(Ar/18, np.sqrt(3*Ar)))
+    it = np.zeros(len(dp), dtype=int)
+    active = np.arange(len(dp))
+
+    for k in range(maxiter):
+        if len(active) == 0:
+            break
+        xa = x[active]
+        f = h(xa, active)
+        df = dh(xa, active)
+
+        # shrink the bracket, the root is below x where h > 0
+        pos = f > 0
+        hi[active] = np.where(pos, xa, hi[active])
+        lo[active] = np.where(pos, lo[active], xa)
+
+        # Newton step or bisection when it leaves the bracket
+        xn = xa - f/df
+        out = ~((xn > lo[active]) & (xn < hi[active])) | ~np.isfinite(xn)
+        xn = np.where(out & (np.abs(f) > tol), (lo[active] + hi[active])/2, xn)
+        xn = np.where(np.abs(f) <= tol, xa, xn)
+
+        x[active] = xn
+        it[active] += 1
+        done = ((np.abs(xn - xa) <= tol*np.maximum(1, np.abs(xa)))
+                | (np.abs(f) <= tol))
+        active = active[~done]
+
+    Re = np.exp(x)
+    ut = Re*mug/(dp*rhog)
+    Cd = cd(Re, sp)
+    Cdd = 4*g*dp*(rhos - rhog)/(3*ut**2*rhog)
+    info = {'Re': Re.reshape(shape), 'Cd': Cd.reshape(shape),
+            'iterations': it.reshape(shape),
+            'residual': ((Cd - Cdd)/Cdd).reshape(shape)}
+    return ut.reshape(shape), info
@@ -11,7 +11,7 @@ from __future__ import print_function
 from __future__ import division
 
 # libraries
-import numpy as np
+from terminal import terminal, ganser
 
 #---- Parameters
 
@@ -27,27 +27,21 @@ sp = 0.8        # sphericity of the particle, perfect sphere = 1.0
 
 #---- Calculations
 
-# papers Cui2007 and Chhabra1999 leave out the -2.25*dv/D term
-K1 = (1/3 + 2/3*(sp**-0.5))**(-1)           # Stokes' shape factor
-K2 = 10**(1.8148*((-np.log(sp))**0.5743))   # Newton's shape factor
-
-# guess range for terminal velocity, ut (m/s)
-ut = np.arange(0.001, 20, 0.001)           
+# papers Cui2007 and Chhabra1999 leave out the -2.25*dv/D term, see ganser()
+# in terminal.py for the Stokes' and Newton's shape factors K1 and K2
 
+# ut, terminal velocity from the drag balance solved by terminal.py (m/s)
 # Re, Reynolds number (-)
 # Cd, Ganser1993, drag coefficient as function of Re, K1, K2 (-)
 # Cdd, drag coefficient as function of ut, etc. (-)
-Re = (dp*rhog*ut)/ug
-Cd = (24/(Re*K1))*(1 + 0.1118*((Re*K1*K2)**0.6567)) + (0.4305*K2)/(1+(3305/(Re*K1*K2)))
+ut, info = terminal(dp, rhos, sp, rhog, ug, cd=ganser, g=g)
+Re = info['Re']
+Cd = info['Cd']
 Cdd = (4*g*dp*(rhos-rhog))/(3*(ut**2)*rhog)
 
-delta = np.abs(Cd-Cdd)  # compare difference between Cd and Cdd
-idx = np.argmin(delta)  # find index of minimum value in delta
-
 # print results to console
 print('--- Ganser1993 ---')
-print('ut =', ut[idx])
-print('Re =', Re[idx])
-print('Cd =', Cd[idx])
-print('Cdd =', Cdd[idx])
-print('delta =', delta[idx])
\ No newline at end of file
+print('ut =', ut)
+print('Re =', Re)
+print('Cd =', Cd)
+print('Cdd =', Cdd)
@@ -3,43 +3,13 @@ Compare RTD data from Figure 15 in Harris 2002 paper to the RTD results from
 Vusse 1962.
 """
 
+import sys
 import numpy as np
 import matplotlib.pyplot as py
 
-# Function for residence time distribution
-#------------------------------------------------------------------------------
+sys.path.append('../Vusse-1962')
+from rtd import rtd
 
-def rtd(n, tau, t, q=1, r=1):
-    """
-    Residence time distribution function for stirred tank reactor.
-    Assumes circulating flow, pumping action of stirrer, isotropic homogeneous 
-    turbulence in the circulating fluid.
-    INPUTS: 
-    n = number of mixing stages, (-)
-    tau = circulation time, s
-    t = time vector, s
-    q = feed rate, m^3/s
-    r = circulation rate, m^3/s
-    OUTPUT:
-    rt = residence time distribution, 1/s
-    EXAMPLE:
-    r = rtd(n, tau, t) or rtd(n, tau, t, q=2, r=3)
-    """
-    a = (n/tau)*(r/(r+q))**(1/n)    # term from Eq. 30
-    s = 0                           # initialize summation for g(at) Eq. 31
-    
-    for k in range(0, n):
-        # summation loop for number of mixing stages, see g(at) from Eq. 31
-        tm = np.exp(a*t*(np.cos(2*np.pi*k/n) + 1j*np.sin(2*np.pi*k/n)) + 1j*(2*np.pi*k)/n)
-        s += tm
-    
-    # g as g(at) from Eq. 31 and rt as R(t) from Eq. 30
-    g = (1/n)*s
-    # vector of complex values for residence time distribution
-    rt = (q/(r+q))*((r+q)/r)**((n-1)/n)*(n/tau)*np.exp(-(n*t)/tau)*g
-    return rt
-    
-    
 # Calculate residence time distribution for n and tau
 #------------------------------------------------------------------------------
 
@@ -77,7 +47,7 @@ x15d, y15d = np.loadtxt('fig15d.csv', delimiter=",", unpack=True)
 py.close('all')
 
 py.figure(1)
-py.plot(t15a, abs(r15a.real), 'b-', lw=2, label='vusse')
+py.plot(t15a, r15a, 'b-', lw=2, label='vusse')
 py.plot(x15a, y15a, 'o', mec='g', mew=2, mfc='none', label='exp')
 py.xlabel('Time (s)')
 py.ylabel('Distribution function (1/s)')
@@ -85,7 +55,7 @@ py.legend(loc='best', numpoints=1)
 py.grid()
 
 py.figure(2)
-py.plot(t15b, abs(r15b.real), 'b-', lw=2, label='vusse')
+py.plot(t15b, r15b, 'b-', lw=2, label='vusse')
 py.plot(x15b, y15b, 'o', mec='g', mew=2, mfc='none', label='exp')
 py.xlabel('Time (s)')
 py.ylabel('Distribution function (1/s)')
@@ -93,7 +63,7 @@ py.legend(loc='best', numpoints=1)
 py.grid()
 
 py.figure(3)
-py.plot(t15c, abs(r15c.real), 'b-', lw=2, label='vusse')
+py.plot(t15c, r15c, 'b-', lw=2, label='vusse')
 py.plot(x15c, y15c, 'o', mec='g', mew=2, mfc='none', label='exp')
 py.xlabel('Time (s)')
 py.ylabel('Distribution function (1/s)')
@@ -101,7 +71,7 @@ py.legend(loc='best', numpoints=1)
 py.grid()
 
 py.figure(4)
-py.plot(t15d, abs(r15d.real), 'b-', lw=2, label='vusse')
+py.plot(t15d, r15d, 'b-', lw=2, label='vusse')
 py.plot(x15d, y15d, 'o', mec='g', mew=2, mfc='none', label='exp')
 py.xlabel('Time (s)')
 py.ylabel('Distribution function (1/s)')
@@ -0,0 +1,214 @@
+"""
+Distributed activation energy model (DAEM) for biomass pyrolysis. The biomass
+is a set of parallel first-order reactions with a distribution f(E) of the
+activation energy and a common pre-factor A so the unreacted fraction is
+    V(t) = integral of f(E) * exp(-A * psi(E, t)) dE
+    psi(E, t) = integral from 0 to t of exp(-E / (R*T(s))) ds
+The integral over E is a quadrature with nodes E_k and weights w_k from the
+distribution, or the energies and fractions of a discrete DAEM. The integrand
+exp(-A*psi) is a sharp step in E of width about R*T so the default is a
+uniform grid over the range of the distribution, which converges much faster
+than Gauss-Hermite (Gaussian) or Gauss-Laguerre (Weibull) rules that are also
+available. The integral over time is a cumulative trapezoid evaluated for all
+the E nodes at once.
+
+The kn() function is the same model as a kinetics option for the particle
+model where the unreacted fraction of each E node is stored for each node of
+the particle and updated for each time step.
+
+Example:
+    E, w = gaussian(180, 20)
+    V = conversion(E, w, 1e13, t, T)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+from scipy.integrate import cumulative_trapezoid
+from scipy.special import gamma, gammainc
+
+# Distributions of activation energy
+# -----------------------------------------------------------------------------
+
+def gaussian(E0, sigma, n=60, rule='uniform'):
+    """
+    Quadrature nodes and weights of a Gaussian distribution of activation
+    energy from a uniform grid over E0 +/- 6*sigma or the Gauss-Hermite rule.
+
+    Example:
+        E, w = gaussian(180, 20)
+    Inputs:
+        E0 = mean activation energy, kJ/mol
+        sigma = standard deviation of the activation energy, kJ/mol
+        n = number of quadrature nodes
+        rule = 'uniform' or 'hermite'
+    Output:
+        E = activation energy at each node, kJ/mol
+        w = weight of each node, sum of weights is 1
+    """
+    if rule == 'hermite':
+        x, wx = np.polynomial.hermite.hermgauss(n)
+        E = E0 + np.sqrt(2)*sigma*x
+        w = wx/np.sqrt(np.pi)
+    else:
+        E = np.linspace(E0 - 6*sigma, E0 + 6*sigma, n)
+        f = np.exp(-(E - E0)**2 / (2*sigma**2))
+        w = f/f.sum()
+    return E, w
+
+
+def weibull(E0, eta, beta, n=60, rule='uniform'):
+    """
+    Quadrature nodes and weights of a Weibull distribution of activation
+    energy, f(E) = beta/eta * ((E-E0)/eta)^(beta-1) * exp(-((E-E0)/eta)^beta)
+    for E > E0, from cells up to the quantile 1 - 1e-12 or the Gauss-Laguerre
+    rule in x = ((E-E0)/eta)^beta. The cells are uniform in E for beta >= 2
+    and uniform in x^(1/2) for smaller beta, whose long tail would leave few
+    cells where the reactions happen. The weight of each cell is the
+    difference of the cumulative distribution 1 - exp(-x) at its edges, with
+    the tail in the last cell, and its node is the mean E of the cell, so f(E)
+    is never evaluated at E0 where it is infinite for beta < 1 and the mean of
+    the nodes is E0 + eta*Gamma(1 + 1/beta) for any n.
+
+    Example:
+        E, w = weibull(150, 40, 2.5)
+    Inputs:
+        E0 = threshold activation energy, kJ/mol
+        eta = scale of the distribution, kJ/mol
+        beta = shape of the distribution, (-)
+        n = number of quadrature nodes
+        rule = 'uniform' or 'laguerre'
+    Output:
+        E = activation energy at each node, kJ/mol
+        w = weight of each node, sum of weights is 1
+    """
+    if rule == 'laguerre':
+        u, w = np.polynomial.laguerre.laggauss(n)
+        E = E0 + eta*u**(1/beta)
+    else:
+        # cells in x = ((E-E0)/eta)^beta and the partial means of u in them
+        p = max(beta, 2)
+        x = (np.linspace(0, 27.63**(1/p), n+1))**p
+        x[-1] = np.inf
+        F = -np.expm1(-x)
+        w = np.diff(F)
+        m = gamma(1 + 1/beta)*np.diff(gammainc(1 + 1/beta, x))
+        u = np.where(w > 0, m/np.where(w > 0, w, 1), x[:-1]**(1/beta))
+        E = E0 + eta*u
+    return E, w
+
+
+def discrete(E, f):
+    """
+    Nodes and weights of a discrete distribution of activation energy such as
+    the energies and fractions of the reactions from the Miura method.
+
+    Example:
+        E, w = discrete([160, 180, 200], [0.2, 0.5, 0.3])
+    Inputs:
+        E = activation energy of each reaction, kJ/mol
+        f = fraction of each reaction, normalized to a sum of 1
+    Output:
+        E = activation energy at each node, kJ/mol
+        w = weight of each node, sum of weights is 1
+    """
+    E = np.asarray(E, dtype=float)
+    f = np.asarray(f, dtype=float)
+    return E, f/f.sum()
+
+
+# DAEM functions
+# -----------------------------------------------------------------------------
+
+def conversion(E, w, A, t, T, R=0.008314):
+    """
+    Unreacted fraction of the DAEM for a temperature history. All the E nodes
+    and all the columns of T are evaluated at once.
+
+    Example:
+        V = conversion(E, w, 1e13, t, T)
+    Inputs:
+        E = activation energy at each node, kJ/mol
+        w = weight of each node
+        A = pre-factor as scalar or for each node, 1/s
+        t = time vector, s
+        T = temperature, rows = time and columns for several histories, K
+        R = universal gas constant, kJ/mol*K
+    Output:
+        V = unreacted fraction, same shape as T, (-)
+    """
+    T = np.asarray(T, dtype=float)
+    shape = (-1,) + (1,)*T.ndim
+    E = np.asarray(E, dtype=float).reshape(shape)
+    A = np.broadcast_to(np.asarray(A, dtype=float), np.shape(w)).reshape(shape)
+
+    # psi for each E node by cumulative trapezoid along time
+    psi = cumulative_trapezoid(np.exp(-E / (R*T)), t, axis=1, initial=0)
+    V = np.tensordot(w, np.exp(-A*psi), axes=1)
+    return V
+
+
+def dtg(E, w, A, t, T, R=0.008314):
+    """
+    Rate of conversion -dV/dt of the DAEM for a temperature history from the
+    rate of each E node so no numerical derivative is needed.
+
+    Example:
+        dVdt = dtg(E, w, 1e13, t, T)
+    Inputs:
+        E, w, A, t, T, R = see conversion()
+    Output:
+        dVdt = rate of conversion, same shape as T, 1/s
+    """
+    T = np.asarray(T, dtype=float)
+    shape = (-1,) + (1,)*T.ndim
+    E = np.asarray(E, dtype=float).reshape(shape)
+    A = np.broadcast_to(np.asarray(A, dtype=float), np.shape(w)).reshape(shape)
+
+    K = A*np.exp(-E / (R*T))
+    psi = cumulative_trapezoid(K/A, t, axis=1, initial=0)
+    dVdt = np.tensordot(w, K*np.exp(-A*psi), axes=1)
+    return dVdt
+
+
+def kn(T, V, rhow, dt, i, H, E, w, A, yc=0, R=0.008314):
+    """
+    DAEM kinetics for biomass pyrolysis of a woody particle as an option for
+    the kn() function of the particle model. The unreacted fraction of each E
+    node is updated exactly for a constant temperature over the time step so
+    it stays between 0 and 1 for any time step.
+
+    Example:
+        V[i], B[i], g = kn(T, V, rhow, dt, i, H, E, w, A, yc)
+    Inputs:
+        T = temperature, rows = time step, columns = nodes, K
+        V = unreacted fraction, rows = time step, then E nodes, then nodes
+        rhow = density of wood, kg/m^3
+        dt = time step, s
+        i = row index
+        H = heat of reaction, J/kg
+        E, w = activation energy and weight of each E node, kJ/mol
+        A = pre-factor as scalar or for each E node, 1/s
+        yc = final char yield as mass fraction of wood, (-)
+        R = universal gas constant, kJ/mol*K
+    Output:
+        V[i] = unreacted fraction of each E node for row index i
+        B[i] = biomass mass fraction vector for row index i
+        g = heat generation, W/m^3
+    """
+    A = np.broadcast_to(np.asarray(A, dtype=float), np.shape(w))
+
+    # evaluate reaction rate constant for each E node and particle node, 1/s
+    K = A[:, None] * np.exp(-np.asarray(E)[:, None] / (R * T[i]))
+
+    # update unreacted fraction of each E node then the biomass mass fraction
+    Vnew = V[i-1] * np.exp(-K*dt)
+    Bold = np.dot(w, V[i-1])
+    Bnew = np.dot(w, Vnew)
+
+    # calculate heat of generation term from the solid mass loss
+    rp = rhow*(1-yc)*(Bnew - Bold)/dt   # rate of pyrolysis
+    g = H*rp                            # heat generation
+
+    # return the unreacted fractions, biomass mass fraction and heat generation
+    return Vnew, Bnew, g
@@ -0,0 +1,93 @@
+"""
+Thermogravimetric (TGA) curves from the distributed activation energy model
+(DAEM) for Gaussian, Weibull and discrete distributions of the activation
+energy at several heating rates. The quadrature in E is compared to a brute
+force integral on a dense grid of E, and the mean of the Weibull nodes to the
+analytic mean E0 + eta*Gamma(1 + 1/beta).
+"""
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+from scipy.special import gamma
+from daem import gaussian, weibull, discrete, conversion, dtg
+
+# Parameters
+#------------------------------------------------------------------------------
+
+A = 1e13                # pre-factor, 1/s
+E0 = 180                # mean activation energy, kJ/mol
+sigma = 20              # standard deviation of activation energy, kJ/mol
+betas = [5, 10, 20]     # heating rates, K/min
+T0 = 300                # initial temperature, K
+Tmax = 1000             # final temperature, K
+
+# Time vector and temperature histories as columns
+#------------------------------------------------------------------------------
+
+t = np.linspace(0, (Tmax-T0)/min(betas)*60, 4001)
+T = np.minimum(T0 + np.outer(t, betas)/60, Tmax)
+
+# Distributions
+#------------------------------------------------------------------------------
+
+dists = {
+    'gaussian': gaussian(E0, sigma),
+    'weibull': weibull(140, 45, 2),
+    'discrete': discrete([150, 170, 190, 210], [0.2, 0.3, 0.3, 0.2])
+}
+
+# brute force integral of the Gaussian on a dense grid of E
+Ed = np.linspace(E0-8*sigma, E0+8*sigma, 2001)
+fd = np.exp(-(Ed-E0)**2/(2*sigma**2))
+wd = fd/np.trapezoid(fd, Ed) * np.gradient(Ed)
+
+t0 = time.time()
+Vd = conversion(Ed, wd, A, t, T)
+tb = time.time() - t0
+
+t0 = time.time()
+V = dict((name, conversion(E, w, A, t, T)) for name, (E, w) in dists.items())
+tq = time.time() - t0
+
+print('brute force {} nodes = {:.3f} s'.format(len(Ed), tb))
+print('uniform {} nodes x {} distributions = {:.3f} s'.format(
+      len(dists['gaussian'][0]), len(dists), tq))
+print('max difference of Gaussian = {:.2e}'.format(np.abs(V['gaussian']-Vd).max()))
+
+# Gauss-Hermite rule with the same number of nodes
+Vh = conversion(*gaussian(E0, sigma, rule='hermite'), A=A, t=t, T=T)
+print('max difference of Gauss-Hermite = {:.2e}'.format(np.abs(Vh-Vd).max()))
+
+# mean of the Weibull nodes vs the analytic mean
+for b in [0.8, 1, 2.5]:
+    E, w = weibull(150, 40, b)
+    print('Weibull beta = {} mean E = {:.6f} vs {:.6f} kJ/mol'.format(
+          b, np.sum(w*E), 150 + 40*gamma(1 + 1/b)))
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+for k, name in enumerate(sorted(dists)):
+    E, w = dists[name]
+    dV = dtg(E, w, A, t, T)
+
+    py.figure(k+1)
+    py.subplot(2, 1, 1)
+    for j, beta in enumerate(betas):
+        py.plot(T[:, j], V[name][:, j], label='{} K/min'.format(beta))
+    py.ylabel('Unreacted fraction (-)')
+    py.title('DAEM with {} distribution'.format(name))
+    py.legend(loc='best', numpoints=1)
+    py.grid()
+
+    py.subplot(2, 1, 2)
+    for j, beta in enumerate(betas):
+        py.plot(T[:, j], dV[:, j]/(beta/60), label='{} K/min'.format(beta))
+    py.xlabel('Temperature (K)')
+    py.ylabel('DTG (1/K)')
+    py.grid()
+
+py.show()
@@ -0,0 +1,164 @@
+"""
+Segregated flow reactor conversion from the single particle model of
+model_Fig5a.py, the transient heat conduction of transhc.py with the kinetics
+of kinetics.py, and a residence time distribution (RTD) of the solids. Each
+particle converts as in the particle model for its own residence time so the
+reactor average is
+    Xbar = integral from 0 to inf of X(t) * E(t) dt
+The particle model is run once for each d, Tinf, and h and cached, then the
+integral is evaluated with adaptive quadrature for all the parameter sets of
+an RTD in one call. After tmax of the particle run the conversion is held at
+its last value, so the part of the RTD beyond tmax is added as
+X(tmax) * (1 - integral from 0 to tmax of E(t) dt).
+
+The RTD functions of the other folders are wrapped by rtdfun() so a sweep of
+mixing parameters is one call:
+    run = particle(0.02, 623, 65)
+    avg = segregated(run, rtdfun('tanks', np.arange(1, 11), 600))
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import sys
+import numpy as np
+from scipy.integrate import quad_vec
+from transhc import hc
+from kinetics import kn
+
+sys.path.append('../Kunii-1991')
+sys.path.append('../Vusse-1962')
+sys.path.append('../Levenspiel-1999')
+from tanks import etd
+from rtd import rtd
+from dispersion import et
+
+# particle runs for each (d, Tinf, h, options)
+_RUNS = {}
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def particle(d, Tinf, h, tmax=3600, nt=4000, nr=19, b=1, rhow=650, Ti=293,
+             H=-235000):
+    """
+    Run the particle model of model_Fig5a.py and return the particle average
+    conversion and yields at each time. Runs are cached so the same particle
+    is not run again for other RTDs.
+
+    Example:
+        run = particle(0.02, 623, 65)
+    Inputs:
+        d = biomass particle diameter, m
+        Tinf = ambient temperature, K
+        h = heat transfer coefficient, W/m^2*K
+        tmax = max time, s
+        nt = number of time steps
+        nr = number of radius steps
+        b = shape factor, 1 for cylinder or 2 for sphere
+        rhow = density of wood, kg/m^3
+        Ti = initial particle temperature, K
+        H = heat of reaction, J/kg
+    Output:
+        run = dictionary of t (s), X conversion of wood, Yc char yield, and
+              Ys residual weight fraction, all mass fractions of wood, (-)
+    """
+    key = (d, Tinf, h, tmax, nt, nr, b, rhow, Ti, H)
+    if key in _RUNS:
+        return _RUNS[key]
+
+    dt = tmax/nt
+    t = np.arange(0, tmax+dt, dt)[:nt+1]
+    r = d/2
+    dr = r/nr
+    m = nr+1
+
+    T = np.zeros((len(t), m))
+    T[0] = Ti
+    B = np.ones((len(t), m))
+    C1 = np.zeros((len(t), m))
+    C2 = np.zeros((len(t), m))
+
+    Yw = 1
+    cpbar = Yw*(1112.0 + 4.85*(T[0] - 273.15))
+    kbar = Yw*(0.13 + 3e-4*(T[0] - 273.15))
+    pbar = rhow*np.ones(m)
+    g = np.ones(m)*(1e-10)
+
+    for i in range(1, nt+1):
+        T[i] = hc(m, dr, b, dt, h, Tinf, g, T, i, r, pbar, cpbar, kbar)
+        B[i], C1[i], C2[i], g = kn(T, B, C1, C2, rhow, dt, i, H)
+
+        # update thermal properties as in model_Fig5a.py
+        cpw = 1112.0 + 4.85*(T[i] - 273.15)
+        kw = 0.13 + (3e-4)*(T[i] - 273.15)
+        cpc = 1003.2 + 2.09*(T[i] - 273.15)
+        kc = 0.08 - (1e-4)*(T[i] - 273.15)
+        pw = B[i]*rhow
+        pc = (C1[i]+C2[i])*rhow
+        Yw = pw/(pw + pc)
+        cpbar = Yw*cpw + (1-Yw)*cpc
+        kbar = Yw*kw + (1-Yw)*kc
+        pbar = pw + pc
+
+    run = {'t': t, 'X': 1 - np.mean(B, axis=1), 'Yc': np.mean(C1 + C2, axis=1),
+           'Ys': np.mean(B + C1 + C2, axis=1)}
+    _RUNS[key] = run
+    return run
+
+
+def rtdfun(name, *p):
+    """
+    RTD of the solids as a function of time that returns E for every parameter
+    set. The parameters broadcast against each other.
+
+    Example:
+        E = rtdfun('tanks', np.arange(1, 11), 600)
+        E(300)
+    Inputs:
+        name = 'tanks' for etd(n, tau) from Kunii 1991, 'vusse' for
+               rtd(n, tau, q, r) from Vusse 1962, or 'dispersion' for
+               et(D, L, u) from Levenspiel 1999
+        p = parameters of the RTD function
+    Output:
+        E = function of time t (s) that returns the RTD (1/s) of each set
+    """
+    p = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in p])
+    if name == 'tanks':
+        return lambda t: etd(p[0], p[1], t)
+    if name == 'vusse':
+        return lambda t: rtd(*(list(p[:2]) + [t] + list(p[2:])))
+    if name == 'dispersion':
+        # open vessel E(t) is zero at t = 0
+        return lambda t: et(p[0], p[1], p[2], max(t, 1e-300))
+    raise ValueError('unknown RTD ' + name)
+
+
+def segregated(run, E, keys=('X', 'Yc', 'Ys'), epsabs=1e-6, epsrel=1e-6):
+    """
+    Reactor average of the particle conversion and yields for segregated flow
+    by adaptive quadrature of X(t)*E(t) for all the RTD parameter sets at once.
+
+    Example:
+        avg = segregated(particle(0.02, 623, 65), rtdfun('vusse', 4, taus))
+    Inputs:
+        run = particle run from particle()
+        E = RTD function of time that returns an array of parameter sets
+        keys = particle results to average
+        epsabs, epsrel = tolerances of the quadrature
+    Output:
+        avg = dictionary of key: reactor average for each RTD parameter set,
+              and F as the fraction of the RTD before the end of the run
+    """
+    t = run['t']
+    tmax = t[-1]
+    Y = [run[key] for key in keys]
+
+    def f(s):
+        Es = np.asarray(E(s), dtype=float)
+        return np.array([np.interp(s, t, y)*Es for y in Y] + [Es])
+
+    res, err = quad_vec(f, 0, tmax, epsabs=epsabs, epsrel=epsrel)
+    F = res[-1]
+    avg = dict((key, res[j] + Y[j][-1]*(1 - F)) for j, key in enumerate(keys))
+    avg['F'] = F
+    return avg
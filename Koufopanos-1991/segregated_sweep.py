@@ -0,0 +1,63 @@
+"""
+Reactor average conversion and char yield of the Koufopanos 1991 particle in a
+fluidized bed with segregated flow of the solids. The mixing intensity is swept
+as the number of stages of the Kunii 1991 beds in series and as the Vusse 1962
+mixing stages while the particle model is run once for each temperature.
+"""
+
+import numpy as np
+import matplotlib.pyplot as py
+from segregated import particle, rtdfun, segregated
+
+# Parameters
+#------------------------------------------------------------------------------
+
+d = 0.02                # biomass particle diameter, m
+h = 65                  # heat transfer coefficient, W/m^2*K
+Tinfs = [623, 673]      # ambient temperatures, K
+tau = 600               # mean solids residence time, s
+ns = np.arange(1, 21)   # number of stages, (-)
+
+# Reactor averages for each temperature and number of stages
+#------------------------------------------------------------------------------
+
+res = {}
+for Tinf in Tinfs:
+    run = particle(d, Tinf, h)
+    # plug flow is the particle at t = tau
+    plug = np.interp(tau, run['t'], run['X']), np.interp(tau, run['t'], run['Yc'])
+    tanks = segregated(run, rtdfun('tanks', ns, tau))
+    # circulation time of the Vusse stirred tank with q = r is half of tau
+    vusse = segregated(run, rtdfun('vusse', ns, tau/2))
+    res[Tinf] = plug, tanks, vusse
+    print('Tinf = {} K, plug flow X = {:.3f}, one stage X = {:.3f}'
+          .format(Tinf, plug[0], tanks['X'][0]))
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+for Tinf, col in zip(Tinfs, ['b', 'r']):
+    plug, tanks, vusse = res[Tinf]
+    py.plot(ns, tanks['X'], col+'o-', lw=2, label='tanks {} K'.format(Tinf))
+    py.plot(ns, vusse['X'], col+'s--', lw=2, label='vusse {} K'.format(Tinf))
+    py.axhline(plug[0], c=col, ls=':', label='plug flow {} K'.format(Tinf))
+py.xlabel('Number of stages (-)')
+py.ylabel('Reactor average conversion (-)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.figure(2)
+for Tinf, col in zip(Tinfs, ['b', 'r']):
+    plug, tanks, vusse = res[Tinf]
+    py.plot(ns, tanks['Yc'], col+'o-', lw=2, label='tanks {} K'.format(Tinf))
+    py.plot(ns, vusse['Yc'], col+'s--', lw=2, label='vusse {} K'.format(Tinf))
+    py.axhline(plug[1], c=col, ls=':', label='plug flow {} K'.format(Tinf))
+py.xlabel('Number of stages (-)')
+py.ylabel('Reactor average char yield (-)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
@@ -4,6 +4,7 @@ Residence time distribution (RTD) of Figure 3 from pg. 339 in Kunii 1991 book
 
 import numpy as np
 import matplotlib.pyplot as py
+from tanks import etd, check
 
 py.close('all')
 
@@ -16,25 +17,6 @@ t = np.linspace(0, 10, 200) # time vector, s
 # Residence Time Distribution, (RTD)
 # -----------------------------------------------------------------------------
 
-def etd(n, tau, t):
-    """
-    Exit age distribution (RTD) for solids in multistaged fluidized beds from 
-    Eq 5 in Kunii 1991 book from pg 339.
-    INPUTS
-    n = number of stages, number of equal-sized beds in series
-    tau = total solids residence time, s
-    t = time vector, s
-    OUTPUT
-    et = exit age distribution or RTD of solids as a whole
-    EXAMPLE
-    
-    """
-    # solids residence time for each stage from Eq. 4
-    ti = tau/n
-    # RTD of the solids for the beds as a whole from Eq. 5
-    et = 1/(np.math.factorial(n-1)*ti)*(t/ti)**(n-1)*np.exp(-t/ti)
-    return et
-
 # RTD for solids in a single bed, see Eq. 3
 et = (1/tau)*np.exp(-t/tau)
 
@@ -58,13 +40,13 @@ et10 = etd(n, tau, t)
 n = 20
 et20 = etd(n, tau, t)
 
-# check area under curves, should all be similar
-print('et1 ', np.trapz(et1))
-print('et2 ', np.trapz(et2))
-print('et3 ', np.trapz(et3))
-print('et5 ', np.trapz(et5))
-print('et10 ', np.trapz(et10))
-print('et20 ', np.trapz(et20))
+# check area under curves against the exact area from the CDF, also all the
+# stages at once as an array of n
+ns = np.array([1, 2, 3, 5, 10, 20])
+area, exact, ok = check(ns, tau, t)
+for k in range(len(ns)):
+    print('et{:<3} area = {:.5f}, exact = {:.5f}, converged = {}'.format(
+          ns[k], area[k], exact[k], ok[k]))
 
 # Plot
 # -----------------------------------------------------------------------------
@@ -0,0 +1,107 @@
+"""
+Residence time distribution (RTD) of solids in multistaged fluidized beds as
+equal-sized beds in series from pg. 339 in Kunii 1991 book. Scripts in the
+other folders import the function with
+    import sys
+    sys.path.append('../Kunii-1991')
+    from tanks import etd
+
+The factorial of Eq. 5 is written with the gamma function, (n-1)! = Gamma(n),
+and evaluated in log-space so the number of stages n can be real valued and
+large. All functions broadcast over arrays of n, tau, and t.
+"""
+
+import numpy as np
+from scipy.special import gammainc, gammaln, xlogy
+
+# Residence Time Distribution, (RTD)
+# -----------------------------------------------------------------------------
+
+def etd(n, tau, t):
+    """
+    Exit age distribution (RTD) for solids in multistaged fluidized beds from
+    Eq 5 in Kunii 1991 book from pg 339.
+    INPUTS
+    n = number of stages, number of equal-sized beds in series, real n > 0
+    tau = total solids residence time, s
+    t = time vector, s
+    OUTPUT
+    et = exit age distribution or RTD of solids as a whole
+    EXAMPLE
+    et = etd(3, 1.8, t)
+    et = etd(np.array([1, 2, 3.5])[:, None], 1.8, t) for rows of n
+    """
+    n, tau, t = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                      for v in (n, tau, t)])
+    # solids residence time for each stage from Eq. 4
+    ti = tau/n
+    # RTD of the solids for the beds as a whole from Eq. 5 in log-space
+    with np.errstate(divide='ignore'):
+        le = -gammaln(n) - np.log(ti) + xlogy(n-1, t/ti) - t/ti
+    et = np.exp(le)
+    return et
+
+
+def etf(n, tau, t):
+    """
+    Cumulative distribution F(t) of the exit age distribution for beds in
+    series as the regularized lower incomplete gamma function.
+    INPUTS
+    n = number of stages, real n > 0
+    tau = total solids residence time, s
+    t = time vector, s
+    OUTPUT
+    ft = fraction of solids with a residence time less than t, (-)
+    EXAMPLE
+    ft = etf(3, 1.8, t)
+    """
+    n = np.asarray(n, dtype=float)
+    return gammainc(n, np.asarray(t, dtype=float)*n/tau)
+
+
+def moments(n, tau):
+    """
+    Analytic moments of the exit age distribution for beds in series.
+    INPUTS
+    n = number of stages, real n > 0
+    tau = total solids residence time, s
+    OUTPUT
+    mean = mean residence time, s
+    var = variance of the residence time, s^2
+    skew = skewness of the residence time distribution, (-)
+    EXAMPLE
+    mean, var, skew = moments(3, 1.8)
+    """
+    n = np.asarray(n, dtype=float)
+    tau = np.asarray(tau, dtype=float)
+    mean = tau*np.ones(n.shape)
+    var = tau**2/n
+    skew = 2/np.sqrt(n)
+    return mean, var, skew
+
+
+def check(n, tau, t, tol=1e-3):
+    """
+    Convergence check of a sampled exit age distribution. The trapezoid area
+    of etd() over the time vector is compared to the exact area F(t[-1]) -
+    F(t[0]) so the error of the time grid is separated from the tail of the
+    distribution beyond the time vector.
+    INPUTS
+    n = number of stages, real n > 0
+    tau = total solids residence time, s
+    t = time vector, s
+    tol = tolerance of the grid error and of the missing tail
+    OUTPUT
+    area = trapezoid area of etd() over t, (-)
+    exact = exact area over t, (-)
+    ok = True if the grid error and the tail beyond t[-1] are below tol
+    EXAMPLE
+    area, exact, ok = check(3, 1.8, t)
+    """
+    t = np.asarray(t, dtype=float)
+    et = etd(np.asarray(n)[..., None], np.asarray(tau)[..., None], t)
+    area = np.trapezoid(et, t, axis=-1)
+    exact = etf(n, tau, t[-1]) - etf(n, tau, t[0])
+    tail = 1 - etf(n, tau, t[-1])
+    ok = (np.abs(area - exact) < tol) & (tail < tol)
+    return area, exact, ok
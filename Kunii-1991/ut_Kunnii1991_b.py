@@ -6,7 +6,10 @@ from __future__ import print_function
 from __future__ import division
 
 # libraries
-import numpy as np
+import sys
+
+sys.path.append('../Ganser-1993')
+from terminal import terminal, haider
 
 #--- INPUTS
 
@@ -22,24 +25,18 @@ sp = 0.8        # sphericity of the particle, perfect sphere = 1.0
 
 #--- OUTPUTS
 
-# guess range for terminal velocity, ut (m/s)
-ut = np.arange(0.001, 20, 0.001) 
-
+# ut, terminal velocity from the drag balance solved by terminal.py (m/s)
 # Re, Reynolds number (-)
 # Cd, drag coefficient as function of Re and sphericity (-)
 # Cdd, drag coefficient as function of ut, etc. (-)
-Re = (dp*rhog*ut)/ug
-Cd = (24/Re)*(1+(8.1716*np.exp(-4.0655*sp))*Re**(0.0964+0.5565*sp)) + (73.69*np.exp(-5.0748*sp)*Re)/(Re+5.378*np.exp(6.2122*sp))
+ut, info = terminal(dp, rhos, sp, rhog, ug, cd=haider, g=g)
+Re = info['Re']
+Cd = info['Cd']
 Cdd = (4*g*dp*(rhos-rhog))/(3*(ut**2)*rhog)
 
-delta = np.abs(Cd-Cdd)  # compare difference between Cd and Cdd
-idx = np.argmin(delta)  # find index of minimum value in delta
-
 # print results to console
 print('--- Kunii1991 ---')
-print('ut =', ut[idx])
-print('Re =', Re[idx])
-print('Cd =', Cd[idx])
-print('Cdd =', Cdd[idx])
-print('delta =', delta[idx])
-
+print('ut =', ut)
+print('Re =', Re)
+print('Cd =', Cd)
+print('Cdd =', Cdd)
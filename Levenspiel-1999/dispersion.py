@@ -0,0 +1,285 @@
+"""
+Dispersion model for open vessels having large deviation from plug flow where
+D/uL > 0.01. Refer to Ch. 13, pg 300-302 for Eq. 14 in Levenspiel 1999 book.
+Scripts in the other folders import the functions with
+    import sys
+    sys.path.append('../Levenspiel-1999')
+    from dispersion import eth, et
+
+The E(theta) curves of the closed-closed, open-closed, and open-open vessels
+are given by ethbc(). With Pe = uL/D the closed-closed vessel is the series
+over the eigenvalues y[k] of y*Pe/2 + 2*atan(y) = k*pi
+    E(theta) = sum of (-1)^(k+1) * 2*Pe*y^2/(4 + Pe*(1+y^2))
+               * exp(Pe/2 - Pe*(1+y^2)*theta/4)
+where the eigenvalues are cached for each Pe and the number of terms is set
+by the tolerance. The terms grow as exp(Pe/2 - Pe*theta/4) so at short times
+and large Pe the series cancels, and as theta goes to zero it needs many
+terms, so there E(theta) is inverted from the Laplace transform instead. The
+open-closed vessel is the closed form with erfc and the open-open vessel is
+eth(). For D/uL < 0.01 all three are the Gaussian of small deviation from plug
+flow.
+
+Reference:
+Levenspiel 1999. Chemical Reaction Engineering, 3rd Edition, Wiley & Sons, Inc.
+"""
+
+import numpy as np
+from collections import OrderedDict
+from scipy.special import comb, erfcx
+
+# eigenvalues of the closed-closed vessel for the last _NROOTS Peclet numbers,
+# least recently used first
+_ROOTS = OrderedDict()
+_NROOTS = 32
+
+# Functions for residence time distribution
+# -----------------------------------------------------------------------------
+
+def eth(DLu, theta):
+    """
+    E curve dispersion model for open vessels w/ large deviation from plug flow
+    where D/uL > 0.01, see Eq 14 E(theta)00 on pg 301 in Levenspiel 1999 book.
+    EXAMPLE
+    theta = np.linspace(0, 2, 400)
+    Eth = eth(0.1, theta)
+    PARAMETERS
+    DLu = D/Lu = dimensionless vessel dispersion number, (-)
+    theta = dimensionless time, (-)
+    RETURN
+    Eth = E(theta)00 = dimensionless exit-age distribution, (-)
+    """
+    tm1 = 1/np.sqrt(4*np.pi*DLu*theta)
+    tm2 = ((1-theta)**2)/(4*theta*DLu)
+    Eth = tm1*np.exp(-tm2)
+    return Eth
+    
+    
+def eth2(D, L, u, theta):
+    """
+    E curve dispersion model for open vessels w/ large deviation from plug flow
+    where D/uL > 0.01, see Eq 14 E(theta)00 on pg 301 in Levenspiel 1999 book.
+    EXAMPLE
+    theta = np.linspace(0, 2, 400)
+    Eth = eth(0.1, theta)
+    PARAMETERS
+    D = dispersion coefficient, m^2/s
+    L = length of vessel, m
+    u = inlet velocity, m/s
+    theta = dimensionless time range, (-)
+    RETURN
+    Eth = E(theta)00 = dimensionless exit-age distribution, (-)
+    """
+    tm1 = 1/(np.sqrt(4*np.pi*(D/(u*L))*theta))
+    tm2 = ((1-theta)**2)/(4*theta*(D/(u*L)))
+    Eth = tm1*np.exp(-tm2)
+    return Eth
+
+
+def et(D, L, u, t):
+    """
+    E curve dispersion model for open vessels w/ large deviation from plug flow
+    where D/uL > 0.01, see Eq 14 E(t) on pg 301 in Levenspiel 1999 book.
+    EXAMPLE
+    t = np.linspace(0, 4, 100)
+    Et = et(0.5, 1, 1, t)
+    PARAMETERS
+    D = dispersion coefficient, m^2/s
+    L = length of vessel, m
+    u = inlet velocity, m/s
+    t = time range, s
+    RETURN
+    Et = E(t)00 = exit-age distribution, 1/s
+    """
+    tm1 = u/(np.sqrt(4*np.pi*D*t))
+    tm2 = ((L-u*t)**2)/(4*D*t)
+    Et = tm1*np.exp(-tm2)
+    return Et
+
+
+# Functions for closed and open boundary conditions
+# -----------------------------------------------------------------------------
+
+def roots(Pe, K):
+    """
+    First K eigenvalues y of the closed-closed vessel from the roots of
+    y*Pe/2 + 2*atan(y) = k*pi for k = 1 to K. The roots of the last 32 Pe are
+    cached and only the missing ones are computed.
+    EXAMPLE
+    y = roots(20, 100)
+    PARAMETERS
+    Pe = uL/D = Peclet number, (-)
+    K = number of eigenvalues
+    RETURN
+    y = eigenvalues, (-)
+    """
+    Pe = float(Pe)
+    y = _ROOTS.pop(Pe, np.zeros(0))
+    if len(y) < K:
+        # each root is bracketed by 2*pi*(k-1)/Pe < y < 2*pi*k/Pe, bisection
+        k = np.arange(len(y) + 1, K + 1)
+        lo = 2*np.pi*(k - 1)/Pe
+        hi = 2*np.pi*k/Pe
+        for it in range(60):
+            mid = (lo + hi)/2
+            f = mid*Pe/2 + 2*np.arctan(mid) - k*np.pi
+            lo = np.where(f < 0, mid, lo)
+            hi = np.where(f < 0, hi, mid)
+        y = np.concatenate([y, (lo + hi)/2])
+    _ROOTS[Pe] = y
+    if len(_ROOTS) > _NROOTS:
+        _ROOTS.popitem(last=False)
+    return y[:K]
+
+
+def hcc(Pe, s):
+    """
+    Laplace transform of E(theta) for the closed-closed vessel written so it
+    does not overflow for Re(q) > 0.
+    EXAMPLE
+    H = hcc(20, s)
+    """
+    q = np.sqrt(1 + 4*s/Pe)
+    return 4*q*np.exp(Pe*(1 - q)/2)/((1 + q)**2 - (1 - q)**2*np.exp(-q*Pe))
+
+
+def _euler(F, t, M=20):
+    """
+    Inverse Laplace transform by the Euler method of Abate and Whitt 2006, as
+    euler() in Vusse-1962/compartment.py for a function F(s) of one curve.
+    """
+    k = np.arange(2*M + 1)
+    beta = M*np.log(10)/3 + 1j*np.pi*k
+
+    # Euler summation weights of the alternating series
+    xi = np.ones(2*M + 1)
+    xi[0] = 0.5
+    xi[2*M] = 2.0**-M
+    for j in range(1, M):
+        xi[2*M - j] = xi[2*M - j + 1] + 2.0**-M*comb(M, j)
+    eta = (-1)**k*xi
+
+    Fs = F(beta[:, None]/t[None, :])
+    return 10**(M/3)/t*np.sum(eta[:, None]*Fs.real, axis=0)
+
+
+def ecc(Pe, theta, tol=1e-10, tmin=0.05, kmax=10000):
+    """
+    E curve of the closed-closed vessel. The eigenvalue series is used where
+    its largest term is below 1e4 and theta >= tmin so it needs few terms, and
+    the Laplace inversion of hcc() at the shorter times.
+    EXAMPLE
+    theta = np.linspace(0, 2, 400)
+    Ecc = ecc(20, theta)
+    PARAMETERS
+    Pe = uL/D = Peclet number, (-)
+    theta = dimensionless time, (-)
+    tol = tolerance of the truncated series
+    tmin = smallest theta of the series
+    kmax = largest number of terms of the series
+    RETURN
+    Ecc = E(theta)cc = dimensionless exit-age distribution, (-)
+    """
+    theta = np.asarray(theta, dtype=float)
+    E = np.zeros(theta.shape)
+    pos = theta > 0
+    ser = (theta >= tmin) & (Pe/2 - Pe*theta/4 <= np.log(5e3))
+    lap = pos & ~ser
+
+    if ser.any():
+        th = theta[ser]
+        # terms are below 2*exp(Pe/2 - Pe*(1+y^2)*theta/4), smallest theta sets K
+        t0 = th.min()
+        ymax = np.sqrt(max(4*(Pe/2 - Pe*t0/4 + np.log(2/tol))/(Pe*t0), 0))
+        K = min(int(np.ceil(Pe*ymax/(2*np.pi))) + 2, kmax)
+        y = roots(Pe, K)[:, None]
+        sign = (-1.0)**np.arange(K)[:, None]
+        c = 2*Pe*y**2/(4 + Pe*(1 + y**2))
+        E[ser] = np.sum(sign*c*np.exp(Pe/2 - Pe*(1 + y**2)*th/4), axis=0)
+
+    if lap.any():
+        E[lap] = _euler(lambda s: hcc(Pe, s), theta[lap])
+    return E
+
+
+def eoc(Pe, theta):
+    """
+    E curve of the open-closed (or closed-open) vessel in closed form.
+    EXAMPLE
+    theta = np.linspace(0, 2, 400)
+    Eoc = eoc(20, theta)
+    PARAMETERS
+    Pe = uL/D = Peclet number, (-)
+    theta = dimensionless time, (-)
+    RETURN
+    Eoc = E(theta)oc = dimensionless exit-age distribution, (-)
+    """
+    theta = np.asarray(theta, dtype=float)
+    E = np.zeros(theta.shape)
+    pos = theta > 0
+    th = theta[pos]
+    ex = np.exp(-Pe*(1 - th)**2/(4*th))
+    z = (1 + th)/2*np.sqrt(Pe/th)
+    E[pos] = np.sqrt(Pe/(np.pi*th))*ex - Pe/2*ex*erfcx(z)
+    return E
+
+
+def ethbc(DLu, theta, bc='closed', tol=1e-10, small=0.01):
+    """
+    E curve dispersion model for the boundary conditions of the vessel. For
+    D/uL < small the Gaussian of small deviation from plug flow is used. DLu
+    and theta broadcast, each distinct DLu is evaluated once.
+    EXAMPLE
+    theta = np.linspace(0, 2, 400)
+    Eth = ethbc(0.1, theta, 'closed')
+    Eth = ethbc([[0.05], [0.1], [0.2]], theta, 'closed')
+    PARAMETERS
+    DLu = D/Lu = dimensionless vessel dispersion number, scalar or array, (-)
+    theta = dimensionless time, (-)
+    bc = 'closed' for closed-closed, 'open-closed', or 'open' for open-open
+    tol = tolerance of the closed-closed series
+    small = D/uL below which the Gaussian is used
+    RETURN
+    Eth = E(theta) = dimensionless exit-age distribution, (-)
+    """
+    if np.ndim(DLu) > 0:
+        DLu, theta = np.broadcast_arrays(np.asarray(DLu, dtype=float),
+                                         np.asarray(theta, dtype=float))
+        E = np.zeros(theta.shape)
+        for d in np.unique(DLu):
+            k = DLu == d
+            E[k] = ethbc(d, theta[k], bc, tol, small)
+        return E
+    theta = np.asarray(theta, dtype=float)
+    if DLu < small:
+        return np.exp(-(1 - theta)**2/(4*DLu))/np.sqrt(4*np.pi*DLu)
+    if bc == 'closed':
+        return ecc(1/DLu, theta, tol)
+    if bc == 'open-closed':
+        return eoc(1/DLu, theta)
+    if bc == 'open':
+        E = np.zeros(theta.shape)
+        E[theta > 0] = eth(DLu, theta[theta > 0])
+        return E
+    raise ValueError('unknown boundary condition ' + bc)
+
+
+def mvar(DLu, bc='closed'):
+    """
+    Mean and variance of E(theta) for the boundary conditions of the vessel,
+    see pg 300-301 in Levenspiel 1999 book.
+    EXAMPLE
+    mean, var = mvar(0.1, 'closed')
+    PARAMETERS
+    DLu = D/Lu = dimensionless vessel dispersion number, (-)
+    bc = 'closed', 'open-closed', or 'open'
+    RETURN
+    mean = mean of theta, (-)
+    var = variance of theta, (-)
+    """
+    if bc == 'closed':
+        return 1.0, 2*DLu - 2*DLu**2*(1 - np.exp(-1/DLu))
+    if bc == 'open-closed':
+        return 1 + DLu, 2*DLu + 3*DLu**2
+    if bc == 'open':
+        return 1 + 2*DLu, 2*DLu + 8*DLu**2
+    raise ValueError('unknown boundary condition ' + bc)
@@ -9,71 +9,8 @@ Levenspiel 1999. Chemical Reaction Engineering, 3rd Edition, Wiley & Sons, Inc.
 
 import numpy as np
 import matplotlib.pyplot as py
+from dispersion import eth, eth2, et
 
-# Functions for residence time distribution
-# -----------------------------------------------------------------------------
-
-def eth(DLu, theta):
-    """
-    E curve dispersion model for open vessels w/ large deviation from plug flow
-    where D/uL > 0.01, see Eq 14 E(theta)00 on pg 301 in Levenspiel 1999 book.
-    EXAMPLE
-    theta = np.linspace(0, 2, 400)
-    Eth = eth(0.1, theta)
-    PARAMETERS
-    DLu = D/Lu = dimensionless vessel dispersion number, (-)
-    theta = dimensionless time, (-)
-    RETURN
-    Eth = E(theta)00 = dimensionless exit-age distribution, (-)
-    """
-    tm1 = 1/np.sqrt(4*np.pi*DLu*theta)
-    tm2 = ((1-theta)**2)/(4*theta*DLu)
-    Eth = tm1*np.exp(-tm2)
-    return Eth
-    
-    
-def eth2(D, L, u, theta):
-    """
-    E curve dispersion model for open vessels w/ large deviation from plug flow
-    where D/uL > 0.01, see Eq 14 E(theta)00 on pg 301 in Levenspiel 1999 book.
-    EXAMPLE
-    theta = np.linspace(0, 2, 400)
-    Eth = eth(0.1, theta)
-    PARAMETERS
-    D = dispersion coefficient, m^2/s
-    L = length of vessel, m
-    u = inlet velocity, m/s
-    theta = dimensionless time range, (-)
-    RETURN
-    Eth = E(theta)00 = dimensionless exit-age distribution, (-)
-    """
-    tm1 = 1/(np.sqrt(4*np.pi*(D/(u*L))*theta))
-    tm2 = ((1-theta)**2)/(4*theta*(D/(u*L)))
-    Eth = tm1*np.exp(-tm2)
-    return Eth
-
-
-def et(D, L, u, t):
-    """
-    E curve dispersion model for open vessels w/ large deviation from plug flow
-    where D/uL > 0.01, see Eq 14 E(t) on pg 301 in Levenspiel 1999 book.
-    EXAMPLE
-    t = np.linspace(0, 4, 100)
-    Et = et(0.5, 1, 1, t)
-    PARAMETERS
-    D = dispersion coefficient, m^2/s
-    L = length of vessel, m
-    u = inlet velocity, m/s
-    t = time range, s
-    RETURN
-    Et = E(t)00 = exit-age distribution, 1/s
-    """
-    tm1 = u/(np.sqrt(4*np.pi*D*t))
-    tm2 = ((L-u*t)**2)/(4*D*t)
-    Et = tm1*np.exp(-tm2)
-    return Et
-    
-    
 # Calculate E-curve for Dispersion Model
 # -----------------------------------------------------------------------------
 
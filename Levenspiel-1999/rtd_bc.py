@@ -0,0 +1,46 @@
+"""
+Dispersion model curves E(theta) for closed-closed, open-closed, and open-open
+vessels. Refer to Ch. 13, pg 300-302 in Levenspiel 1999 book. The curves are
+the same for small D/uL and differ as the deviation from plug flow grows.
+
+Reference:
+Levenspiel 1999. Chemical Reaction Engineering, 3rd Edition, Wiley & Sons, Inc.
+"""
+
+import numpy as np
+import matplotlib.pyplot as py
+from dispersion import ethbc, mvar
+
+# Calculate E-curves for each boundary condition
+# -----------------------------------------------------------------------------
+
+theta = np.linspace(0, 3, 600)     # dimensionless time range, (-)
+DLus = [0.005, 0.05, 0.2, 1]        # dispersion numbers D/uL, (-)
+bcs = ['closed', 'open-closed', 'open']
+
+E = dict(((DLu, bc), ethbc(DLu, theta, bc)) for DLu in DLus for bc in bcs)
+
+for DLu in DLus:
+    for bc in bcs:
+        mean, var = mvar(DLu, bc)
+        print('D/uL = {:<5} {:<12} mean = {:.3f}, var = {:.4f}'
+              .format(DLu, bc, mean, var))
+
+# Plot
+# -----------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+for DLu, col in zip(DLus, ['b', 'g', 'r', 'c']):
+    py.plot(theta, E[DLu, 'closed'], col+'-', lw=2, label='D/uL = {}'.format(DLu))
+    py.plot(theta, E[DLu, 'open-closed'], col+'--', lw=2)
+    py.plot(theta, E[DLu, 'open'], col+':', lw=2)
+py.title('closed-closed (solid), open-closed (dash), open-open (dot)')
+py.xlabel(r'$\Theta$ (-)')
+py.ylabel(r'E($\Theta$)')
+py.ylim([0, 3])
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
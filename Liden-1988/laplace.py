@@ -0,0 +1,208 @@
+"""
+Conversion of a first-order reaction for a residence time distribution (RTD)
+as the Laplace transform of the RTD evaluated at the rate constant
+    fraction unreacted = integral from 0 to inf of E(t) * exp(-k*t) dt
+which is closed form for the tanks-in-series, Vusse 1962, and dispersion
+models. The Weibull RTD uses Gauss-Legendre quadrature and measured E(t) data
+use the trapezoid rule. All functions are vectorized over k so a temperature
+sweep of the rate constants is one call.
+
+The gas-phase factor (1 - exp(-k2*tg))/(k2*tg) of Eq. 18 for the tar yield in
+Liden 1988 is the transform of a uniform RTD from 0 to tg, see uniform(). The
+tar yield for another gas RTD is phi() with that RTD in place of uniform().
+
+Example:
+    k2 = rates(np.linspace(700, 900))[1]
+    surv = tanks(3, 0.5, k2)
+    tar = phi(3, np.linspace(700, 900), 'tanks', 3, 0.5)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import sys
+import numpy as np
+
+sys.path.append('../Levenspiel-1999')
+from dispersion import hcc
+
+# Laplace transforms of the RTD models
+# -----------------------------------------------------------------------------
+
+def uniform(tg, k):
+    """
+    Transform of a uniform RTD from 0 to tg, the gas factor of Eq. 18.
+
+    Example:
+        surv = uniform(0.5, k2)
+    Inputs:
+        tg = gas residence time, s
+        k = rate constant, 1/s
+    Output:
+        surv = fraction unreacted, (-)
+    """
+    x = np.asarray(k, dtype=float)*tg
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(x > 1e-8, -np.expm1(-x)/x, 1 - x/2)
+
+
+def tanks(n, tau, k):
+    """
+    Transform of n equal tanks in series, etd() of Kunii 1991.
+
+    Example:
+        surv = tanks(3, 0.5, k2)
+    Inputs:
+        n = number of tanks, real n > 0
+        tau = mean residence time, s
+        k = rate constant, 1/s
+    Output:
+        surv = fraction unreacted, (-)
+    """
+    n = np.asarray(n, dtype=float)
+    return np.exp(-n*np.log1p(np.asarray(k, dtype=float)*tau/n))
+
+
+def vusse(n, tau, k, q=1, r=1):
+    """
+    Transform of the Vusse 1962 RTD, rtd(), as a loop of n stirred stages with
+    a fraction r/(r+q) of the flow recycled.
+
+    Example:
+        surv = vusse(4, 0.25, k2)
+    Inputs:
+        n = number of mixing stages, (-)
+        tau = circulation time, s
+        k = rate constant, 1/s
+        q = feed rate, m^3/s
+        r = circulation rate, m^3/s
+    Output:
+        surv = fraction unreacted, (-)
+    """
+    Gn = tanks(n, tau, k)
+    return q/(r + q)*Gn/(1 - r/(r + q)*Gn)
+
+
+def dispersion(DLu, tau, k, bc='closed'):
+    """
+    Transform of the dispersion model of Levenspiel 1999 for a closed-closed,
+    open-closed, or open-open vessel. The closed-closed vessel is the first
+    order conversion of Wehner and Wilhelm.
+
+    Example:
+        surv = dispersion(0.1, 0.5, k2)
+    Inputs:
+        DLu = D/uL = dimensionless vessel dispersion number, (-)
+        tau = L/u = space time, s
+        k = rate constant, 1/s
+        bc = 'closed', 'open-closed', or 'open'
+    Output:
+        surv = fraction unreacted, (-)
+    """
+    Pe = 1/np.asarray(DLu, dtype=float)
+    s = np.asarray(k, dtype=float)*tau
+    q = np.sqrt(1 + 4*s/Pe)
+    if bc == 'closed':
+        return hcc(Pe, s)
+    if bc == 'open-closed':
+        return 2*np.exp(Pe*(1 - q)/2)/(1 + q)
+    if bc == 'open':
+        return np.exp(Pe*(1 - q)/2)/q
+    raise ValueError('unknown boundary condition ' + bc)
+
+
+def weibull(lam, kw, k, n=16):
+    """
+    Transform of the Weibull RTD, weibull() of rtd.py. With u = (t/lam)^kw
+    the transform is the integral of exp(-u)*exp(-k*lam*u^(1/kw)) for u from 0
+    to 40. The power u^(1/kw) is not smooth at u = 0 so the integral is
+    evaluated with n point Gauss-Legendre quadrature on panels that are
+    log-spaced towards u = 0.
+
+    Example:
+        surv = weibull(0.5, 2, k2)
+    Inputs:
+        lam = scale parameter, s
+        kw = shape parameter, (-)
+        k = rate constant, 1/s
+        n = number of quadrature points of each panel
+    Output:
+        surv = fraction unreacted, (-)
+    """
+    x, w = np.polynomial.legendre.leggauss(n)
+    edges = np.concatenate([[0], np.logspace(-14, np.log10(40), 40)])
+    a, b = edges[:-1, None], edges[1:, None]
+    u = ((a + b)/2 + (b - a)/2*x).ravel()
+    wu = ((b - a)/2*w).ravel()
+
+    lam, kw, k = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                       for v in (lam, kw, k)])
+    f = np.exp(-u - (k*lam)[..., None]*u**(1/kw[..., None]))
+    return np.sum(wu*f, axis=-1)
+
+
+def numeric(t, E, k):
+    """
+    Transform of a measured RTD by the trapezoid rule. The RTD is normalized
+    by its area so the fraction unreacted is one for k = 0.
+
+    Example:
+        t, E = np.loadtxt('../Berruti-1988/fig5.csv', delimiter=',', unpack=True)
+        surv = numeric(t, E, k2)
+    Inputs:
+        t = time of the measured RTD, s
+        E = measured RTD, 1/s
+        k = rate constant, 1/s
+    Output:
+        surv = fraction unreacted, (-)
+    """
+    t = np.asarray(t, dtype=float)
+    E = np.asarray(E, dtype=float)
+    i = np.argsort(t)
+    t, E = t[i], E[i]
+    k = np.asarray(k, dtype=float)
+    area = np.trapezoid(E, t)
+    return np.trapezoid(E*np.exp(-k[..., None]*t), t, axis=-1)/area
+
+
+MODELS = {'uniform': uniform, 'tanks': tanks, 'vusse': vusse,
+          'dispersion': dispersion, 'weibull': weibull}
+
+# Tar yield of Liden 1988
+# -----------------------------------------------------------------------------
+
+def rates(T):
+    """
+    Wood decomposition k and tar cracking k2 rate constants, 1/s, of Liden
+    1988 at temperature T, K.
+
+    Example:
+        k, k2 = rates(773)
+    """
+    R = 8.314                               # universal gas constant, J/mol*K
+    T = np.asarray(T, dtype=float)
+    k = 1e13*np.exp(-183.3e3/(R*T))         # overall wood decomposition, 1/s
+    k2 = 4.28e6*np.exp(-107.5e3/(R*T))      # tar decomposition, 1/s
+    return k, k2
+
+
+def phi(ts, T, model='uniform', *p, **kwargs):
+    """
+    Observed tar yield of Eq. 18 in Liden 1988 with the gas-phase survival of
+    the tar from the transform of a gas RTD. With model='uniform' and p = tg
+    this is phi() of phi_figure6.py.
+
+    Example:
+        tar = phi(3, T, 'tanks', 3, 0.5)
+        tar = phi(3, T, 'dispersion', 0.1, 0.5, bc='open')
+    Inputs:
+        ts = solids residence time, s
+        T = temperature, K
+        model = name of the RTD in MODELS
+        p = parameters of the RTD before k
+        kwargs = keyword parameters of the RTD
+    Output:
+        tar = observed tar yield, (-)
+    """
+    phis = 0.703    # ultimate tar yield, (-)
+    k, k2 = rates(T)
+    return phis*(1 - np.exp(-k*ts))*MODELS[model](*(p + (k2,)), **kwargs)
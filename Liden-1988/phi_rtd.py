@@ -0,0 +1,48 @@
+"""
+Tar yield of Eq. 18 in Liden 1988 for a sweep of temperatures with the gas
+residence time from a gas residence time distribution (RTD) instead of the
+uniform distribution of Eq. 18. All the RTDs have a mean gas residence time
+of tg and each curve is one call of phi() for the whole temperature sweep.
+"""
+
+import numpy as np
+import matplotlib.pyplot as py
+from laplace import phi
+
+# Parameters
+# -----------------------------------------------------------------------------
+
+ts = 3                          # solids residence time, s
+tg = 0.5                        # mean gas residence time, s
+T = np.linspace(700, 900, 200)  # temperature, K
+
+# Tar yield for each gas RTD
+# -----------------------------------------------------------------------------
+
+# uniform RTD from 0 to 2*tg has a mean of tg, the same as Eq. 18 for 2*tg
+tar = {'uniform (Eq. 18)': phi(ts, T, 'uniform', 2*tg),
+       'plug flow': phi(ts, T, 'tanks', 1e6, tg),
+       'one tank': phi(ts, T, 'tanks', 1, tg),
+       'three tanks': phi(ts, T, 'tanks', 3, tg),
+       'dispersion D/uL = 0.1': phi(ts, T, 'dispersion', 0.1, tg),
+       'vusse n = 4': phi(ts, T, 'vusse', 4, tg/2)}
+
+for name in tar:
+    print('{:<22} max tar yield {:.3f} at {:.0f} K, {:.3f} at {:.0f} K'
+          .format(name, tar[name].max(), T[np.argmax(tar[name])],
+                  tar[name][-1], T[-1]))
+
+# Plot
+# -----------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+for name in tar:
+    py.plot(T, tar[name], lw=2, label=name)
+py.xlabel('Temperature (K)')
+py.ylabel('Tar Yield (-)')
+py.title('Gas RTD for ts = {} s, tg = {} s'.format(ts, tg))
+py.legend(loc='best', numpoints=1)
+py.grid()
+py.show()
@@ -0,0 +1,273 @@
+"""
+Positivity and mass preserving integrators for the kinetic schemes kn1-kn4 of
+kinetics.py. Each scheme is written in production-destruction form as a list
+of first-order reactions (reactant, products) so the rate of change of the
+densities at each node is dc/dt = M*c where M is the rate matrix. Every column
+of M sums to zero, which conserves the total mass, and the off-diagonal terms
+are positive, which keeps the densities positive. The methods are:
+    patankar = modified Patankar-Euler, (I - dt*M) * c[i] = c[i-1]
+    exponential = exponential Euler, c[i] = expm(dt*M) * c[i-1], exact for a
+                  constant temperature over the time step
+    subcycle = explicit Euler with the number of sub-steps chosen so that
+               dt_sub * K <= cfl for every reaction
+All three are non-negative and conserve mass to round-off for any time step
+so the time step can be set by the heat conduction.
+
+The functions kn1-kn4 have the same inputs and outputs as kinetics.py with an
+optional method, so they can replace the import in the model scripts:
+    from integrators import kn2
+    pw[i], pc[i], pg[i], pt[i], g = kn2(T, pw, pc, pg, pt, dt, i, H)
+
+The heat generation g of each function is the one of kinetics.py, from the
+rate constants at T[i] and the densities of the previous step (the new wood
+density for kn1), so only the densities are changed by the integrators.
+
+In kn1 the secondary reaction (vol+gases)1 -> (vol+gases)2 removes and adds
+K3*pg*pc to both the gas and the char so it has no net effect on the gas and
+char densities. It converts gas to gas and is not part of the PD form here.
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import os
+import sys
+import numpy as np
+import scipy.linalg as sp
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'Ranzi-2014'))
+from arrhenius import table, lookup
+
+R = 0.008314    # universal gas constant, kJ/mol*K
+
+# Kinetic schemes in production-destruction form
+# -----------------------------------------------------------------------------
+
+# species index for wood, char, gas, tar, water, vapor
+WOOD, CHAR, GAS, TAR, WATER, VAPOR = 0, 1, 2, 3, 4, 5
+
+# reactions as (A, E, reactant, {product: mass fraction}) where A is the
+# pre-factor (1/s) and E is the activation energy (kJ/mol)
+SCHEMES = {
+    'kn1': [(168.4, 51.965, WOOD, {GAS: 1}),      # biomass -> volatiles + gases
+            (13.2, 45.960, WOOD, {CHAR: 1})],     # biomass -> char
+    'kn2': [(1.3e8, 140, WOOD, {GAS: 1}),         # wood -> gas
+            (2e8, 133, WOOD, {TAR: 1}),           # wood -> tar
+            (1.08e7, 121, WOOD, {CHAR: 1}),       # wood -> char
+            (4.28e6, 108, TAR, {GAS: 1}),         # tar -> gas
+            (1e6, 108, TAR, {CHAR: 1})],          # tar -> char
+    'kn3': [(1.3e8, 140, WOOD, {GAS: 1}),         # wood -> gas
+            (2e8, 133, WOOD, {TAR: 1}),           # wood -> tar
+            (1.08e7, 121, WOOD, {CHAR: 1}),       # wood -> char
+            (5.13e6, 87.9, WATER, {VAPOR: 1})],   # water -> vapor
+    'kn4': [(1.3e8, 140, WOOD, {GAS: 1}),         # wood -> gas
+            (2e8, 133, WOOD, {TAR: 1}),           # wood -> tar
+            (1.08e7, 121, WOOD, {CHAR: 1}),       # wood -> char
+            (4.28e6, 108, TAR, {GAS: 1}),         # tar -> gas
+            (1e6, 108, TAR, {CHAR: 1}),           # tar -> char
+            (5.13e6, 87.9, WATER, {VAPOR: 1})]    # water -> vapor
+}
+
+# rate constant tables of the schemes in 1/T, exact for the A*exp form
+TABLES = dict((name, table([rx[0] for rx in SCHEMES[name]],
+                           [rx[1] for rx in SCHEMES[name]], 0, R))
+              for name in SCHEMES)
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def rate_constants(name, T):
+    """
+    Rate constant of each reaction at each node from the table of the scheme.
+
+    Example:
+        K = rate_constants('kn2', T[i])
+    Inputs:
+        name = name of the scheme in SCHEMES
+        T = temperature at each node, K
+    Output:
+        K = rate constants, rows = reactions, columns = nodes, 1/s
+    """
+    return lookup(TABLES[name], np.atleast_1d(np.asarray(T, dtype=float)))
+
+
+def rate_matrix(scheme, K, ns):
+    """
+    Rate matrix M at each node so that dc/dt = M*c. The columns sum to zero and
+    the off-diagonal terms are positive.
+
+    Example:
+        M = rate_matrix(SCHEMES['kn2'], K, 4)
+    Inputs:
+        scheme = list of reactions from SCHEMES
+        K = rate constants, rows = reactions, columns = nodes, 1/s
+        ns = number of species
+    Output:
+        M = rate matrix with shape (nodes, species, species), 1/s
+    """
+    M = np.zeros((K.shape[1], ns, ns))
+    for j, (A, E, a, products) in enumerate(scheme):
+        M[:, a, a] -= K[j]
+        for p in products:
+            M[:, p, a] += products[p]*K[j]
+    return M
+
+
+def patankar(M, c, dt):
+    """
+    Modified Patankar-Euler step. For first-order reactions the production
+    and destruction terms weighted by c[i]/c[i-1] give the linear system
+    (I - dt*M) * c[i] = c[i-1] which is an M-matrix with unit column sums.
+
+    Example:
+        c1 = patankar(M, c0, dt)
+    Inputs:
+        M = rate matrix with shape (nodes, species, species), 1/s
+        c = densities, rows = species, columns = nodes, kg/m^3
+        dt = time step, s
+    Output:
+        c1 = densities after the time step, kg/m^3
+    """
+    ns = M.shape[1]
+    lhs = np.eye(ns) - dt*M
+    return np.linalg.solve(lhs, c.T[:, :, None])[:, :, 0].T
+
+
+def exponential(M, c, dt):
+    """
+    Exponential Euler step c[i] = expm(dt*M) * c[i-1] which is exact for a
+    constant rate matrix over the time step.
+
+    Example:
+        c1 = exponential(M, c0, dt)
+    Inputs:
+        M = rate matrix with shape (nodes, species, species), 1/s
+        c = densities, rows = species, columns = nodes, kg/m^3
+        dt = time step, s
+    Output:
+        c1 = densities after the time step, kg/m^3
+    """
+    G = sp.expm(dt*M)
+    return np.einsum('nij,jn->in', G, c)
+
+
+def subcycle(M, c, dt, cfl=0.5):
+    """
+    Explicit Euler sub-steps where the number of sub-steps is chosen so the
+    largest destruction rate of all the nodes times the sub-step is at most
+    cfl, which keeps the densities positive.
+
+    Example:
+        c1 = subcycle(M, c0, dt)
+    Inputs:
+        M = rate matrix with shape (nodes, species, species), 1/s
+        c = densities, rows = species, columns = nodes, kg/m^3
+        dt = time step, s
+        cfl = largest destruction rate times sub-step, at most 1
+    Output:
+        c1 = densities after the time step, kg/m^3
+    """
+    kmax = np.max(-np.diagonal(M, axis1=1, axis2=2))
+    n = max(int(np.ceil(dt*kmax/cfl)), 1)
+    h = dt/n
+    c1 = c.copy()
+    for k in range(n):
+        c1 = c1 + h*np.einsum('nij,jn->in', M, c1)
+    return c1
+
+
+def step(name, T, c, dt, method='patankar'):
+    """
+    Advance the densities of a kinetic scheme over one time step.
+
+    Example:
+        c1 = step('kn2', T[i], c0, dt, 'exponential')
+    Inputs:
+        name = name of the scheme in SCHEMES
+        T = temperature at each node, K
+        c = densities, rows = species, columns = nodes, kg/m^3
+        dt = time step, s
+        method = 'patankar', 'exponential', or 'subcycle'
+    Output:
+        c1 = densities after the time step, kg/m^3
+    """
+    methods = {'patankar': patankar, 'exponential': exponential,
+               'subcycle': subcycle}
+    c = np.atleast_2d(np.asarray(c, dtype=float))
+    M = rate_matrix(SCHEMES[name], rate_constants(name, T), c.shape[0])
+    return methods[method](M, c, dt)
+
+
+# Kinetic scheme functions with the layout of kinetics.py
+# -----------------------------------------------------------------------------
+
+def kn1(T, pw, pc, pg, dt, i, H, method='patankar'):
+    """
+    Sadhukhan2009 scheme of kinetics.kn1 with a positive integrator.
+
+    Example:
+        pw[i], pc[i], pg[i], g = kn1(T, pw, pc, pg, dt, i, H)
+    """
+    c = np.array([pw[i-1], pc[i-1], pg[i-1]])
+    pww, pcc, pgg = step('kn1', T[i], c, dt, method)
+
+    # heat generation from rate of pyrolysis as in kinetics.kn1
+    K1 = rate_constants('kn1', T[i])[0]
+    g = H*(-K1*pww)
+    return pww, pcc, pgg, g
+
+
+def kn2(T, pw, pc, pg, pt, dt, i, H, method='patankar'):
+    """
+    Chan1985, Blasi1993b scheme of kinetics.kn2 with a positive integrator.
+
+    Example:
+        pw[i], pc[i], pg[i], pt[i], g = kn2(T, pw, pc, pg, pt, dt, i, H)
+    """
+    c = np.array([pw[i-1], pc[i-1], pg[i-1], pt[i-1]])
+    pww, pcc, pgg, ptt = step('kn2', T[i], c, dt, method)
+
+    # heat generation from the rate of wood pyrolysis at the old state as in
+    # kinetics.kn2
+    K = rate_constants('kn2', T[i])
+    g = H*(-(K[0] + K[1] + K[2])*pw[i-1])
+    return pww, pcc, pgg, ptt, g
+
+
+def kn3(T, pw, pc, pg, pt, pwa, pva, dt, i, H, method='patankar'):
+    """
+    Chan1985 scheme with moisture of kinetics.kn3 with a positive integrator.
+
+    Example:
+        pw[i], pc[i], pg[i], pt[i], pwa[i], pva[i], g = kn3(T, pw, pc, pg, pt,
+                                                            pwa, pva, dt, i, H)
+    """
+    c = np.array([pw[i-1], pc[i-1], pg[i-1], pt[i-1], pwa[i-1], pva[i-1]])
+    pww, pcc, pgg, ptt, pwwa, pvva = step('kn3', T[i], c, dt, method)
+
+    # heat generation from the rates of pyrolysis and vaporization at the old
+    # state as in kinetics.kn3
+    K = rate_constants('kn3', T[i])
+    Hv = 2260000    # heat of vaporization, J/kg
+    g = H*(-(K[0] + K[1] + K[2])*pw[i-1]) + Hv*(-K[3]*pwa[i-1])
+    return pww, pcc, pgg, ptt, pwwa, pvva, g
+
+
+def kn4(T, pw, pc, pg, pt, pwa, pva, dt, i, H, method='patankar'):
+    """
+    Chan1985, Blasi1993b scheme with moisture of kinetics.kn4 with a positive
+    integrator.
+
+    Example:
+        pw[i], pc[i], pg[i], pt[i], pwa[i], pva[i], g = kn4(T, pw, pc, pg, pt,
+                                                            pwa, pva, dt, i, H)
+    """
+    c = np.array([pw[i-1], pc[i-1], pg[i-1], pt[i-1], pwa[i-1], pva[i-1]])
+    pww, pcc, pgg, ptt, pwwa, pvva = step('kn4', T[i], c, dt, method)
+
+    # heat generation from the rates of pyrolysis and vaporization at the old
+    # state as in kinetics.kn4
+    K = rate_constants('kn4', T[i])
+    Hv = 2260000    # heat of vaporization, J/kg
+    g = H*(-(K[0] + K[1] + K[2])*pw[i-1]) + Hv*(-K[5]*pwa[i-1])
+    return pww, pcc, pgg, ptt, pwwa, pvva, g
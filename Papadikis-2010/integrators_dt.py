@@ -0,0 +1,78 @@
+"""
+Compare the explicit Euler kn4 of kinetics.py to the positive integrators of
+integrators.py for a small and a large time step at a constant temperature of
+1000 K where the explicit Euler step gives negative densities.
+"""
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+import kinetics
+import integrators
+
+# Parameters
+#------------------------------------------------------------------------------
+
+rhow = 700      # density of wood, kg/m^3
+mc = 0.05       # moisture content as mass fraction of wood, (-)
+H = 255000      # heat of reaction, J/kg
+Tc = 1000       # constant temperature, K
+tmax = 1.0      # max time, s
+m = 20          # number of nodes
+
+# Solve the kinetic scheme kn4 for each method and time step
+#------------------------------------------------------------------------------
+
+methods = {
+    'euler': kinetics.kn4,
+    'patankar': lambda *args: integrators.kn4(*args, method='patankar'),
+    'exponential': lambda *args: integrators.kn4(*args, method='exponential'),
+    'subcycle': lambda *args: integrators.kn4(*args, method='subcycle')
+}
+
+res = {}
+
+for nt in [2000, 20]:
+    t = np.linspace(0, tmax, nt+1)
+    dt = t[1] - t[0]
+    T = np.full((nt+1, m), Tc)
+
+    for name in sorted(methods):
+        # wood, char, gas, tar, water, vapor densities at each node
+        p = [np.zeros((nt+1, m)) for k in range(6)]
+        p[0][0] = rhow
+        p[4][0] = mc*rhow
+
+        t0 = time.time()
+        for i in range(1, nt+1):
+            out = methods[name](T, *(p + [dt, i, H]))
+            for k in range(6):
+                p[k][i] = out[k]
+        tc = time.time() - t0
+
+        mass = sum(pk[-1, 0] for pk in p)
+        print('dt = {:.3f} s, {:<12} min density = {:10.3g}, mass error = {:.1e}, '
+              'time = {:.3f} s'.format(dt, name, min(pk.min() for pk in p),
+                                       abs(mass - rhow*(1+mc)), tc))
+        res[(name, nt)] = (t, p)
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+t, p = res[('exponential', 2000)]
+py.plot(t, p[0][:, 0], '-k', label='wood dt = {}'.format(tmax/2000))
+py.plot(t, p[3][:, 0], '--k', label='tar dt = {}'.format(tmax/2000))
+for name, style in [('patankar', 'o'), ('exponential', 's'), ('subcycle', '^')]:
+    t, p = res[(name, 20)]
+    py.plot(t, p[0][:, 0], style, label='wood ' + name)
+    py.plot(t, p[3][:, 0], style, mfc='none', label='tar ' + name)
+py.xlabel('Time (s)')
+py.ylabel('Density (kg/m^3)')
+py.title('Scheme kn4 at T = {} K with dt = {} s'.format(Tc, tmax/20))
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
@@ -2,11 +2,17 @@
 Compare 1-D transient heat conduction model to Papadikis2010a for d = 350um
 """
 
+import sys
 import numpy as np
 import matplotlib.pyplot as py
 from transhc import hc
 from kinetics import kn2
 
+sys.path.append('../Santos-2010')
+sys.path.append('../Ganser-1993')
+from gas import properties
+from terminal import terminal
+
 # Parameters
 #------------------------------------------------------------------------------
 
@@ -16,11 +22,26 @@ cpw = 1500      # biomass specific heat capacity, J/kg*K
 cpc = 1100      # char specific heat capacity, J/kg*K
 kw = 0.105      # biomass thermal conductivity, W/m*K
 kc = 0.071      # char thermal conductivity, W/m*K
-h = 900         # heat transfer coefficient, W/m^2*K
+h = 900         # heat transfer coefficient of Papadikis2010a, W/m^2*K
+hgas = False    # use h from the gas properties of gas.py instead
 Ti = 300        # initial particle temp, K
 Tinf = 773      # ambient temp, K
 H = 255000     # heat of reaction, J/kg
 
+# Heat transfer coefficient from the N2 properties at Tinf of gas.py
+#------------------------------------------------------------------------------
+
+# Ranz and Marshall Nu = 2 + 0.6*Re^0.5*Pr^(1/3) for the particle at its
+# terminal velocity in N2 at 1 atm, as in gas_sweep.py of Santos2010
+p = properties(Tinf, 101325, 'N2')
+ut, info = terminal(d, rhow, 1, p['rhog'], p['mug'])
+Nu = 2 + 0.6*info['Re']**0.5*p['Pr']**(1/3)
+hg = float(Nu*p['kg']/d)
+print('h = {} W/m^2K, from N2 with kg = {:.4f} W/mK, cpg = {:.0f} J/kgK '
+      'is {:.0f} W/m^2K'.format(h, float(p['kg']), float(p['cpg']), hg))
+if hgas:
+    h = hg
+
 # Shape factor, time, and node (radius point) vectors
 #------------------------------------------------------------------------------
 
@@ -107,7 +128,7 @@ py.plot(ts350-1, Ts350, 'or', label='surface')
 py.axhline(Tinf, c='k', ls='--', label='ambient')
 py.xlabel('Time (s)')
 py.ylabel('Temperature (K)')
-py.title(r'Temperatures for d={:.0f}$\mu m$, h={}$W/m^2K$'.format(d*10**6, h))
+py.title(r'Temperatures for d={:.0f}$\mu m$, h={:.0f}$W/m^2K$'.format(d*10**6, h))
 py.legend(loc='best', numpoints=1)
 py.ylim(ymin=Ti-20)
 
@@ -0,0 +1,235 @@
+"""
+Functions to replay kinetic reaction schemes from a prescribed temperature
+history. The temperature field T(r, t) is taken from measured or previously
+simulated data instead of solving the heat conduction at every time step, so
+only the chemistry is integrated. Several kinetic schemes can be compared
+against the same temperature history for a fraction of the cost of the coupled
+conduction model.
+
+Each kinetic scheme is a function with the same layout as the kn functions in
+kinetics.py where the species arrays are followed by the time step and the row
+index, and the last returned value is the heat generation:
+    pw[i], pc[i], pg[i], g = kn1(T, pw, pc, pg, dt, i, H)
+There are three ways to replay the schemes:
+    batch() = the first-order schemes of SCHEMES in integrators.py, vectorized
+              over the schemes and the nodes. The rate constants are looked up
+              in one table of arrhenius.py and scattered into a rate matrix
+              for every (scheme, node) pair, padded to the largest number of
+              species, so each time step is one lookup, one matrix product,
+              and one batched solve for all the schemes and nodes. This is the
+              main entry point for comparing schemes.
+    ranzi() = a reaction network of Ranzi-2014/network.py, such as BIOMASS of
+              biomass.py, with a schedule() through the temperatures of each
+              node passed as one batch to its stiff solver solve(), so the
+              nodes are one block-diagonal system.
+    replay() = any kn function such as kn of Koufopanos1991 with its own
+               explicit update. Each scheme is vectorized over the nodes only
+               and the schemes are integrated one after the other.
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+
+import os
+import sys
+import numpy as np
+from integrators import SCHEMES, R, patankar, exponential, subcycle
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'Ranzi-2014'))
+from arrhenius import table, lookup
+from network import schedule, solve
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def trace(t, tp, Tp):
+    """
+    Interpolate prescribed temperature traces onto the time vector. Values
+    outside the range of tp are held at the first and last temperature.
+
+    Example:
+        T = trace(t, tp, Tp)
+    Inputs:
+        t = time vector, s
+        tp = times of the prescribed temperatures, s
+        Tp = prescribed temperatures as a 1-D trace with len(tp) values or as a
+             2-D array with rows = len(tp) and columns = traces, K
+    Output:
+        T = temperature array with rows = time step and columns = traces, K
+    """
+    Tp = np.asarray(Tp, dtype=float)
+    if Tp.ndim == 1:
+        return np.interp(t, tp, Tp)
+    T = np.zeros((len(t), Tp.shape[1]))
+    for k in range(Tp.shape[1]):
+        T[:, k] = np.interp(t, tp, Tp[:, k])
+    return T
+
+
+def field(r, rp, Tp):
+    """
+    Interpolate temperature traces known at a few radial positions, such as the
+    center, mid, and surface temperatures, onto the node points of the
+    particle. Returns the temperature field T(r, t).
+
+    Example:
+        T = field(np.linspace(0, R, m), [0, R], trace(t, tp, Tp))
+    Inputs:
+        r = radial position of each node from center to surface, m
+        rp = radial positions of the traces in increasing order, m
+        Tp = temperatures with rows = time step and columns = len(rp), K
+    Output:
+        T = temperature array with rows = time step and columns = nodes, K
+    """
+    Tp = np.asarray(Tp, dtype=float)
+    rp = np.asarray(rp, dtype=float)
+
+    # index of the trace on the left of each node and the linear weight
+    j = np.clip(np.searchsorted(rp, r, side='right') - 1, 0, len(rp) - 2)
+    w = np.clip((r - rp[j]) / (rp[j+1] - rp[j]), 0, 1)
+
+    T = Tp[:, j]*(1 - w) + Tp[:, j+1]*w
+    return T
+
+
+def run(kn, y0, t, T):
+    """
+    Integrate one kinetic scheme for the prescribed temperature history.
+
+    Example:
+        pw, pc, pg = run(lambda T, pw, pc, pg, dt, i: kn1(T, pw, pc, pg, dt, i, H),
+                         (rhow, 0, 0), t, T)
+    Inputs:
+        kn = kinetic function as kn(T, *species, dt, i) returning the species
+             at row i followed by the heat generation
+        y0 = initial value of each species, scalar or array for each node
+        t = time vector, s
+        T = temperature array with rows = time step, K
+    Output:
+        y = list of species arrays with rows = time step and columns = nodes
+    """
+    y = [np.zeros(T.shape) for _ in y0]
+    for k in range(len(y0)):
+        y[k][0] = y0[k]
+
+    for i in range(1, len(t)):
+        dt = t[i] - t[i-1]
+        new = kn(T, *(y + [dt, i]))
+        for k in range(len(y)):
+            y[k][i] = new[k]
+
+    return y
+
+
+def replay(t, T, schemes):
+    """
+    Integrate several kinetic schemes for the same prescribed temperature
+    history. The temperature array is shared by all the schemes and each
+    scheme is evaluated for all the nodes (columns of T) at once, but the
+    schemes are integrated one after the other. Use batch() for the schemes
+    of SCHEMES in integrators.py.
+
+    Example:
+        res = replay(t, T, {'kn1': (f1, (rhow, 0, 0)), 'kn2': (f2, (rhow, 0, 0, 0))})
+        pw, pc, pg = res['kn1']
+    Inputs:
+        t = time vector, s
+        T = temperature array with rows = time step and columns = nodes, K
+        schemes = dictionary of name: (kn, y0) for each scheme, see run()
+    Output:
+        res = dictionary of name: list of species arrays for each scheme
+    """
+    res = {}
+    for name in schemes:
+        kn, y0 = schemes[name]
+        res[name] = run(kn, y0, t, T)
+    return res
+
+
+def batch(t, T, schemes, method='patankar'):
+    """
+    Integrate several first-order schemes of SCHEMES in integrators.py for the
+    same prescribed temperature history as one system of (scheme, node) pairs.
+
+    Example:
+        res = batch(t, T, {'kn1': (rhow, 0, 0), 'kn2': (rhow, 0, 0, 0)})
+        pw, pc, pg = res['kn1']
+    Inputs:
+        t = time vector, s
+        T = temperature array with rows = time step and columns = nodes, K
+        schemes = dictionary of name: y0 for each name in SCHEMES where y0 is
+                  the initial value of each species in the order of the
+                  species index of integrators.py, scalar or array for each
+                  node
+        method = 'patankar', 'exponential', or 'subcycle'
+    Output:
+        res = dictionary of name: list of species arrays for each scheme
+    """
+    methods = {'patankar': patankar, 'exponential': exponential,
+               'subcycle': subcycle}
+    T = np.asarray(T, dtype=float).reshape(len(t), -1)
+    names = list(schemes)
+    nb = len(names)
+    nn = T.shape[1]
+    ns = max(len(schemes[name]) for name in names)
+
+    # all the reactions as one table and the weights W that scatter their
+    # rate constants into the rate matrices, rows of W = (scheme, i, j)
+    A, E, W = [], [], []
+    for b, name in enumerate(names):
+        for Aj, Ej, a, products in SCHEMES[name]:
+            w = np.zeros((nb, ns, ns))
+            w[b, a, a] = -1
+            for p in products:
+                w[b, p, a] += products[p]
+            A.append(Aj)
+            E.append(Ej)
+            W.append(w.ravel())
+    W = np.array(W).T
+    tab = table(A, E, 0, R)
+
+    # densities with rows = species and columns = (scheme, node)
+    y = np.zeros((len(t), ns, nb, nn))
+    for b, name in enumerate(names):
+        for k, y0 in enumerate(schemes[name]):
+            y[0, k, b] = y0
+    c = y[0].reshape(ns, nb*nn)
+
+    for i in range(1, len(t)):
+        dt = t[i] - t[i-1]
+        K = lookup(tab, T[i])
+        M = W.dot(K).reshape(nb, ns, ns, nn).transpose(0, 3, 1, 2)
+        c = methods[method](M.reshape(nb*nn, ns, ns), c, dt)
+        y[i] = c.reshape(ns, nb, nn)
+
+    res = {}
+    for b, name in enumerate(names):
+        res[name] = [y[:, k, b] for k in range(len(schemes[name]))]
+    return res
+
+
+def ranzi(net, t, T, y0, R=1.987, view=False, **kwargs):
+    """
+    Integrate a reaction network of Ranzi-2014/network.py for the prescribed
+    temperature history. A piecewise linear schedule() through the
+    temperatures of each node is passed as one batch to solve() so all the
+    nodes are integrated at once by the stiff solver.
+
+    Example:
+        sp = ranzi(BIOMASS, t, T, y0)
+    Inputs:
+        net = compiled network from network() or combine()
+        t = time vector, s
+        T = temperature array with rows = time step and columns = nodes, K
+        y0 = initial amount of each species, rows = species
+        R = gas constant, kcal/kmol*K
+        view = return a Result view of the primary species, see network.py
+        kwargs = options for the solver, see solve()
+    Output:
+        sp = species array, rows = species then lumped species, columns =
+             time, and a third axis for the nodes
+    """
+    T = np.asarray(T, dtype=float).reshape(len(t), -1)
+    Ts = [schedule(t, T[:, k]) for k in range(T.shape[1])]
+    return solve(net, Ts, t, y0, R, view=view, **kwargs)
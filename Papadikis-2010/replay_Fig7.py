@@ -0,0 +1,141 @@
+"""
+Replay the kinetic schemes kn1-kn4, kn of Koufopanos1991, and the Ranzi2013
+biomass network from the center and surface temperatures of Figure 7 in
+Papadikis2010a for d = 350um. The heat conduction is not solved, the
+temperatures at the nodes are interpolated from the digitized data. The
+schemes kn1-kn4 are integrated one after the other and batched over the
+schemes, kn is integrated by itself as it is not a first-order Arrhenius
+scheme, and the Ranzi network is solved for all the nodes at once.
+"""
+
+import sys
+import time
+import importlib.util
+import numpy as np
+import matplotlib.pyplot as py
+from kinetics import kn1, kn2, kn3, kn4
+from replay import trace, field, replay, batch, ranzi
+
+sys.path.append('../Ranzi-2014')
+from biomass import BIOMASS, COMPONENTS, composition
+from network import initial
+from schemes import MW
+
+# kn of Koufopanos1991, its module has the same name as kinetics.py here
+spec = importlib.util.spec_from_file_location('koufopanos',
+                                              '../Koufopanos-1991/kinetics.py')
+koufopanos = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(koufopanos)
+
+# Parameters
+#------------------------------------------------------------------------------
+
+rhow = 700      # density of wood, kg/m^3
+d = 0.035e-2    # biomass particle diameter, m
+H = 255000      # heat of reaction, J/kg
+mc = 0.05       # moisture content as mass fraction of wood, (-)
+
+# cellulose, hemicellulose, lignin and split of lignin for the Ranzi network
+X = composition(0.5, 0.3, 0.2, [0.3, 0.4, 0.3])[0]
+
+# Time and node (radius point) vectors
+#------------------------------------------------------------------------------
+
+nt = 2000                       # number of time steps
+tmax = 0.8                      # max time, s
+dt = tmax/nt                    # time step, s
+t = np.arange(0, tmax+dt, dt)   # time vector
+
+nr = 19                             # number or radius steps
+r = d/2                             # radius of particle, m
+rn = np.linspace(0, r, nr+1)        # radius of each node, m
+
+# Prescribed temperature field from data
+#------------------------------------------------------------------------------
+
+# grab data from csv file, time in paper is offset by 1 s
+tc350, Tc350 = np.loadtxt('Fig7_cent350.csv', delimiter=',', unpack=True)
+ts350, Ts350 = np.loadtxt('Fig7_surf350.csv', delimiter=',', unpack=True)
+
+# interpolate the traces in time then between the center and surface nodes
+Tcs = np.column_stack((trace(t, tc350-1, Tc350), trace(t, ts350-1, Ts350)))
+T = field(rn, [0, r], Tcs)
+
+# Kinetic schemes as kn(T, *species, dt, i)
+#------------------------------------------------------------------------------
+
+schemes = {
+    'kn1': (lambda T, pw, pc, pg, dt, i: kn1(T, pw, pc, pg, dt, i, H),
+            (rhow, 0, 0)),
+    'kn2': (lambda T, pw, pc, pg, pt, dt, i: kn2(T, pw, pc, pg, pt, dt, i, H),
+            (rhow, 0, 0, 0)),
+    'kn3': (lambda T, pw, pc, pg, pt, pwa, pva, dt, i: kn3(T, pw, pc, pg, pt, pwa, pva, dt, i, H),
+            (rhow, 0, 0, 0, mc*rhow, 0)),
+    'kn4': (lambda T, pw, pc, pg, pt, pwa, pva, dt, i: kn4(T, pw, pc, pg, pt, pwa, pva, dt, i, H),
+            (rhow, 0, 0, 0, mc*rhow, 0))
+}
+
+t0 = time.time()
+res = replay(t, T, schemes)
+print('replay of {} schemes = {:.3f} s'.format(len(schemes), time.time()-t0))
+
+# same schemes batched as (scheme, node) pairs, initial species of each scheme
+y0 = dict((name, schemes[name][1]) for name in schemes)
+
+t0 = time.time()
+resb = batch(t, T, y0)
+print('batch of {} schemes = {:.3f} s'.format(len(y0), time.time()-t0))
+
+for name in sorted(res):
+    ys = (res[name][0] + res[name][1])/rhow
+    yb = (resb[name][0] + resb[name][1])/rhow
+    print('{} max difference in solid fraction = {:.2e}'.format(
+        name, np.max(np.abs(ys - yb))))
+
+# kn as mass fractions of biomass B and chars C1 and C2
+resb['kn'] = replay(t, T, {
+    'kn': (lambda T, B, C1, C2, dt, i: koufopanos.kn(T, B, C1, C2, rhow, dt, i, H),
+           (1, 0, 0))})['kn']
+
+# Ranzi2013 biomass network for a unit mass of wood, kmol/kg
+y0r = initial(BIOMASS, **dict(('{0}.{0}'.format(name), x/MW[name])
+                              for name, x in zip(COMPONENTS, X)))
+
+t0 = time.time()
+spr = ranzi(BIOMASS, t, T, y0r)
+print('ranzi for {} nodes = {:.3f} s'.format(T.shape[1], time.time()-t0))
+
+# residual solid mass fraction of the network at each time and node
+w = BIOMASS['w']
+mr = np.tensordot(w, spr[:len(w)], axes=1) / w.dot(y0r)
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+py.plot(t, T[:, 0], '-b', label='center')
+py.plot(t, T[:, -1], '-r', label='surface')
+py.plot(tc350-1, Tc350, 'ob', label='center')
+py.plot(ts350-1, Ts350, 'or', label='surface')
+py.xlabel('Time (s)')
+py.ylabel('Temperature (K)')
+py.title(r'Prescribed temperatures for d={:.0f}$\mu m$'.format(d*10**6))
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.figure(2)
+for name in sorted(res):
+    pw, pc = resb[name][0], resb[name][1]
+    py.plot(t, np.mean(pw + pc, axis=1)/rhow, label=name)
+B, C1, C2 = resb['kn']
+py.plot(t, np.mean(B + C1 + C2, axis=1), label='kn')
+py.plot(t, np.mean(mr, axis=1), label='Ranzi')
+py.xlabel('Time (s)')
+py.ylabel('Solid mass fraction (-)')
+py.title(r'Kinetic schemes for d={:.0f}$\mu m$'.format(d*10**6))
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
@@ -5,9 +5,13 @@
 from __future__ import print_function
 from __future__ import division
 
+import sys
 import numpy as np
 import matplotlib.pyplot as py
 
+sys.path.append('../Ranzi-2014')
+from network import network, isothermal
+
 #---- global parameters
 
 cell = 0.5      # cellulose
@@ -86,6 +90,17 @@ for i in range(1, nt):
     CELL[i] = CELL[i-1] - (K1 + K4)*CELL[i-1]*dt
     CELLA[i] = CELLA[i-1] + K1*CELL[i]*dt
 
+#---- exact solution at constant T from the sparse reaction network
+
+# products of reactions 2-4 for cellulose are lumped as G2, LVG, and G1
+net = network(['CELL', 'CELLA', 'G2', 'LVG', 'G1'],
+              [('CELL', A1, E1, 0, {'CELLA': 1}),
+               ('CELLA', A2, E2, 0, {'G2': 1}),
+               ('CELLA', A3, E3, 1, {'LVG': 1}),
+               ('CELL', A4, E4, 0, {'G1': 1})])
+
+sp = isothermal(net, T, t, [cell, 0, 0, 0, 0])
+
 #---- plot T vs K for cellulose, hemicellulose, lignin
 
 # testing
@@ -94,6 +109,8 @@ c = cell*np.exp(-(K1+K4)*tt)
 
 py.figure(1)
 py.plot(tt, c)
+py.plot(t, sp[0], '--', label='CELL exact')
+py.legend(loc='best', numpoints=1)
 py.title('test')
 py.show()
 
@@ -101,6 +118,9 @@ py.show()
 py.figure(2)
 py.plot(t, CELL)
 py.plot(t, CELLA)
+py.plot(t, sp[0], '--', label='CELL exact')
+py.plot(t, sp[1], '--', label='CELLA exact')
+py.legend(loc='best', numpoints=1)
 py.title('main')
 py.show()
 
@@ -0,0 +1,121 @@
+"""
+Table of Arrhenius rate constants for a whole kinetic scheme. The logarithm of
+the rate constant
+    ln K = ln A + n*ln T - E/(R*T)
+is tabulated on a uniform grid of x = 1/T and all reactions are interpolated
+at once for an array of temperatures. The interpolation is linear in x so the
+A*exp(-E/RT) form (n = 0) is exact and only the n*ln T term of the A*T^n form
+has curvature, f''(x) = n/x^2. The error of linear interpolation is bounded by
+    |error in ln K| <= h^2/8 * max|f''| = h^2/8 * |n| * Tmax^2
+where h is the grid spacing, so the grid is sized from the requested relative
+error of K. Temperatures outside the table are evaluated exactly.
+
+Example:
+    tab = table(net['A'], net['E'], net['n'], Tmin=300, Tmax=1100)
+    K = lookup(tab, T)
+"""
+
+# use Python 3 print function and division
+from __future__ import print_function
+from __future__ import division
+
+# Modules
+# -----------------------------------------------------------------------------
+
+import numpy as np
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def table(A, E, n=0, R=1.987, Tmin=300, Tmax=1500, rtol=1e-6):
+    """
+    Tabulate the logarithm of the rate constants on a uniform grid of 1/T.
+
+    Example:
+        tab = table([4e13, 1.8], [45000, 10000], [0, 1])
+    Inputs:
+        A = pre-exponential factors, scalar or vector, 1/s
+        E = activation energies, scalar or vector, same energy units as R
+        n = temperature exponents, scalar or vector, 0 for A*exp and 1 for
+            A*T*exp, (-)
+        R = gas constant, default is 1.987 kcal/kmol*K
+        Tmin = lowest temperature in the table, K
+        Tmax = highest temperature in the table, K
+        rtol = guaranteed relative error of the interpolated rate constants
+    Output:
+        tab = dictionary of the table where lnK has rows = reactions and
+              columns = grid points, and err is the error bound of each
+              reaction as a relative error of K
+    """
+    A, E, n = np.broadcast_arrays(np.atleast_1d(np.asarray(A, dtype=float)),
+                                  np.asarray(E, dtype=float),
+                                  np.asarray(n, dtype=float))
+    x0, x1 = 1/Tmax, 1/Tmin
+
+    # grid spacing for the error bound of ln K, interpolation is exact if n = 0
+    tol = np.log1p(rtol)
+    nmax = np.abs(n).max()
+    if nmax > 0:
+        h = np.sqrt(8*tol / (nmax * Tmax**2))
+        ng = max(int(np.ceil((x1 - x0)/h)) + 1, 2)
+    else:
+        ng = 2
+    x = np.linspace(x0, x1, ng)
+    h = x[1] - x[0]
+
+    lnK = (np.log(A)[:, None] - n[:, None]*np.log(x) - (E/R)[:, None]*x)
+    err = np.expm1(h**2/8 * np.abs(n) * Tmax**2)
+
+    tab = {'A': A.copy(), 'E': E.copy(), 'n': n.copy(), 'R': R,
+           'Tmin': Tmin, 'Tmax': Tmax, 'x0': x0, 'h': h, 'lnK': lnK,
+           'err': err}
+    return tab
+
+
+def exact(tab, T):
+    """
+    Exact rate constants of the tabulated scheme K = A*T^n*exp(-E/RT).
+
+    Example:
+        K = exact(tab, 773)
+    Inputs:
+        tab = table from table()
+        T = temperature as scalar or array, K
+    Output:
+        K = rate constants with rows = reactions and columns = shape of T, 1/s
+    """
+    T = np.asarray(T, dtype=float)
+    shape = (-1,) + (1,)*T.ndim
+    A = tab['A'].reshape(shape)
+    E = tab['E'].reshape(shape)
+    n = tab['n'].reshape(shape)
+    return A * T**n * np.exp(-E / (tab['R'] * T))
+
+
+def lookup(tab, T):
+    """
+    Rate constants of all reactions from the table by linear interpolation of
+    ln K in 1/T, one index and weight is shared by all reactions. Temperatures
+    outside the table are evaluated exactly.
+
+    Example:
+        K = lookup(tab, Tnodes)
+    Inputs:
+        tab = table from table()
+        T = temperature as scalar or array, K
+    Output:
+        K = rate constants with rows = reactions and columns = shape of T, 1/s
+    """
+    T = np.asarray(T, dtype=float)
+    lnK = tab['lnK']
+    ng = lnK.shape[1]
+
+    u = (1/T.ravel() - tab['x0']) / tab['h']
+    inside = (u >= 0) & (u <= ng - 1)
+    i = np.clip(np.floor(u), 0, ng - 2).astype(int)
+    w = np.where(inside, u - i, 0)
+
+    K = np.exp(lnK[:, i]*(1 - w) + lnK[:, i + 1]*w)
+    if not inside.all():
+        K[:, ~inside] = exact(tab, T.ravel()[~inside])
+    return K.reshape((-1,) + T.shape)
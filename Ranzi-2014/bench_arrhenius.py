@@ -0,0 +1,67 @@
+# Compare the tabulated rate constants from arrhenius.py to exact evaluation
+# for the reactions of the Ranzi2013 biomass network and the kn4 scheme of the
+# Papadikis2010 particle model (20 nodes by 2000 time steps)
+
+# use Python 3 print function
+from __future__ import print_function
+from __future__ import division
+
+import time
+import numpy as np
+from arrhenius import table, lookup, exact
+from biomass import BIOMASS
+
+#---- global parameters
+
+Tmin = 300      # lowest temperature in the tables, K
+Tmax = 1100     # highest temperature in the tables, K
+rtol = 1e-6     # relative error of the tables
+
+rng = np.random.RandomState(1)
+T = rng.uniform(Tmin, Tmax, (2000, 20))     # temperatures as time x nodes, K
+
+#---- Ranzi2013 biomass network, A*exp and A*T*exp forms
+
+tab = table(BIOMASS['A'], BIOMASS['E'], BIOMASS['n'], 1.987, Tmin, Tmax, rtol)
+
+t0 = time.time()
+Kx = exact(tab, T)
+tx = time.time() - t0
+
+t0 = time.time()
+Kt = lookup(tab, T)
+tt = time.time() - t0
+
+print('--- Ranzi2013 biomass, {} reactions, {} grid points'.format(
+      len(tab['A']), tab['lnK'].shape[1]))
+print('max relative error = {:.2e}, bound = {:.2e}'.format(
+      np.abs(Kt/Kx - 1).max(), tab['err'].max()))
+print('exact = {:.4f} s, table = {:.4f} s'.format(tx, tt))
+
+#---- kn4 scheme of Papadikis2010, A*exp form with E in kJ/mol
+
+A = [1.3e8, 2e8, 1.08e7, 4.28e6, 1e6, 5.13e6]
+E = [140, 133, 121, 108, 108, 87.9]
+R = 0.008314
+
+tab = table(A, E, 0, R, Tmin, Tmax, rtol)
+
+# rate constants as evaluated in kn4 for each step and node
+t0 = time.time()
+for i in range(T.shape[0]):
+    Ki = [a * np.exp(-e / (R * T[i])) for a, e in zip(A, E)]
+tl = time.time() - t0
+
+t0 = time.time()
+Kt = lookup(tab, T)
+tt = time.time() - t0
+
+print('--- kn4, {} reactions'.format(len(A)))
+print('max relative error = {:.2e}, bound = {:.2e}'.format(
+      np.abs(Kt/exact(tab, T) - 1).max(), tab['err'].max()))
+print('loop = {:.4f} s, table = {:.4f} s'.format(tl, tt))
+
+# outside of the table is exact
+Tout = np.array([250, 1500])
+print('outside table, max difference = {:.2e}'.format(
+      np.abs(lookup(tab, Tout)/exact(tab, Tout) - 1).max()))
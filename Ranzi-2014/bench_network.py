@@ -0,0 +1,122 @@
+"""
+Benchmark the sparse reaction network against the Python loop of the
+hemicellulose scheme in kinetics_HCE.py. Both methods use the explicit Euler
+method so the results should agree to round-off. The exact solution at
+constant temperature shows the error of the explicit Euler method.
+"""
+
+# use Python 3 print function and division
+from __future__ import print_function
+from __future__ import division
+
+import timeit
+import numpy as np
+from network import euler, isothermal, initial
+from schemes import HCE
+
+#---- global parameters
+
+hemi = 0.3      # hemicellulose
+
+R = 1.987       # gas constant, kcal/kmol*K
+T = 773         # temperature, K
+
+dt = 0.001                      # time step, s
+tmax = 1                        # time max, s
+t = np.arange(0, tmax+dt, dt)   # time range, s
+nt = len(t)                     # number of time steps
+
+#---- Python loop from kinetics_HCE.py
+
+def loop():
+    K5 = 0.33e10 * np.exp(-31000 / (R * T))
+    K6 = 1e9 * np.exp(-32000 / (R * T))
+    K7 = 0.05 * T * np.exp(-8000 / (R * T))
+    K8 = 0.9 * np.exp(-11000 / (R * T))
+    K9 = 0.33e10 * np.exp(-33000 / (R * T))
+
+    sp = np.zeros((56, nt))
+    sp[0, 0] = hemi
+
+    for i in range(1, nt):
+        sp[0, i] = sp[0, i-1] - K5*sp[0, i-1]*dt                                    # HCE
+        sp[1, i] = sp[1, i-1] + K5*sp[0, i-1]*dt*0.4 - (K6+K7+K8)*sp[1, i-1]*dt     # HCE1
+        sp[2, i] = sp[2, i-1] + K5*sp[0, i-1]*dt*0.6 - K9*sp[2, i-1]*dt             # HCE2
+        sp[3, i] = sp[3, i-1] + K6*sp[1, i-1]*dt                                    # G2
+        sp[4, i] = sp[4, i-1] + K6*sp[1, i-1]*dt*0.025                              # H2O
+        sp[5, i] = sp[5, i-1] + K6*sp[1, i-1]*dt*0.5                                # CO2
+        sp[6, i] = sp[6, i-1] + K6*sp[1, i-1]*dt*0.025                              # HCOOH
+        sp[7, i] = sp[7, i-1] + K6*sp[1, i-1]*dt*0.5                                # CO
+        sp[8, i] = sp[8, i-1] + K6*sp[1, i-1]*dt*0.8                                # CH2O
+        sp[9, i] = sp[9, i-1] + K6*sp[1, i-1]*dt*0.125                              # C2H5OH
+        sp[10, i] = sp[10, i-1] + K6*sp[1, i-1]*dt*0.1                              # CH3OH
+        sp[11, i] = sp[11, i-1] + K6*sp[1, i-1]*dt*0.25                             # C2H4
+        sp[12, i] = sp[12, i-1] + K6*sp[1, i-1]*dt*0.125                            # GH2
+        sp[13, i] = sp[13, i-1] + K6*sp[1, i-1]*dt*0.275                            # GCO2
+        sp[14, i] = sp[14, i-1] + K6*sp[1, i-1]*dt*0.4                              # GCOH2
+        sp[15, i] = sp[15, i-1] + K6*sp[1, i-1]*dt*0.45                             # GCH3OH
+        sp[16, i] = sp[16, i-1] + K6*sp[1, i-1]*dt*0.325                            # GCH4
+        sp[17, i] = sp[17, i-1] + K6*sp[1, i-1]*dt*0.875                            # Char
+        sp[18, i] = sp[18, i-1] + K7*sp[1, i-1]*dt                                  # G3
+        sp[19, i] = sp[19, i-1] + K7*sp[1, i-1]*dt*0.25                             # H2O
+        sp[20, i] = sp[20, i-1] + K7*sp[1, i-1]*dt*0.5                              # CO2
+        sp[21, i] = sp[21, i-1] + K7*sp[1, i-1]*dt*0.05                             # HCOOH
+        sp[22, i] = sp[22, i-1] + K7*sp[1, i-1]*dt*0.3                              # CO
+        sp[23, i] = sp[23, i-1] + K7*sp[1, i-1]*dt*0.15                             # GCO
+        sp[24, i] = sp[24, i-1] + K7*sp[1, i-1]*dt*0.25                             # GCO2
+        sp[25, i] = sp[25, i-1] + K7*sp[1, i-1]*dt*1.7                              # GCOH2
+        sp[26, i] = sp[26, i-1] + K7*sp[1, i-1]*dt*0.625                            # GCH4
+        sp[27, i] = sp[27, i-1] + K7*sp[1, i-1]*dt*0.375                            # GC2H4
+        sp[28, i] = sp[28, i-1] + K7*sp[1, i-1]*dt*0.675                            # Char
+        sp[29, i] = sp[29, i-1] + K8*sp[1, i-1]*dt                                  # XYLAN
+        sp[30, i] = sp[30, i-1] + K9*sp[2, i-1]*dt                                  # G4
+        sp[31, i] = sp[31, i-1] + K9*sp[2, i-1]*dt*0.2                              # H2O
+        sp[32, i] = sp[32, i-1] + K9*sp[2, i-1]*dt*0.175                            # CO
+        sp[33, i] = sp[33, i-1] + K9*sp[2, i-1]*dt*0.275                            # CO2
+        sp[34, i] = sp[34, i-1] + K9*sp[2, i-1]*dt*0.5                              # CH2O
+        sp[35, i] = sp[35, i-1] + K9*sp[2, i-1]*dt*0.1                              # C2H5OH
+        sp[36, i] = sp[36, i-1] + K9*sp[2, i-1]*dt*0.2                              # HAA
+        sp[37, i] = sp[37, i-1] + K9*sp[2, i-1]*dt*0.025                            # HCOOH
+        sp[38, i] = sp[38, i-1] + K9*sp[2, i-1]*dt*0.25                             # GCH4
+        sp[39, i] = sp[39, i-1] + K9*sp[2, i-1]*dt*0.3                              # GCH3OH
+        sp[40, i] = sp[40, i-1] + K9*sp[2, i-1]*dt*0.275                            # GC2H4
+        sp[41, i] = sp[41, i-1] + K9*sp[2, i-1]*dt*0.4                              # GCO2
+        sp[42, i] = sp[42, i-1] + K9*sp[2, i-1]*dt*0.925                            # GCOH2
+        sp[43, i] = sp[43, i-1] + K9*sp[2, i-1]*dt                                  # Char
+        sp[44, i] = sp[4, i] + sp[19, i] + sp[31, i]                                # H2O all
+        sp[45, i] = sp[5, i] + sp[20, i] + sp[33, i]                                # CO2 all
+        sp[46, i] = sp[6, i] + sp[21, i] + sp[37, i]                                # HCOOH all
+        sp[47, i] = sp[7, i] + sp[22, i] + sp[32, i]                                # CO all
+        sp[48, i] = sp[8, i] + sp[34, i]                                            # CH2O all
+        sp[49, i] = sp[9, i] + sp[35, i]                                            # C2H5OH all
+        sp[50, i] = sp[13, i] + sp[24, i] + sp[41, i]                               # GCO2 all
+        sp[51, i] = sp[14, i] + sp[25, i] + sp[42, i]                               # GCOH2 all
+        sp[52, i] = sp[15, i] + sp[39, i]                                           # GCH3OH all
+        sp[53, i] = sp[16, i] + sp[26, i] + sp[38, i]                               # GCH4 all
+        sp[54, i] = sp[17, i] + sp[28, i] + sp[43, i]                               # Char all
+        sp[55, i] = sp[27, i] + sp[40, i]                                           # GC2H4 all
+
+    return sp
+
+#---- sparse reaction network
+
+def sparse():
+    return euler(HCE, T, t, initial(HCE, HCE=hemi))
+
+#---- exact solution at constant temperature
+
+def exact():
+    return isothermal(HCE, T, t, initial(HCE, HCE=hemi))
+
+#---- compare results and evaluation time
+
+n = 10
+tloop = timeit.timeit(loop, number=n) / n
+tsparse = timeit.timeit(sparse, number=n) / n
+texact = timeit.timeit(exact, number=n) / n
+
+print('max difference =', np.abs(loop() - sparse()).max())
+print('Euler error    =', np.abs(exact() - sparse()).max())
+print('Python loop    = {:.4f} s'.format(tloop))
+print('sparse network = {:.4f} s, speedup = {:.1f}x'.format(tsparse, tloop / tsparse))
+print('exact solution = {:.4f} s, speedup = {:.1f}x'.format(texact, tloop / texact))
@@ -0,0 +1,149 @@
+"""
+Biomass kinetics from the Ranzi2013 paper as the superposition of the
+cellulose, hemicellulose, and lignin (LIG-C, LIG-H, LIG-O) components. The five
+component networks are assembled into one block-diagonal network, BIOMASS,
+where the species are named as component.species such as CELL.Char_1.
+
+The components do not interact and the networks are linear so each component
+is solved once per temperature history for a unit mass of the component. The
+species for any biomass composition, SPECIES, are the unit responses summed
+over the components with the mass fraction of each component, so thousands of
+compositions cost about the same as one.
+
+Example:
+    U = unit(773, t)
+    X = composition([0.5, 0.4], [0.3, 0.3], [0.2, 0.3], [0.3, 0.4, 0.3])
+    sp = superpose(U, X)
+    m = residue(U, X)
+"""
+
+# use Python 3 print function and division
+from __future__ import print_function
+from __future__ import division
+
+# Modules
+# -----------------------------------------------------------------------------
+
+import numpy as np
+from network import combine, initial, isothermal, solve
+from schemes import CELL, HCE, LIG_C, LIG_H, LIG_O, MW
+
+# Biomass network
+# -----------------------------------------------------------------------------
+
+COMPONENTS = ['CELL', 'HCE', 'LIG-C', 'LIG-H', 'LIG-O']
+NETS = [CELL, HCE, LIG_C, LIG_H, LIG_O]
+
+BIOMASS = combine(NETS, COMPONENTS)
+
+# species of the whole biomass as the species names without the component,
+# such as CO2 from CELL.CO2, LIG-H.CO2, and LIG-O.CO2, then the lumped species
+_names = [sp.split('.', 1)[1] for sp in BIOMASS['species'] + BIOMASS['lumped']]
+SPECIES = sorted(set(_names), key=_names.index)
+_rows = np.array([SPECIES.index(sp) for sp in _names])
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def composition(cell, hemi, lig, split):
+    """
+    Mass fractions of the five components from the cellulose, hemicellulose,
+    and lignin content where the lignin is split into LIG-C, LIG-H, and LIG-O.
+
+    Example:
+        X = composition(0.5, 0.3, 0.2, [0.3, 0.4, 0.3])
+    Inputs:
+        cell = cellulose mass fraction, scalar or array, (-)
+        hemi = hemicellulose mass fraction, scalar or array, (-)
+        lig = lignin mass fraction, scalar or array, (-)
+        split = fractions of LIG-C, LIG-H, LIG-O in the lignin, columns = 3
+    Output:
+        X = mass fractions, rows = compositions, columns = COMPONENTS
+    """
+    cell = np.atleast_1d(cell).astype(float)
+    hemi = np.atleast_1d(hemi).astype(float)
+    lig = np.atleast_1d(lig).astype(float)
+    split = np.atleast_2d(split).astype(float)
+    X = np.column_stack(np.broadcast_arrays(cell, hemi, lig*split[:, 0],
+                                            lig*split[:, 1], lig*split[:, 2]))
+    return X
+
+
+def unit(T, t, **kwargs):
+    """
+    Species of the biomass network for a unit mass (1 kg) of each component.
+    Each component is solved once, exactly for a constant temperature and with
+    a stiff solver for a temperature history, see isothermal() and solve().
+
+    Example:
+        U = unit(773, t)
+        U = unit([ramp(5), ramp(10)], t)
+    Inputs:
+        T = temperature as constant, function T(t), or list of functions, K
+        t = time vector, s
+        kwargs = options for the stiff solver, see solve()
+    Output:
+        U = species of BIOMASS for a unit mass of each component, rows =
+            species then lumped species, columns = time, kmol/kg
+    """
+    species, lumped = [], []
+    for name, net in zip(COMPONENTS, NETS):
+        y0 = initial(net, **{name: 1/MW[name]})
+        if callable(T) or isinstance(T, (list, tuple)):
+            sp = solve(net, T, t, y0, **kwargs)
+        else:
+            sp = isothermal(net, T, t, y0)
+        ns = len(net['species'])
+        species.append(sp[:ns])
+        lumped.append(sp[ns:])
+    U = np.concatenate(species + lumped)
+    return U
+
+
+def superpose(U, X):
+    """
+    Species of the whole biomass for each composition from the unit responses
+    of the components. The unit responses are gathered by species name then
+    summed over the components with the mass fractions, so the only large
+    array is the result.
+
+    Example:
+        sp = superpose(U, X)
+    Inputs:
+        U = unit responses from unit()
+        X = mass fractions, rows = compositions, columns = COMPONENTS
+    Output:
+        sp = species of SPECIES for each composition, first axis =
+             compositions then SPECIES then the time and batch axes of U,
+             kmol/kg of biomass
+    """
+    blocks = np.concatenate((BIOMASS['block'], BIOMASS['lblock']))
+    Uc = np.zeros((len(COMPONENTS), len(SPECIES)) + U.shape[1:])
+    Uc[blocks, _rows] = U
+    sp = np.tensordot(np.atleast_2d(X), Uc, axes=1)
+    return sp
+
+
+def residue(U, X):
+    """
+    Residual solid mass fraction of the biomass for each composition. Only the
+    residue of each component is scaled so the cost is one small matrix
+    product for any number of compositions.
+
+    Example:
+        m = residue(U, X)
+    Inputs:
+        U = unit responses from unit()
+        X = mass fractions, rows = compositions, columns = COMPONENTS
+    Output:
+        m = residual solid mass fraction, rows = compositions, then the time
+            and batch axes of U, (-)
+    """
+    ns = len(BIOMASS['species'])
+    wy = BIOMASS['w'].reshape((ns,) + (1,)*(U.ndim-1)) * U[:ns]
+
+    # residual mass of a unit mass of each component
+    mc = np.array([wy[BIOMASS['block'] == k].sum(axis=0)
+                   for k in range(len(COMPONENTS))])
+    m = np.tensordot(np.atleast_2d(X), mc, axes=1)
+    return m
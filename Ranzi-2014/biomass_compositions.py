@@ -0,0 +1,50 @@
+# Residual solid mass of biomass from the Ranzi2013 components for many
+# compositions at the pyrolysis temperature, each component is solved once and
+# the compositions are a superposition of the unit responses
+
+# use Python 3 print function
+from __future__ import print_function
+from __future__ import division
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+from biomass import composition, unit, superpose, residue, SPECIES
+
+#---- global parameters
+
+T = 773                     # temperature for rate constants, K
+t = np.linspace(0, 30, 301) # time range, s
+nc = 2000                   # number of random compositions
+
+#---- compositions as cellulose, hemicellulose, lignin with lignin split
+
+rng = np.random.RandomState(1)
+chl = rng.dirichlet([5, 3, 2], nc)
+X = composition(chl[:, 0], chl[:, 1], chl[:, 2], [0.3, 0.4, 0.3])
+
+#---- unit responses then superposition
+
+t0 = time.time()
+U = unit(T, t)
+m = residue(U, X)
+print('unit responses and {} compositions = {:.4f} s'.format(nc, time.time()-t0))
+
+# species of one composition, such as 50% cellulose, 30% hemi, 20% lignin
+sp = superpose(U, composition(0.5, 0.3, 0.2, [0.3, 0.4, 0.3]))[0]
+char = [k for k, name in enumerate(SPECIES) if 'Char' in name and 'all' not in name]
+print('char at {} s = {:.4f} kmol/kg'.format(t[-1], sp[char, -1].sum()))
+
+#---- plot
+
+py.figure()
+py.plot(t, m[:200].T, '-', color='0.7')
+py.plot(t, residue(U, composition(0.5, 0.3, 0.2, [0.3, 0.4, 0.3]))[0], '-r',
+        lw=2, label='50/30/20')
+py.xlabel('Time (s)')
+py.ylabel('Residual solid mass (-)')
+py.title('Biomass compositions at T = {} K'.format(T))
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
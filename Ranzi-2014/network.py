@@ -0,0 +1,574 @@
+"""
+Functions for a sparse stoichiometric reaction network of first-order kinetic
+schemes such as the Ranzi2013 cellulose, hemicellulose, and lignin schemes.
+
+A network is declared with the names of the species, the reactions, and the
+lumped species. Each reaction is first order in a single reactant with a rate
+constant K = A * T^n * exp(-E / (R*T)) and stoichiometric yields of the
+products. The declaration is compiled to a sparse stoichiometry matrix S and a
+sparse reactant matrix P so that the rate of change of the species is
+    dy/dt = S * (K * (P * y))
+which is a couple of matrix-vector products for each time step.
+
+Example of a declaration:
+    net = network(['A', 'B', 'C'],
+                  [('A', 1e10, 30000, 0, {'B': 0.4, 'C': 0.6})],
+                  [('BC', ['B', 'C'])])
+"""
+
+# use Python 3 print function and division
+from __future__ import print_function
+from __future__ import division
+
+# Modules
+# -----------------------------------------------------------------------------
+
+import numpy as np
+import scipy.sparse as sps
+import scipy.linalg as spl
+from scipy.integrate import solve_ivp
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def network(species, reactions, lumps=None, solids=None):
+    """
+    Compile a declaration of a first-order reaction network to sparse matrices.
+
+    Example:
+        net = network(species, reactions, lumps)
+    Inputs:
+        species = list of species names, order is the row order of the results
+        reactions = list of reactions as (reactant, A, E, n, yields) where
+                    A = pre-exponential factor, 1/s
+                    E = activation energy, kcal/kmol
+                    n = temperature exponent, 1 for the A*T*exp(-E/RT) forms
+                    yields = dictionary of product: stoichiometric yield
+        lumps = list of lumped species as (name, list of species names)
+        solids = dictionary of solid species name: molecular weight, kg/kmol
+    Output:
+        net = dictionary of the compiled network where
+              S = stoichiometry matrix, rows = species, columns = reactions
+              P = reactant matrix, rows = reactions, columns = species
+              L = lumping matrix, rows = lumped species, columns = species
+              A, E, n = arrays of the Arrhenius parameters for each reaction
+              w = molecular weight of the solid species, zero for the others
+    """
+    index = dict((sp, k) for k, sp in enumerate(species))
+    if len(index) != len(species):
+        raise ValueError('species names must be unique')
+
+    ns = len(species)
+    nr = len(reactions)
+
+    srow, scol, sval = [], [], []
+    A = np.zeros(nr)
+    E = np.zeros(nr)
+    n = np.zeros(nr)
+    reactants = []
+
+    for j, (reactant, Aj, Ej, nj, yields) in enumerate(reactions):
+        A[j], E[j], n[j] = Aj, Ej, nj
+        reactants.append(index[reactant])
+        srow.append(index[reactant])
+        scol.append(j)
+        sval.append(-1.0)
+        for product in yields:
+            srow.append(index[product])
+            scol.append(j)
+            sval.append(yields[product])
+
+    # duplicate entries are summed when converted to csr format
+    S = sps.coo_matrix((sval, (srow, scol)), shape=(ns, nr)).tocsr()
+    P = sps.coo_matrix((np.ones(nr), (np.arange(nr), reactants)), shape=(nr, ns)).tocsr()
+
+    lumps = lumps or []
+    lumped = [name for name, members in lumps]
+    lrow, lcol = [], []
+    for k, (name, members) in enumerate(lumps):
+        for sp in members:
+            lrow.append(k)
+            lcol.append(index[sp])
+    L = sps.coo_matrix((np.ones(len(lrow)), (lrow, lcol)), shape=(len(lumped), ns)).tocsr()
+
+    solids = solids or {}
+    w = np.zeros(ns)
+    for sp in solids:
+        w[index[sp]] = solids[sp]
+
+    net = {'species': list(species), 'lumped': lumped, 'index': index,
+           'S': S, 'P': P, 'L': L, 'A': A, 'E': E, 'n': n, 'w': w}
+    return net
+
+
+def combine(nets, names):
+    """
+    Combine several networks into one block-diagonal network, such as the
+    cellulose, hemicellulose, and lignin components of biomass. The names of
+    the species and lumped species are prefixed with the name of the network
+    as name.species so species of different networks are kept separate.
+
+    Example:
+        net = combine([CELL, HCE], ['CELL', 'HCE'])
+        net['species'][0]
+        'CELL.CELL'
+    Inputs:
+        nets = list of compiled networks from network()
+        names = list of names for each network
+    Output:
+        net = compiled network where block and lblock are the index of the
+              network for each species and each lumped species
+    """
+    species, lumped, block, lblock = [], [], [], []
+    for k, (sub, name) in enumerate(zip(nets, names)):
+        species += [name + '.' + sp for sp in sub['species']]
+        lumped += [name + '.' + sp for sp in sub['lumped']]
+        block += [k]*len(sub['species'])
+        lblock += [k]*len(sub['lumped'])
+
+    net = {'species': species, 'lumped': lumped,
+           'index': dict((sp, k) for k, sp in enumerate(species)),
+           'S': sps.block_diag([sub['S'] for sub in nets], format='csr'),
+           'P': sps.block_diag([sub['P'] for sub in nets], format='csr'),
+           'L': sps.block_diag([sub['L'] for sub in nets], format='csr'),
+           'A': np.concatenate([sub['A'] for sub in nets]),
+           'E': np.concatenate([sub['E'] for sub in nets]),
+           'n': np.concatenate([sub['n'] for sub in nets]),
+           'w': np.concatenate([sub['w'] for sub in nets]),
+           'blocks': list(names), 'block': np.array(block),
+           'lblock': np.array(lblock, dtype=int)}
+    return net
+
+
+def rate_constants(net, T, R=1.987):
+    """
+    Reaction rate constants from the Arrhenius equation K = A*T^n*exp(-E/RT).
+
+    Example:
+        K = rate_constants(net, 773)
+    Inputs:
+        net = compiled network from network()
+        T = temperature as scalar or array, K
+        R = gas constant, kcal/kmol*K
+    Output:
+        K = rate constants with rows = reactions and columns = shape of T, 1/s
+    """
+    T = np.asarray(T, dtype=float)
+    shape = (-1,) + (1,)*T.ndim
+    A = net['A'].reshape(shape)
+    E = net['E'].reshape(shape)
+    n = net['n'].reshape(shape)
+    K = A * T**n * np.exp(-E / (R * T))
+    return K
+
+
+def rate_matrix(net, K):
+    """
+    Sparse rate matrix M = S * diag(K) * P of the network for one set of rate
+    constants so that dy/dt = M * y.
+
+    Example:
+        M = rate_matrix(net, rate_constants(net, 773))
+    Inputs:
+        net = compiled network from network()
+        K = rate constant for each reaction, 1/s
+    Output:
+        M = rate matrix, rows and columns = species, 1/s
+    """
+    M = net['S'].dot(sps.diags(np.ravel(K))).dot(net['P'])
+    return M.tocsr()
+
+
+def rates(net, K, y):
+    """
+    Rate of change of each species dy/dt = S * (K * (P * y)).
+
+    Example:
+        dydt = rates(net, K, y)
+    Inputs:
+        net = compiled network from network()
+        K = rate constants, rows = reactions and columns broadcast with y
+        y = amount of each species, rows = species
+    Output:
+        dydt = rate of change of each species, rows = species
+    """
+    return net['S'].dot(K * net['P'].dot(y))
+
+
+def lump(net, y):
+    """
+    Lumped species as sums of the species, such as H2O all = H2O_1 + H2O_2.
+
+    Example:
+        ylump = lump(net, y)
+    Inputs:
+        net = compiled network from network()
+        y = amount of each species, rows = species
+    Output:
+        ylump = amount of each lumped species, rows = lumped species
+    """
+    shape = y.shape
+    ylump = net['L'].dot(y.reshape(shape[0], -1))
+    return ylump.reshape((-1,) + shape[1:])
+
+
+def output(net, y, view=False):
+    """
+    Results of the network from the primary species. The lumped species are
+    appended as the last rows of the species array or, for a view, evaluated
+    only when requested by name.
+
+    Example:
+        sp = output(net, y)
+        res = output(net, y, view=True)
+        res['CO2_all']
+    Inputs:
+        net = compiled network from network()
+        y = amount of each species, rows = species
+        view = return a Result view instead of the species array
+    Output:
+        sp = species array, rows = species then lumped species, or a Result
+    """
+    if view:
+        return Result(net, y)
+    return np.concatenate((y, lump(net, y)))
+
+
+def euler(net, T, t, y0, view=False):
+    """
+    Integrate the network at constant temperature with the explicit Euler
+    method. Returns the species array like the kinetics_*.py scripts where the
+    lumped species are appended as the last rows.
+
+    Example:
+        sp = euler(net, 773, t, y0)
+    Inputs:
+        net = compiled network from network()
+        T = temperature, K
+        t = time vector with uniform time step, s
+        y0 = initial amount of each species, rows = species
+        view = return a Result view of the primary species, see output()
+    Output:
+        sp = species array, rows = species then lumped species, columns = time
+    """
+    y0 = np.asarray(y0, dtype=float)
+    dt = t[1] - t[0]
+    nt = len(t)
+    ns = len(net['species'])
+
+    # step matrix of the explicit Euler method y[i] = (I + dt*M) * y[i-1]
+    G = sps.identity(ns, format='csr') + dt*rate_matrix(net, rate_constants(net, T))
+
+    y = np.zeros((ns, nt) + y0.shape[1:])
+    y[:, 0] = y0
+    for i in range(1, nt):
+        y[:, i] = G.dot(y[:, i-1])
+
+    return output(net, y, view)
+
+
+def isothermal(net, T, t, y0, R=1.987, view=False):
+    """
+    Exact solution of the network at constant temperature for any set of times.
+    The species are split into the reactants, which are consumed by at least
+    one reaction, and the products. The rate matrix of the reactants is
+    diagonalized once so for all the times
+        ya(t) = V * exp(lam*t) * V^-1 * ya(0)
+        yp(t) = yp(0) + Mpa * V * (exp(lam*t) - 1)/lam * V^-1 * ya(0)
+    If the eigenvectors are ill-conditioned, such as for reactants with equal
+    rate constants, the matrix exponential is evaluated for each time instead.
+    Returns the species array like euler() where the lumped species are
+    appended as the last rows.
+
+    Example:
+        sp = isothermal(net, 773, t, y0)
+    Inputs:
+        net = compiled network from network()
+        T = temperature, K
+        t = vector of times in any order, s
+        y0 = initial amount of each species, rows = species
+        R = gas constant, kcal/kmol*K
+        view = return a Result view of the primary species, see output()
+    Output:
+        sp = species array, rows = species then lumped species, columns = time
+    """
+    y0 = np.asarray(y0, dtype=float)
+    t = np.asarray(t, dtype=float)
+    ns = len(net['species'])
+    M = rate_matrix(net, rate_constants(net, T, R)).toarray()
+
+    # initial amounts as columns of cases
+    y0c = y0.reshape(ns, -1)
+    y = np.zeros((ns, len(t), y0c.shape[1]))
+
+    a = np.flatnonzero(np.diag(M) < 0)      # reactants
+    p = np.flatnonzero(np.diag(M) >= 0)     # products
+    lam, V = np.linalg.eig(M[np.ix_(a, a)])
+
+    if len(a) > 0 and np.linalg.cond(V) < 1e8:
+        c = np.linalg.solve(V, y0c[a])
+        lt = np.multiply.outer(lam, t)
+        ex = np.exp(lt)[:, :, None] * c[:, None, :]
+        phi = (np.expm1(lt) / lam[:, None])[:, :, None] * c[:, None, :]
+        y[a] = np.einsum('ij,jtc->itc', V, ex).real
+        y[p] = y0c[p][:, None, :] + np.einsum('ij,jtc->itc', M[np.ix_(p, a)].dot(V), phi).real
+    else:
+        for k in range(len(t)):
+            y[:, k] = spl.expm(M*t[k]).dot(y0c)
+
+    y = y.reshape((ns, len(t)) + y0.shape[1:])
+    return output(net, y, view)
+
+
+def final(net, T, y0, R=1.987, view=False):
+    """
+    Final yields of the network at constant temperature as time goes to
+    infinity. The reactants, which are consumed by at least one reaction, are
+    fully converted so ya = 0 and the products are
+        yp = yp(0) - Mpa * Maa^-1 * ya(0)
+    which for a single reactant is the split of the branching ratios K/sum(K).
+    One small linear system is solved for each temperature so yield maps over
+    a range of temperatures need no time integration.
+
+    Example:
+        yf = final(net, np.linspace(700, 900), y0)
+    Inputs:
+        net = compiled network from network()
+        T = temperature as scalar or array, K
+        y0 = initial amount of each species, rows = species
+        R = gas constant, kcal/kmol*K
+        view = return a Result view of the primary species, see output()
+    Output:
+        yf = final species, rows = species then lumped species, columns =
+             shape of T then the cases of y0
+    """
+    T = np.asarray(T, dtype=float)
+    y0 = np.asarray(y0, dtype=float)
+    ns = len(net['species'])
+    y0c = y0.reshape(ns, -1)
+
+    # reactants are the species with a reaction in the reactant matrix
+    react = np.asarray(abs(net['P']).sum(axis=0)).ravel() > 0
+    a = np.flatnonzero(react)
+    p = np.flatnonzero(~react)
+
+    # rate matrices of the reactants for each temperature, Maa and Mpa
+    K = rate_constants(net, T.ravel(), R)
+    S = net['S'].toarray()
+    P = net['P'].toarray()[:, a]
+    Maa = np.einsum('ir,rt,rj->tij', S[a], K, P)
+    Mpa = np.einsum('ir,rt,rj->tij', S[p], K, P)
+
+    # integral of the reactants over all time is -Maa^-1 * ya(0)
+    za = np.linalg.solve(Maa, np.broadcast_to(y0c[a], (T.size,) + y0c[a].shape))
+
+    y = np.zeros((ns, T.size, y0c.shape[1]))
+    y[p] = (y0c[p][None] - np.matmul(Mpa, za)).transpose(1, 0, 2)
+
+    y = y.reshape((ns,) + T.shape + y0.shape[1:])
+    return output(net, y, view)
+
+
+def ramp(beta, T0=300, Tmax=None):
+    """
+    Linear heating ramp of a thermogravimetric (TGA) experiment with an
+    optional isothermal hold at the final temperature.
+
+    Example:
+        T = ramp(10, 300, 900)
+        T(60)
+    Inputs:
+        beta = heating rate, K/min
+        T0 = initial temperature, K
+        Tmax = final temperature, K
+    Output:
+        T = function of time in seconds that returns the temperature, K
+    """
+    def T(t):
+        Tt = T0 + beta/60 * np.asarray(t, dtype=float)
+        if Tmax is not None:
+            Tt = np.minimum(Tt, Tmax)
+        return Tt
+    return T
+
+
+def schedule(tp, Tp):
+    """
+    Piecewise linear temperature schedule through the points (tp, Tp). Also
+    used for measured or simulated temperature histories given as arrays.
+    The temperature is held constant outside the range of tp.
+
+    Example:
+        T = schedule([0, 600, 1200], [300, 800, 800])
+    Inputs:
+        tp = times of the schedule in increasing order, s
+        Tp = temperatures of the schedule, K
+    Output:
+        T = function of time in seconds that returns the temperature, K
+    """
+    tp = np.asarray(tp, dtype=float)
+    Tp = np.asarray(Tp, dtype=float)
+
+    def T(t):
+        return np.interp(t, tp, Tp)
+    return T
+
+
+def solve(net, T, t, y0, R=1.987, method='Radau', rtol=1e-6, atol=1e-10,
+          view=False):
+    """
+    Integrate the network for a temperature history T(t) with a stiff solver.
+    The network is linear in the species so the analytic Jacobian is the rate
+    matrix S * diag(K(T(t))) * P. Several temperature histories, such as
+    heating ramps at different rates, are batched into one block-diagonal
+    system and solved in one call. Returns the species array like euler()
+    where the lumped species are appended as the last rows.
+
+    Example:
+        sp = solve(net, ramp(10), t, y0)
+        sp = solve(net, [ramp(5), ramp(10), ramp(20)], t, y0)
+    Inputs:
+        net = compiled network from network()
+        T = function T(t) or list of functions for a batch, K
+        t = time vector, s
+        y0 = initial amount of each species, rows = species
+        R = gas constant, kcal/kmol*K
+        method = stiff method of scipy.integrate.solve_ivp, Radau or BDF
+        rtol, atol = relative and absolute tolerances of the solver
+        view = return a Result view of the primary species, see output()
+    Output:
+        sp = species array, rows = species then lumped species, columns =
+             time, and a third axis for each temperature history of a batch
+    """
+    batch = isinstance(T, (list, tuple))
+    Ts = list(T) if batch else [T]
+    nb = len(Ts)
+    ns = len(net['species'])
+    S, P = net['S'], net['P']
+
+    def temps(tk):
+        return np.array([float(f(tk)) for f in Ts])
+
+    # state vector is the species of each temperature history one after another
+    def fun(tk, y):
+        K = rate_constants(net, temps(tk), R)
+        Y = y.reshape(nb, ns).T
+        return S.dot(K * P.dot(Y)).T.ravel()
+
+    def jac(tk, y):
+        K = rate_constants(net, temps(tk), R)
+        return sps.block_diag([rate_matrix(net, K[:, b]) for b in range(nb)], format='csc')
+
+    y0b = np.tile(np.asarray(y0, dtype=float), nb)
+    sol = solve_ivp(fun, (t[0], t[-1]), y0b, method=method, t_eval=t, jac=jac,
+                    rtol=rtol, atol=atol)
+    if not sol.success:
+        raise RuntimeError(sol.message)
+
+    y = sol.y.reshape(nb, ns, len(t)).transpose(1, 2, 0)
+    if not batch:
+        y = y[:, :, 0]
+    return output(net, y, view)
+
+
+def tga(net, T, t, y0, R=1.987, view=False, **kwargs):
+    """
+    Thermogravimetric curves of the network for a temperature history T(t) or
+    a batch of histories. The residual solid mass is the sum of the solid
+    species times their molecular weight and the derivative thermogravimetric
+    (DTG) curve is evaluated from the reaction rates.
+
+    Example:
+        sp, m, dtg = tga(net, [ramp(5), ramp(10)], t, y0)
+        py.plot(ramp(5)(t), dtg[:, 0]*60)
+    Inputs:
+        net = compiled network from network() with solid species declared
+        T = function T(t) or list of functions for a batch, K
+        t = time vector, s
+        y0 = initial amount of each species, rows = species
+        R = gas constant, kcal/kmol*K
+        view = return a Result view of the primary species, see output()
+        kwargs = options for the solver, see solve()
+    Output:
+        sp = species array, see solve()
+        m = residual solid mass fraction, rows = time, columns = batch, (-)
+        dtg = mass loss rate -dm/dt, rows = time, columns = batch, 1/s
+    """
+    res = solve(net, T, t, y0, R, view=True, **kwargs)
+    w = net['w']
+    y = res.y
+
+    Ts = list(T) if isinstance(T, (list, tuple)) else [T]
+    Tt = np.array([f(t) for f in Ts]).T.reshape(y.shape[1:])
+    K = rate_constants(net, Tt, R)
+
+    # dm/dt = w * S * (K * (P * y)) for every time and temperature history
+    m0 = w.dot(np.asarray(y0, dtype=float))
+    m = np.tensordot(w, y, axes=1) / m0
+    ry = K * np.tensordot(net['P'].toarray(), y, axes=1)
+    dtg = -np.tensordot(net['S'].T.dot(w), ry, axes=1) / m0
+    sp = res if view else res.array()
+    return sp, m, dtg
+
+
+def initial(net, **amounts):
+    """
+    Initial amount of each species where species not given are zero.
+
+    Example:
+        y0 = initial(net, HCE=0.3)
+    Inputs:
+        net = compiled network from network()
+        amounts = species name and initial amount, names with a hyphen can be
+                  given as initial(net, **{'LIG-C': 0.2})
+    Output:
+        y0 = initial amount of each species, rows = species
+    """
+    y0 = np.zeros(len(net['species']))
+    for sp in amounts:
+        y0[net['index'][sp]] = amounts[sp]
+    return y0
+
+
+# Results
+# -----------------------------------------------------------------------------
+
+class Result(object):
+    """
+    Named view of the results of a network where only the primary species are
+    stored. A species or lumped species is addressed by name and a lumped
+    species is summed with its row of the sparse lumping matrix only when it
+    is requested, optionally for a slice of the time axis.
+
+    Example:
+        res = isothermal(net, 773, t, y0, view=True)
+        res['H2O_1']
+        res['CO2_all']
+        res['CO2_all', -1]
+        sp = res.array()
+    """
+
+    def __init__(self, net, y):
+        self.net = net
+        self.y = y
+        self.lindex = dict((sp, k) for k, sp in enumerate(net['lumped']))
+
+    def __getitem__(self, key):
+        name, idx = key if isinstance(key, tuple) else (key, slice(None))
+        if name in self.net['index']:
+            return self.y[self.net['index'][name]][idx]
+        y = self.y[:, idx]
+        row = self.net['L'][self.lindex[name]]
+        return row.dot(y.reshape(y.shape[0], -1)).reshape(y.shape[1:])
+
+    def __contains__(self, name):
+        return name in self.net['index'] or name in self.lindex
+
+    def keys(self):
+        return self.net['species'] + self.net['lumped']
+
+    def array(self):
+        """
+        Species array with the lumped species appended as the last rows.
+        """
+        return np.concatenate((self.y, lump(self.net, self.y)))
@@ -0,0 +1,215 @@
+"""
+Declarations of the cellulose, hemicellulose, and lignin (LIG-C, LIG-H, LIG-O)
+kinetic schemes from Table 1 of the Supplemental Material in the Ranzi2013
+paper. Each scheme is compiled to a sparse reaction network, see network.py.
+
+The species are listed in the same order as the rows of the species array, sp,
+in the kinetics_*.py scripts. Products of a group of reactions are kept as
+separate species with the group number as a suffix, such as H2O_2 for H2O in
+group 2, and the lumped species sum the groups, such as H2O_all.
+
+Example:
+    from schemes import HCE
+    from network import euler, initial
+    sp = euler(HCE, 773, t, initial(HCE, HCE=0.3))
+
+A = pre-exponential factor, 1/s
+E = activation energy, kcal/kmol
+n = temperature exponent, K = A * T^n * exp(-E / (R*T))
+
+The yields are on a molar basis so the solid species are declared with their
+molecular weight for the residual solid mass of a thermogravimetric curve.
+The trapped gases G{..} of the metaplastic phase are part of the solid.
+"""
+
+from network import network
+
+# molecular weight of the solid species, kg/kmol
+MW = {'CELL': 162.14, 'CELLA': 162.14, 'HCE': 132.12, 'HCE1': 132.12,
+      'HCE2': 132.12, 'LIG-C': 258.27, 'LIG-CC': 258.27, 'LIG-H': 436.45,
+      'LIG-O': 422.38, 'LIG-OH': 378.37, 'LIG': 208.21, 'Char': 12.011,
+      'GH2': 2.016, 'GCO': 28.01, 'GCO2': 44.01, 'GCOH2': 30.03,
+      'GCH3OH': 32.04, 'GCH4': 16.04, 'GC2H4': 28.05}
+
+
+def solids(species):
+    """
+    Solid species and molecular weight where the group suffix is ignored, such
+    as Char_2 for Char.
+    """
+    names = [sp for sp in species if sp.split('_')[0] in MW]
+    return dict((sp, MW[sp.split('_')[0]]) for sp in names)
+
+
+# Cellulose
+# -----------------------------------------------------------------------------
+
+CELL_SPECIES = [
+    'CELL', 'G1', 'H2O_1', 'Char_1', 'CELLA', 'LVG', 'G2', 'HAA', 'GLYOX',
+    'C2H4O', 'HMFU', 'C3H6O', 'CO2', 'H2', 'CH2O', 'CO', 'CH4', 'H2O_2',
+    'HCOOH', 'Char_2']
+
+CELL = network(
+    CELL_SPECIES,
+    [
+        # 1) CELL -> CELLA
+        ('CELL', 4e13, 45000, 0, {'CELLA': 1}),
+        # 2) CELLA -> G2
+        ('CELLA', 0.5e9, 29000, 0,
+         {'G2': 1, 'HAA': 0.8, 'GLYOX': 0.2, 'C2H4O': 0.1, 'HMFU': 0.25,
+          'C3H6O': 0.3, 'CO2': 0.21, 'H2': 0.1, 'CH2O': 0.4, 'CO': 0.16,
+          'CH4': 0.1, 'H2O_2': 0.83, 'HCOOH': 0.02, 'Char_2': 0.61}),
+        # 3) CELLA -> LVG
+        ('CELLA', 1.8, 10000, 1, {'LVG': 1}),
+        # 4) CELL -> G1
+        ('CELL', 4e7, 31000, 0, {'G1': 1, 'H2O_1': 5, 'Char_1': 6})
+    ],
+    [
+        ('H2O_all', ['H2O_1', 'H2O_2']),
+        ('Char_all', ['Char_1', 'Char_2'])
+    ],
+    solids=solids(CELL_SPECIES))
+
+# Hemicellulose
+# -----------------------------------------------------------------------------
+
+HCE_SPECIES = [
+    'HCE', 'HCE1', 'HCE2',
+    'G2', 'H2O_2', 'CO2_2', 'HCOOH_2', 'CO_2', 'CH2O_2', 'C2H5OH_2',
+    'CH3OH_2', 'C2H4_2', 'GH2_2', 'GCO2_2', 'GCOH2_2', 'GCH3OH_2', 'GCH4_2',
+    'Char_2',
+    'G3', 'H2O_3', 'CO2_3', 'HCOOH_3', 'CO_3', 'GCO_3', 'GCO2_3', 'GCOH2_3',
+    'GCH4_3', 'GC2H4_3', 'Char_3',
+    'XYLAN',
+    'G4', 'H2O_4', 'CO_4', 'CO2_4', 'CH2O_4', 'C2H5OH_4', 'HAA_4',
+    'HCOOH_4', 'GCH4_4', 'GCH3OH_4', 'GC2H4_4', 'GCO2_4', 'GCOH2_4',
+    'Char_4']
+
+HCE = network(
+    HCE_SPECIES,
+    [
+        # 5) HCE -> HCE1, HCE2
+        ('HCE', 0.33e10, 31000, 0, {'HCE1': 0.4, 'HCE2': 0.6}),
+        # 6) HCE1 -> G2
+        ('HCE1', 1e9, 32000, 0,
+         {'G2': 1, 'H2O_2': 0.025, 'CO2_2': 0.5, 'HCOOH_2': 0.025, 'CO_2': 0.5,
+          'CH2O_2': 0.8, 'C2H5OH_2': 0.125, 'CH3OH_2': 0.1, 'C2H4_2': 0.25,
+          'GH2_2': 0.125, 'GCO2_2': 0.275, 'GCOH2_2': 0.4, 'GCH3OH_2': 0.45,
+          'GCH4_2': 0.325, 'Char_2': 0.875}),
+        # 7) HCE1 -> G3
+        ('HCE1', 0.05, 8000, 1,
+         {'G3': 1, 'H2O_3': 0.25, 'CO2_3': 0.5, 'HCOOH_3': 0.05, 'CO_3': 0.3,
+          'GCO_3': 0.15, 'GCO2_3': 0.25, 'GCOH2_3': 1.7, 'GCH4_3': 0.625,
+          'GC2H4_3': 0.375, 'Char_3': 0.675}),
+        # 8) HCE1 -> XYLAN
+        ('HCE1', 0.9, 11000, 0, {'XYLAN': 1}),
+        # 9) HCE2 -> G4
+        ('HCE2', 0.33e10, 33000, 0,
+         {'G4': 1, 'H2O_4': 0.2, 'CO_4': 0.175, 'CO2_4': 0.275, 'CH2O_4': 0.5,
+          'C2H5OH_4': 0.1, 'HAA_4': 0.2, 'HCOOH_4': 0.025, 'GCH4_4': 0.25,
+          'GCH3OH_4': 0.3, 'GC2H4_4': 0.275, 'GCO2_4': 0.4, 'GCOH2_4': 0.925,
+          'Char_4': 1})
+    ],
+    [
+        ('H2O_all', ['H2O_2', 'H2O_3', 'H2O_4']),
+        ('CO2_all', ['CO2_2', 'CO2_3', 'CO2_4']),
+        ('HCOOH_all', ['HCOOH_2', 'HCOOH_3', 'HCOOH_4']),
+        ('CO_all', ['CO_2', 'CO_3', 'CO_4']),
+        ('CH2O_all', ['CH2O_2', 'CH2O_4']),
+        ('C2H5OH_all', ['C2H5OH_2', 'C2H5OH_4']),
+        ('GCO2_all', ['GCO2_2', 'GCO2_3', 'GCO2_4']),
+        ('GCOH2_all', ['GCOH2_2', 'GCOH2_3', 'GCOH2_4']),
+        ('GCH3OH_all', ['GCH3OH_2', 'GCH3OH_4']),
+        ('GCH4_all', ['GCH4_2', 'GCH4_3', 'GCH4_4']),
+        ('Char_all', ['Char_2', 'Char_3', 'Char_4']),
+        ('GC2H4_all', ['GC2H4_3', 'GC2H4_4'])
+    ],
+    solids=solids(HCE_SPECIES))
+
+# Lignin (LIG-C)
+# -----------------------------------------------------------------------------
+
+LIG_C_SPECIES = [
+    'LIG-C', 'LIG-CC',
+    'COUMARYL_1', 'PHENOL_1', 'C2H4_1', 'H2O_1', 'CH2O_1', 'CO_1', 'GCOH2_1',
+    'GCH4_1', 'Char_1',
+    'COUMARYL_2', 'PHENOL_2', 'HAA_2', 'H2O_2', 'CO_2', 'GCH4_2', 'GC2H4_2',
+    'GCOH2_2', 'GCO_2', 'Char_2']
+
+LIG_C = network(
+    LIG_C_SPECIES,
+    [
+        # 10) LIG-C -> G1
+        ('LIG-C', 1.33e15, 48500, 0,
+         {'LIG-CC': 0.35, 'COUMARYL_1': 0.1, 'PHENOL_1': 0.08, 'C2H4_1': 0.41,
+          'H2O_1': 1, 'CH2O_1': 0.3, 'CO_1': 0.32, 'GCOH2_1': 0.7,
+          'GCH4_1': 0.495, 'Char_1': 5.735}),
+        # 13) LIG-CC -> G2
+        ('LIG-CC', 1.6e6, 31500, 0,
+         {'COUMARYL_2': 0.3, 'PHENOL_2': 0.2, 'HAA_2': 0.35, 'H2O_2': 0.7,
+          'CO_2': 0.4, 'GCH4_2': 0.65, 'GC2H4_2': 0.6, 'GCOH2_2': 1,
+          'GCO_2': 0.4, 'Char_2': 6.75})
+    ],
+    [
+        ('COUMARYL_all', ['COUMARYL_1', 'COUMARYL_2']),
+        ('PHENOL_all', ['PHENOL_1', 'PHENOL_2']),
+        ('H2O_all', ['H2O_1', 'H2O_2']),
+        ('CO_all', ['CO_1', 'CO_2']),
+        ('GCOH2_all', ['GCOH2_1', 'GCOH2_2']),
+        ('GCH4_all', ['GCH4_1', 'GCH4_2']),
+        ('Char_all', ['Char_1', 'Char_2'])
+    ],
+    solids=solids(LIG_C_SPECIES))
+
+# Lignin (LIG-H) and (LIG-O)
+# -----------------------------------------------------------------------------
+
+# reactions 14-18 of LIG-OH and LIG are shared by the LIG-H and LIG-O schemes
+LIG_OH = [
+    # 14) LIG-OH -> G2
+    ('LIG-OH', 0.5e8, 30000, 0,
+     {'LIG': 1, 'GH2': 0.15, 'H2O': 0.9, 'CH4': 0.1, 'CH3OH': 0.5,
+      'GCH3OH': 0.5, 'CO2': 0.05, 'CO': 0.3, 'GCO': 1, 'HCOOH': 0.05,
+      'GCOH2': 0.6, 'GCH4': 0.35, 'GC2H4': 0.2, 'Char': 4.15}),
+    # 15) LIG-OH -> G3
+    ('LIG-OH', 33, 15000, 0,
+     {'GH2': 0.5, 'H2O': 1.5, 'CH4': 0.1, 'GCH3OH': 0.5, 'CO': 0.5,
+      'GCO': 1.6, 'GCOH2': 3.9, 'GCH4': 1.65, 'GC2H4': 0.3, 'Char': 10.15}),
+    # 16) LIG -> FE2MACR
+    ('LIG', 2.4, 12000, 1, {'FE2MACR': 1}),
+    # 17) LIG -> G4
+    ('LIG', 0.4e9, 30000, 0,
+     {'C3H6O': 0.2, 'H2O': 0.95, 'CH4': 0.2, 'CH3OH': 0.4, 'CO': 1,
+      'GCO': 0.45, 'HCOOH': 0.05, 'GCOH2': 0.5, 'GCH4': 0.4, 'GC2H4': 0.65,
+      'Char': 5.5, 'CH2O': 0.2, 'C2H4O': 0.2}),
+    # 18) LIG -> G5
+    ('LIG', 0.083, 8000, 1,
+     {'H2O': 0.6, 'CH4': 0.2, 'GCH3OH': 0.4, 'CO': 0.4, 'GCO': 0.2,
+      'GCOH2': 2, 'GCH4': 0.4, 'GC2H4': 0.5, 'Char': 6, 'CH2O': 0.4})
+]
+
+# FE2MACR is not tracked by the kinetics_LIG_*.py scripts so it is the last
+# row, likewise C3H6O from reaction 17 is the last row of the LIG-O scheme
+LIG_SPECIES = ['LIG', 'GH2', 'H2O', 'CH4', 'CH3OH', 'GCH3OH', 'CO2', 'CO',
+               'GCO', 'HCOOH', 'GCOH2', 'GCH4', 'GC2H4', 'Char', 'CH2O', 'C2H4O',
+               'FE2MACR']
+
+LIG_H_SPECIES = ['LIG-H', 'LIG-OH', 'C3H6O'] + LIG_SPECIES
+
+LIG_H = network(
+    LIG_H_SPECIES,
+    [
+        # 11) LIG-H -> G1
+        ('LIG-H', 0.67e13, 37500, 0, {'LIG-OH': 1, 'C3H6O': 1})
+    ] + LIG_OH,
+    solids=solids(LIG_H_SPECIES))
+
+LIG_O_SPECIES = ['LIG-O', 'LIG-OH', 'GCO2'] + LIG_SPECIES + ['C3H6O']
+
+LIG_O = network(
+    LIG_O_SPECIES,
+    [
+        # 12) LIG-O -> G1
+        ('LIG-O', 0.33e9, 25500, 0, {'LIG-OH': 1, 'GCO2': 1})
+    ] + LIG_OH,
+    solids=solids(LIG_O_SPECIES))
@@ -0,0 +1,52 @@
+# Thermogravimetric (TGA) curves for the Ranzi2013 kinetic schemes
+# plots residual mass and mass loss rate (DTG) as function of temperature, T,
+# for several heating rates solved in one call
+
+# use Python 3 print function
+from __future__ import print_function
+from __future__ import division
+
+import numpy as np
+import matplotlib.pyplot as py
+from network import tga, ramp, initial
+from schemes import CELL, HCE, LIG_C
+
+#---- global parameters
+
+T0 = 300                        # initial temperature, K
+Tmax = 1100                     # final temperature, K
+betas = [5, 10, 20, 50, 100]    # heating rates, K/min
+
+tmax = (Tmax - T0)/min(betas)*60    # time for the slowest ramp, s
+t = np.linspace(0, tmax, 4001)      # time range, s
+
+ramps = [ramp(beta, T0, Tmax) for beta in betas]
+
+#---- TGA curves of each component
+
+for net, name, title in [(CELL, 'CELL', 'Cellulose'),
+                         (HCE, 'HCE', 'Hemicellulose'),
+                         (LIG_C, 'LIG-C', 'Lignin (LIG-C)')]:
+
+    sp, m, dtg = tga(net, ramps, t, initial(net, **{name: 1}))
+
+    py.figure()
+    py.subplot(2, 1, 1)
+    for k, beta in enumerate(betas):
+        py.plot(ramps[k](t), m[:, k], label='{} K/min'.format(beta))
+    py.ylabel('residual mass (-)')
+    py.title(title)
+    py.legend(loc='best', numpoints=1)
+    py.grid()
+
+    py.subplot(2, 1, 2)
+    for k, beta in enumerate(betas):
+        # DTG as mass loss per kelvin so the heating rates are comparable
+        py.plot(ramps[k](t), dtg[:, k]/(beta/60), label='{} K/min'.format(beta))
+    py.xlabel('Temperature (K)')
+    py.ylabel('DTG (1/K)')
+    py.grid()
+
+    print(title, 'final residue', m[-1])
+
+py.show()
@@ -0,0 +1,45 @@
+# Final yields of the Ranzi2013 cellulose scheme as time goes to infinity
+# plots the yield of the main products as a function of temperature, T, from
+# the asymptotic solution of the network without any time integration
+
+# use Python 3 print function
+from __future__ import print_function
+from __future__ import division
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+from network import final, isothermal, initial
+from schemes import CELL
+
+#---- global parameters
+
+T = np.linspace(700, 900, 201)      # temperature range, K
+names = ['LVG', 'HAA', 'HMFU', 'GLYOX', 'CO2', 'Char_all', 'H2O_all']
+
+#---- final yields for all the temperatures
+
+y0 = initial(CELL, CELL=1)
+
+t0 = time.time()
+yf = final(CELL, T, y0)
+print('final yields for {} temperatures = {:.4f} s'.format(len(T), time.time()-t0))
+
+# compare to the exact solution at a long time
+rows = CELL['species'] + CELL['lumped']
+sp = isothermal(CELL, T[0], [1e6], y0)
+print('max difference to t = 1e6 s at {} K = {:.2e}'.format(
+      T[0], np.abs(yf[:, 0] - sp[:, 0]).max()))
+
+#---- plot
+
+py.figure()
+for name in names:
+    py.plot(T, yf[rows.index(name)], label=name)
+py.xlabel('Temperature (K)')
+py.ylabel('Final yield (kmol/kmol CELL)')
+py.title('Cellulose final yields')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
@@ -8,17 +8,26 @@ from __future__ import print_function
 import numpy as np
 import scipy.optimize as opt
 import matplotlib.pyplot as py
+from gas import density, viscosity
+from umf import minfluid
 
 #------------------------------------------------------------------------------
 # parameters
 
-umf = 0.063         # minimum fluidization velocity, m/s
+dp = 0.000207       # particle diameter, m
+rhop = 2500         # particle density, kg/m^3
+T = 300             # gas (air) temperature, K
+P = 101325          # gas (air) pressure, Pa
 dbed = 0.055        # bed diameter, m
 z0 = 0              # position bubbles are generated, m
 z = 0.046           # bed vertical position, m
 
 g = 9.81            # gravity, m/s^2
 
+# minimum fluidization velocity, m/s, the Saxena and Vogel constants give the
+# measured umf = 0.063 m/s of the Jack Halow case
+umf = minfluid(dp, rhop, density(T, P, 'air'), viscosity(T, 'air'), 'saxena')
+
 #------------------------------------------------------------------------------
 # calculations
 
@@ -7,11 +7,20 @@ from __future__ import print_function
 
 # libraries and packages
 import numpy as np
+from gas import density, viscosity
+from umf import minfluid
 
 # -----------------------------------------------------------------------------
 # example parameters
 
-umf = 0.063     # minimum fluidization velocity, m/s
+dp = 0.000207   # particle diameter, m
+rhop = 2500     # particle density, kg/m^3
+T = 300         # gas (air) temperature, K
+P = 101325      # gas (air) pressure, Pa
+
+# minimum fluidization velocity, m/s, the Saxena and Vogel constants give the
+# measured umf = 0.063 m/s of the Jack Halow case
+umf = minfluid(dp, rhop, density(T, P, 'air'), viscosity(T, 'air'), 'saxena')
 u = 3*umf       # gas superficial velocity, m/s
 dd = 0.055      # bed diameter, m
 zst = 0.085     # static bed height, m
@@ -33,7 +42,7 @@ db = dbmax - (dbmax - dbmin)*np.exp(-0.3*(zst/dd))
 
 dbed = 5.5  				  # bed diameter, cm
 areabed = (np.pi*dbed**2)/4.0   # bed area, cm^2
-umfM = 6.3                      # minimum fluidization velocity, cm/s
+umfM = umf*100                  # minimum fluidization velocity, cm/s
 uM = 3*umfM                     # gas superficial velocity, cm/s
 h = 8.5                         # height of bed, cm
 
@@ -10,17 +10,27 @@
 # use Python 3 print function
 from __future__ import print_function
 
+from gas import density, viscosity
+from umf import minfluid
+
 # fluidized bed parameters
 
-umf = 0.063                 # minimum fluidization velocity, m/s
-u = 3.0*umf                 # gas superficial velocity, m/s
 dbed = 0.055                # bed diameter, m
 zmf = 0.085                 # bed height at minimum fluidizaiton, m
 emf = 0.48                  # void fraction at minimum fluidization
 rhop = 2500                 # particle density, kg/m^3
+dp = 0.000207               # particle diameter, m
 
 g = 9.81                    # gravity, m/s^2
-rhog = 1.17                 # gas (air) density, kg/m^3
+T = 300                     # gas temperature, K
+P = 101325                  # gas pressure, Pa
+rhog = density(T, P, 'air') # gas (air) density, kg/m^3
+ug = viscosity(T, 'air')    # gas (air) dynamic viscosity, kg/ms
+
+# minimum fluidization velocity, m/s, the Saxena and Vogel constants give the
+# measured umf = 0.063 m/s of the Jack Halow case
+umf = minfluid(dp, rhop, rhog, ug, 'saxena')
+u = 3.0*umf                 # gas superficial velocity, m/s
 
 #------------------------------------------------------------------------------
 # Expanded bed calculations
@@ -38,6 +48,7 @@ eexp = 1 - (1-emf)/fbexp
 # Print results
 
 print('')
+print('umf (m/s) =', umf)
 print('zmf (m) =', zmf)
 print('emf =', emf)
 print('fbexp = ', fbexp)
@@ -0,0 +1,235 @@
+"""
+Gas properties as functions of temperature and pressure for nitrogen, air,
+steam, and mixtures of them so the fluidization, terminal velocity, and heat
+transfer scripts do not have to use the properties of air at 300 K and 1 atm.
+All functions broadcast over T and P. The gas is a name in GASES or a
+dictionary of mole fractions of the names such as {'N2': 0.5, 'H2O': 0.5}.
+
+    density = ideal gas, rho = P*M/(R*T)
+    viscosity, conductivity = polynomials in t = T/1000 fitted from 300 to
+        1200 K to the 1 atm tables of Incropera and DeWitt for air and N2
+        (cubic, within 0.8 %) and to the dilute gas correlations of IAPWS 2008
+        and 2011 for steam (quartic, within 0.6 %), and mixed with the rules
+        of Wilke and of Mason and Saxena
+    heat capacity = ideal gas Shomate equations of the NIST Webbook, air from
+        its N2, O2, and Ar, steam below 500 K from the JANAF tables, and mixed
+        by mole fraction
+
+The polynomial coefficients are precomputed in GASES so a property is one
+np.polyval of the temperatures. The polynomials are not extrapolated, the
+viscosity and conductivity are NaN outside the fitted range T of each gas.
+
+Example:
+    rhog = density(773, 101325, 'N2')
+    mug = viscosity(np.linspace(300, 1100), 'H2O')
+    p = properties(773, 101325, {'N2': 0.5, 'H2O': 0.5})
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+
+# Parameters
+# -----------------------------------------------------------------------------
+
+R = 8.314462618     # universal gas constant, J/mol*K
+
+# Shomate coefficients A, B, C, D, E of cp in J/mol*K for t = T/1000 as a list
+# of (upper temperature of the range, coefficients), the NIST coefficients of
+# H2O start at 500 K so below 500 K the same form is fitted to the ideal gas cp
+# of the JANAF tables from 298 to 500 K, within 0.01 %
+SHOMATE = {
+    'N2': [(500, [28.98641, 1.853978, -9.647459, 16.63537, 0.000117]),
+           (np.inf, [19.50583, 19.88705, -8.598535, 1.369784, 0.527601])],
+    'O2': [(700, [31.32234, -20.23531, 57.86644, -36.50624, -0.007374]),
+           (np.inf, [30.03235, 8.772972, -3.988133, 0.788313, -0.741599])],
+    'Ar': [(np.inf, [20.786, 0, 0, 0, 0])],
+    'H2O': [(500, [33.40460, -3.854630, 14.99492, 0, 0]),
+            (np.inf, [30.09200, 6.832514, 6.793435, -2.534480, 0.082139])]}
+
+# M = molar mass, kg/mol
+# T = range of temperatures of the fits of mu and k, K
+# mu = viscosity polynomial in t = T/1000, micro Pa*s
+# k = conductivity polynomial in t = T/1000, mW/m*K
+# cp = mole fractions of the species of SHOMATE
+GASES = {
+    'N2': {'M': 0.028014, 'T': (300, 1200),
+           'mu': [8.87087, -31.6204, 60.3327, 2.3703],
+           'k': [13.6491, -42.4176, 91.4976, 1.9491],
+           'cp': {'N2': 1.0}},
+    'air': {'M': 0.028964, 'T': (300, 1200),
+            'mu': [7.87288, -30.3628, 62.648, 2.25534],
+            'k': [27.5482, -79.899, 123.567, -4.51257],
+            'cp': {'N2': 0.7808, 'O2': 0.2095, 'Ar': 0.0097}},
+    'H2O': {'M': 0.018015, 'T': (300, 1200),
+            'mu': [12.1205, -44.3507, 55.6548, 11.9739, 2.20863],
+            'k': [15.1516, -70.8036, 141.014, 4.02271, 6.41753],
+            'cp': {'H2O': 1.0}}}
+GASES['steam'] = GASES['H2O']
+
+# Pure gases
+# -----------------------------------------------------------------------------
+
+def _shomate(T, name):
+    """
+    Heat capacity of a species of SHOMATE, J/mol*K.
+    """
+    t = np.asarray(T, dtype=float)/1000
+    cp = np.zeros(t.shape)
+    lo = 0
+    for hi, (A, B, C, D, E) in SHOMATE[name]:
+        cp = np.where((t*1000 > lo) & (t*1000 <= hi),
+                      A + B*t + C*t**2 + D*t**3 + E/t**2, cp)
+        lo = hi
+    return cp
+
+
+def _pure(T, name):
+    """
+    Viscosity, kg/m*s, conductivity, W/m*K, and molar heat capacity, J/mol*K,
+    of a gas of GASES. Viscosity and conductivity are NaN outside the range of
+    their fits.
+    """
+    gas = GASES[name]
+    t = np.asarray(T, dtype=float)/1000
+    Tmin, Tmax = gas['T']
+    fit = np.where((t*1000 >= Tmin) & (t*1000 <= Tmax), 1.0, np.nan)
+    mu = 1e-6*np.polyval(gas['mu'], t)*fit
+    k = 1e-3*np.polyval(gas['k'], t)*fit
+    cp = sum(y*_shomate(T, s) for s, y in gas['cp'].items())
+    return mu, k, cp
+
+
+def _fractions(gas):
+    """
+    Mole fractions of a gas as a dictionary of names of GASES.
+    """
+    if isinstance(gas, str):
+        return {gas: 1.0}
+    total = sum(gas.values())
+    return dict((name, y/total) for name, y in gas.items())
+
+# Properties
+# -----------------------------------------------------------------------------
+
+def molar_mass(gas='air'):
+    """
+    Molar mass of a gas or mixture, kg/mol.
+
+    Example:
+        M = molar_mass({'N2': 0.5, 'H2O': 0.5})
+    """
+    return sum(y*GASES[name]['M'] for name, y in _fractions(gas).items())
+
+
+def density(T, P=101325, gas='air'):
+    """
+    Ideal gas density, kg/m^3.
+
+    Example:
+        rhog = density(773, 101325, 'N2')
+    Inputs:
+        T = temperature, K
+        P = pressure, Pa
+        gas = name in GASES or dictionary of mole fractions
+    Output:
+        rhog = density of gas, kg/m^3
+    """
+    T = np.asarray(T, dtype=float)
+    return np.asarray(P, dtype=float)*molar_mass(gas)/(R*T)
+
+
+def _wilke(T, fr, prop):
+    """
+    Mixture value of viscosity or conductivity by the rule of Wilke, which is
+    the rule of Mason and Saxena for the conductivity.
+    """
+    names = list(fr)
+    mus = [_pure(T, n)[0] for n in names]
+    vals = [_pure(T, n)[prop] for n in names]
+    Ms = [GASES[n]['M'] for n in names]
+    mix = 0
+    for i in range(len(names)):
+        den = 0
+        for j in range(len(names)):
+            phi = ((1 + (mus[i]/mus[j])**0.5*(Ms[j]/Ms[i])**0.25)**2
+                   / (8*(1 + Ms[i]/Ms[j]))**0.5)
+            den = den + fr[names[j]]*phi
+        mix = mix + fr[names[i]]*vals[i]/den
+    return mix
+
+
+def viscosity(T, gas='air'):
+    """
+    Dynamic viscosity of a gas or mixture, kg/m*s.
+
+    Example:
+        mug = viscosity(773, 'N2')
+    Inputs:
+        T = temperature, K
+        gas = name in GASES or dictionary of mole fractions
+    Output:
+        mug = dynamic viscosity of gas, kg/m*s
+    """
+    fr = _fractions(gas)
+    if len(fr) == 1:
+        return _pure(T, list(fr)[0])[0]
+    return _wilke(T, fr, 0)
+
+
+def conductivity(T, gas='air'):
+    """
+    Thermal conductivity of a gas or mixture, W/m*K.
+
+    Example:
+        kg = conductivity(773, 'H2O')
+    Inputs:
+        T = temperature, K
+        gas = name in GASES or dictionary of mole fractions
+    Output:
+        kg = thermal conductivity of gas, W/m*K
+    """
+    fr = _fractions(gas)
+    if len(fr) == 1:
+        return _pure(T, list(fr)[0])[1]
+    return _wilke(T, fr, 1)
+
+
+def heatcap(T, gas='air'):
+    """
+    Ideal gas heat capacity of a gas or mixture, J/kg*K.
+
+    Example:
+        cpg = heatcap(773, {'N2': 0.5, 'H2O': 0.5})
+    Inputs:
+        T = temperature, K
+        gas = name in GASES or dictionary of mole fractions
+    Output:
+        cpg = heat capacity of gas, J/kg*K
+    """
+    fr = _fractions(gas)
+    cp = sum(y*_pure(T, name)[2] for name, y in fr.items())
+    return cp/molar_mass(gas)
+
+
+def properties(T, P=101325, gas='air'):
+    """
+    All the properties of a gas or mixture at once.
+
+    Example:
+        p = properties(np.linspace(300, 1100), 101325, 'N2')
+        ut, info = terminal(dp, rhos, sp, p['rhog'], p['mug'])
+    Inputs:
+        T = temperature, K
+        P = pressure, Pa
+        gas = name in GASES or dictionary of mole fractions
+    Output:
+        p = dictionary of rhog (kg/m^3), mug (kg/m*s), kg (W/m*K),
+            cpg (J/kg*K), and Pr (-)
+    """
+    rhog = density(T, P, gas)
+    mug = viscosity(T, gas)
+    kg = conductivity(T, gas)
+    cpg = heatcap(T, gas)
+    return {'rhog': rhog, 'mug': mug, 'kg': kg, 'cpg': cpg,
+            'Pr': cpg*mug/kg}
@@ -0,0 +1,64 @@
+"""
+Temperature sweep of the gas properties of gas.py for air, N2, steam, and a
+mixture of N2 and steam at 1 atm, with the terminal velocity of the bed
+particles of the Jack Halow case from terminal.py and the heat transfer
+coefficient of a particle at its terminal velocity from the Ranz and Marshall
+correlation Nu = 2 + 0.6*Re^0.5*Pr^(1/3), which is the h of the transhc.py
+heat conduction models.
+"""
+
+import sys
+import numpy as np
+import matplotlib.pyplot as py
+from gas import properties
+
+sys.path.append('../Ganser-1993')
+from terminal import terminal
+
+# Parameters
+#------------------------------------------------------------------------------
+
+T = np.linspace(300, 1100, 161)     # temperature, K
+P = 101325                          # pressure, Pa
+gases = ['air', 'N2', 'steam', {'N2': 0.5, 'H2O': 0.5}]
+labels = ['air', 'N2', 'steam', 'N2 + steam']
+
+dp = 0.000207   # diameter of bed particle, m
+rhos = 2500     # density of bed particle, kg/m^3
+sp = 0.8        # sphericity of bed particle, (-)
+
+# Properties, terminal velocity, and heat transfer coefficient
+#------------------------------------------------------------------------------
+
+res = []
+for gas in gases:
+    p = properties(T, P, gas)
+    ut, info = terminal(dp, rhos, sp, p['rhog'], p['mug'])
+    Nu = 2 + 0.6*info['Re']**0.5*p['Pr']**(1/3)
+    p.update(ut=ut, h=Nu*p['kg']/dp)
+    res.append(p)
+
+i = np.argmin(np.abs(T - 773))
+print('{:>12} {:>8} {:>10} {:>8} {:>8} {:>6} {:>7} {:>7}'.format(
+    'T = 773 K', 'rhog', 'mug', 'kg', 'cpg', 'Pr', 'ut', 'h'))
+for label, p in zip(labels, res):
+    print('{:>12} {:8.4f} {:10.3e} {:8.4f} {:8.1f} {:6.3f} {:7.4f} {:7.1f}'.format(
+        label, p['rhog'][i], p['mug'][i], p['kg'][i], p['cpg'][i], p['Pr'][i],
+        p['ut'][i], p['h'][i]))
+
+# Plot results
+#------------------------------------------------------------------------------
+
+py.figure(1)
+for k, (key, ylabel) in enumerate([('rhog', 'Density (kg/m^3)'),
+                                   ('mug', 'Viscosity (kg/ms)'),
+                                   ('ut', 'Terminal velocity (m/s)'),
+                                   ('h', 'h (W/m^2K)')]):
+    py.subplot(2, 2, k + 1)
+    for label, p in zip(labels, res):
+        py.plot(T, p[key], label=label)
+    py.xlabel('Temperature (K)')
+    py.ylabel(ylabel)
+    py.grid()
+py.legend(loc='best')
+py.show()
@@ -0,0 +1,94 @@
+"""
+Minimum fluidization velocity, umf, from the Ergun equation at minimum
+fluidization written with the Archimedes number Ar and Remf = dp*rhog*umf/mug
+    Ar = 1.75/(emf^3*sp)*Remf^2 + 150*(1 - emf)/(emf^3*sp^2)*Remf
+which is a quadratic in Remf with the positive root
+    Remf = sqrt(C1^2 + C2*Ar) - C1
+where C1 = 150*(1 - emf)/(2*1.75*sp) and C2 = emf^3*sp/1.75 for the Ergun
+equation. When emf and sp of the particles are not known, C1 and C2 are the
+constants fitted to umf data as listed in Kunii 1991, chapter 3. The root is
+computed as C2*Ar/(sqrt(C1^2 + C2*Ar) + C1) so it is accurate for fine
+particles with a small Ar. All inputs broadcast so a population of particle
+sizes, sphericities, and gas temperatures is one call.
+
+Example:
+    umf = minfluid(0.000207, 2500, rhog, mug)
+    umf = minfluid(dp, 2500, rhog, mug, 'ergun', emf=0.48, sp=0.8)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+
+# Parameters
+# -----------------------------------------------------------------------------
+
+# C1 and C2 of the fitted correlations
+CONSTANTS = {'wenyu': (33.7, 0.0408),         # Wen and Yu 1966
+             'richardson': (25.7, 0.0365),    # Richardson 1971
+             'saxena': (25.28, 0.0571),       # Saxena and Vogel 1977
+             'babu': (25.25, 0.0651),         # Babu et al. 1978
+             'grace': (27.2, 0.0408),         # Grace 1982
+             'chitester': (28.7, 0.0494)}     # Chitester et al. 1984
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def constants(method='wenyu', emf=None, sp=None):
+    """
+    Constants C1 and C2 of Remf = sqrt(C1^2 + C2*Ar) - C1.
+
+    Example:
+        C1, C2 = constants('ergun', 0.48, 0.8)
+    Inputs:
+        method = 'ergun' or a name in CONSTANTS
+        emf = void fraction at minimum fluidization, only for 'ergun'
+        sp = sphericity of the particle, only for 'ergun'
+    Output:
+        C1, C2 = constants of the quadratic, (-)
+    """
+    if method == 'ergun':
+        if emf is None or sp is None:
+            raise ValueError('ergun needs emf and sp')
+        emf = np.asarray(emf, dtype=float)
+        sp = np.asarray(sp, dtype=float)
+        return 150*(1 - emf)/(2*1.75*sp), emf**3*sp/1.75
+    if method not in CONSTANTS:
+        raise ValueError('unknown method ' + method)
+    return CONSTANTS[method]
+
+
+def archimedes(dp, rhos, rhog, mug, g=9.81):
+    """
+    Archimedes number Ar = g*dp^3*rhog*(rhos - rhog)/mug^2, (-).
+
+    Example:
+        Ar = archimedes(0.000207, 2500, 1.17, 1.85e-5)
+    """
+    dp = np.asarray(dp, dtype=float)
+    return g*dp**3*rhog*(rhos - rhog)/mug**2
+
+
+def minfluid(dp, rhos, rhog, mug, method='wenyu', emf=None, sp=None, g=9.81):
+    """
+    Minimum fluidization velocity from the closed form root of the Ergun
+    equation or of a fitted correlation.
+
+    Example:
+        umf = minfluid(0.000207, 2500, 1.17, 1.85e-5, 'grace')
+    Inputs:
+        dp = diameter of particle, m
+        rhos = density of particle, kg/m^3
+        rhog = density of gas, kg/m^3
+        mug = dynamic viscosity of gas, kg/ms
+        method = 'ergun' or a name in CONSTANTS
+        emf = void fraction at minimum fluidization, only for 'ergun'
+        sp = sphericity of the particle, only for 'ergun'
+        g = gravity, m/s^2
+    Output:
+        umf = minimum fluidization velocity, m/s
+    """
+    C1, C2 = constants(method, emf, sp)
+    Ar = archimedes(dp, rhos, rhog, mug, g)
+    Remf = C2*Ar/(np.sqrt(C1**2 + C2*Ar) + C1)
+    return Remf*mug/(dp*rhog)
@@ -0,0 +1,47 @@
+"""
+Minimum fluidization velocity of umf.py for size cuts of sand from 50 to
+1000 um in N2 from 300 to 1100 K, in one broadcast call for each method with
+the gas properties of gas.py. The Ergun equation uses emf = 0.48 and
+sphericity 0.8 of the Jack Halow bed particles.
+"""
+
+import numpy as np
+import matplotlib.pyplot as py
+from gas import properties
+from umf import CONSTANTS, minfluid
+
+# Parameters
+#------------------------------------------------------------------------------
+
+dp = np.logspace(np.log10(50e-6), np.log10(1000e-6), 60)   # size cuts, m
+T = np.array([300, 773, 1100])                            # temperature, K
+rhos = 2500     # density of sand, kg/m^3
+emf = 0.48      # void fraction at minimum fluidization
+sp = 0.8        # sphericity of sand
+
+# umf with rows = temperatures and columns = size cuts
+#------------------------------------------------------------------------------
+
+p = properties(T[:, None], 101325, 'N2')
+methods = ['ergun'] + list(CONSTANTS)
+umf = dict((m, minfluid(dp, rhos, p['rhog'], p['mug'], m, emf, sp))
+           for m in methods)
+
+i = np.argmin(np.abs(dp - 500e-6))
+print('umf (m/s) of dp = {:.0f} um'.format(dp[i]*1e6))
+print('{:>12}'.format('T (K)') + ''.join('{:>9}'.format(t) for t in T))
+for m in methods:
+    print('{:>12}'.format(m) + ''.join('{:9.4f}'.format(u) for u in umf[m][:, i]))
+
+# Plot umf of the size cuts at 773 K
+#------------------------------------------------------------------------------
+
+py.figure(1)
+for m in methods:
+    py.loglog(dp*1e6, umf[m][1], label=m)
+py.title('Sand in N2 at {} K'.format(T[1]))
+py.xlabel('Particle diameter (um)')
+py.ylabel('umf (m/s)')
+py.legend(loc='best')
+py.grid(True, which='both', ls='-', alpha=0.4)
+py.show()
@@ -5,11 +5,15 @@
 from __future__ import print_function
 from __future__ import division
 
+from gas import density, viscosity
+
 #---- Parameters
 
-# air properties at T = 300K, P = 1 atm
-rhog = 1.17     # density (kg/m^3)
-ug = 1.85e-5    # dynamic viscosity (kg/ms)
+# air properties at T = 300K, P = 1 atm from gas.py
+T = 300         # temperature (K)
+P = 101325      # pressure (Pa)
+rhog = density(T, P, 'air')     # density (kg/m^3)
+ug = viscosity(T, 'air')        # dynamic viscosity (kg/ms)
 g = 9.81        # gravity (m/s^2)
 
 # particle properties (near spherical particle)
@@ -0,0 +1,305 @@
+"""
+Residence time distribution (RTD) of compartment networks built from stirred
+zones (CSTR) and plug-flow dead times (PFR) connected by flow splits, so that
+recycle loops and bypass streams can be declared. A network is given as a
+dictionary of units and a list of links
+    units = {'z1': ('cstr', 0.2), 'd': ('pfr', 0.1), 'z2': ('cstr', 0.3)}
+    links = [('in', 'z1', 1), ('z1', 'd', 0.8), ('z1', 'out', 0.2),
+             ('d', 'z2', 1), ('z2', 'z1', 0.5), ('z2', 'out', 0.5)]
+where each link (source, destination, fraction) sends a fraction of the
+outflow of the source to the destination and 'in', 'out' are the feed and the
+outlet of the vessel. The fractions leaving each unit must sum to one. The
+residence times and fractions can be arrays of parameter sets which broadcast
+against each other.
+
+The transfer function of a CSTR is 1/(1 + s*tau) and of a PFR exp(-s*tau) so
+the inlet X(s) of the units solves the linear system (I - W*G(s))*X = f where
+W holds the fractions between units and f the feed fractions. Networks of
+stirred zones only are the state-space system dx/dt = A*x + b*delta(t) with
+E(t) = c*x which is solved with the matrix exponential. Networks with dead
+times are inverted from the Laplace domain with the Euler method of Abate and
+Whitt, which is accurate away from the jumps that the dead times give in E(t).
+
+The Vusse 1962 model of rtd() is a loop of n stirred zones with a recycle of
+r/(r+q), see vusse(), and the beds in series of Kunii 1991 etd() are n stirred
+zones in series, see tanks().
+
+Example:
+    net = network(units, links)
+    E = et(net, t)
+    F = ft(net, t)
+    mean, var, skew = moments(net)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+import scipy.linalg as sp
+from scipy.special import comb
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def network(units, links):
+    """
+    Compile the units and links of a compartment network into arrays. The
+    first axis of the arrays is the parameter set.
+
+    Example:
+        net = network({'z': ('cstr', [0.5, 1.0])}, [('in', 'z', 1),
+                                                    ('z', 'out', 1)])
+    Inputs:
+        units = dictionary of unit name: (kind, residence time) where kind is
+                'cstr' or 'pfr' and the residence time is in s
+        links = list of (source, destination, fraction) of the outflow of the
+                source, use 'in' as the source of the feed and 'out' as the
+                destination of the outlet
+    Output:
+        net = dictionary of names, pfr (True for dead times), tau, W, f, c
+    """
+    names = list(units)
+    idx = dict((name, i) for i, name in enumerate(names))
+    N = len(names)
+
+    # broadcast the residence times and the fractions to the parameter sets
+    vals = [units[name][1] for name in names] + [lk[2] for lk in links]
+    vals = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                 for v in vals])
+    P = vals[0].size
+    tau = np.array([v.ravel() for v in vals[:N]]).T.reshape(P, N)
+    fracs = [v.ravel() for v in vals[N:]]
+
+    W = np.zeros((P, N, N))
+    f = np.zeros((P, N))
+    c = np.zeros((P, N))
+    for (src, dst, frac), x in zip(links, fracs):
+        for name in (src, dst):
+            if name not in idx and name not in ('in', 'out'):
+                raise ValueError('unknown unit ' + str(name))
+        if src == 'in' and dst == 'out':
+            raise ValueError('link from in to out has no residence time, '
+                             'use a pfr with a small tau')
+        if src == 'in':
+            f[:, idx[dst]] += x
+        elif dst == 'out':
+            c[:, idx[src]] += x
+        else:
+            W[:, idx[dst], idx[src]] += x
+
+    # all the flow leaving each unit and all of the feed must be accounted for
+    if not np.allclose(W.sum(axis=1) + c, 1) or not np.allclose(f.sum(axis=1), 1):
+        raise ValueError('fractions leaving each unit and the feed must sum to 1')
+
+    pfr = np.array([units[name][0] == 'pfr' for name in names])
+    return {'names': names, 'pfr': pfr, 'tau': tau, 'W': W, 'f': f, 'c': c}
+
+
+def tanks(n, tau):
+    """
+    Network of n equal stirred zones in series with a total residence time
+    tau, the same as etd() of Kunii 1991.
+
+    Example:
+        net = tanks(3, 1.8)
+    """
+    units = dict(('s{}'.format(i), ('cstr', np.asarray(tau)/n))
+                 for i in range(n))
+    links = [('in', 's0', 1), ('s{}'.format(n-1), 'out', 1)]
+    links += [('s{}'.format(i), 's{}'.format(i+1), 1) for i in range(n-1)]
+    return network(units, links)
+
+
+def vusse(n, tau, q=1, r=1):
+    """
+    Network of the Vusse 1962 stirred tank as a circulation loop of n stirred
+    zones with a circulation time tau. The feed q enters the first zone and a
+    fraction q/(r+q) of the flow leaving the last zone is the outlet, the same
+    as rtd().
+
+    Example:
+        net = vusse(4, 0.5)
+    """
+    q = np.asarray(q, dtype=float)
+    r = np.asarray(r, dtype=float)
+    units = dict(('s{}'.format(i), ('cstr', np.asarray(tau)/n))
+                 for i in range(n))
+    last = 's{}'.format(n-1)
+    links = [('in', 's0', 1), (last, 's0', r/(r+q)), (last, 'out', q/(r+q))]
+    links += [('s{}'.format(i), 's{}'.format(i+1), 1) for i in range(n-1)]
+    return network(units, links)
+
+
+def transfer(net, s):
+    """
+    Transfer function H(s) of the network, the Laplace transform of E(t).
+
+    Example:
+        H = transfer(net, 1j*w)
+    Inputs:
+        net = network from network()
+        s = Laplace variable, scalar or array, 1/s
+    Output:
+        H = transfer function, rows = parameter sets, columns = s
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=complex))
+    tau = net['tau'][:, None, :]
+    st = s[None, :, None]*tau
+    G = np.where(net['pfr'], np.exp(-st), 1/(1 + st))
+    N = tau.shape[-1]
+    A = np.eye(N) - net['W'][:, None]*G[:, :, None, :]
+    f = np.broadcast_to(net['f'][:, None, :], G.shape)
+    X = np.linalg.solve(A, f[..., None])[..., 0]
+    return np.sum(net['c'][:, None, :]*G*X, axis=-1)
+
+
+def euler(F, t, M=16):
+    """
+    Inverse Laplace transform by the Euler method of Abate and Whitt 2006
+    which sums F(s) along a vertical line of the Bromwich contour.
+
+    Example:
+        y = euler(lambda s: transfer(net, s), t)
+    Inputs:
+        F = function of s that returns rows = parameter sets, columns = s
+        t = time vector, all t > 0, s
+        M = number of terms, 2M+1 evaluations of F for each t
+    Output:
+        y = inverse transform, rows = parameter sets, columns = t
+    """
+    t = np.asarray(t, dtype=float)
+    k = np.arange(2*M + 1)
+    beta = M*np.log(10)/3 + 1j*np.pi*k
+
+    # Euler summation weights of the alternating series
+    xi = np.ones(2*M + 1)
+    xi[0] = 0.5
+    xi[2*M] = 2.0**-M
+    for j in range(1, M):
+        xi[2*M - j] = xi[2*M - j + 1] + 2.0**-M*comb(M, j)
+    eta = (-1)**k*xi
+
+    s = (beta[:, None]/t[None, :]).ravel()
+    Fs = F(s).reshape(-1, len(k), len(t))
+    return 10**(M/3)/t*np.sum(eta[:, None]*Fs.real, axis=1)
+
+
+def _state(net, cumulative=False):
+    """
+    State-space matrices of a network of stirred zones, dx/dt = A*x with
+    x(0) = b after the tracer pulse and E(t) = c*x. With cumulative, a last
+    state integrates E(t) so that it is F(t).
+    """
+    tau = net['tau']
+    A = (net['W'] - np.eye(tau.shape[1]))/tau[:, :, None]
+    b = net['f']/tau
+    c = net['c']
+    if cumulative:
+        P, N = tau.shape
+        Aa = np.zeros((P, N+1, N+1))
+        Aa[:, :N, :N] = A
+        Aa[:, N, :N] = c
+        A = Aa
+        b = np.concatenate([b, np.zeros((P, 1))], axis=1)
+        c = np.concatenate([np.zeros((P, N)), np.ones((P, 1))], axis=1)
+    return A, b, c
+
+
+def _expm(net, t, cumulative=False):
+    """
+    Response c*expm(A*t)*b of the state-space system for every parameter set
+    and time.
+    """
+    t = np.asarray(t, dtype=float)
+    A, b, c = _state(net, cumulative)
+    eAt = sp.expm(A[:, None]*t[None, :, None, None])
+    return np.einsum('pi,ptij,pj->pt', c, eAt, b)
+
+
+def et(net, t, method=None, M=16):
+    """
+    Residence time distribution E(t) of the network.
+
+    Example:
+        E = et(net, t)
+    Inputs:
+        net = network from network()
+        t = time vector, s
+        method = 'expm' or 'laplace', default is expm for stirred zones only
+        M = number of terms of the Laplace inversion, see euler()
+    Output:
+        E = residence time distribution, rows = parameter sets, columns = t,
+            1/s
+    """
+    t = np.asarray(t, dtype=float)
+    method = method or ('laplace' if net['pfr'].any() else 'expm')
+    if method == 'expm':
+        if net['pfr'].any():
+            raise ValueError('expm needs a network without pfr units')
+        return _expm(net, t)
+    E = np.zeros((net['tau'].shape[0], len(t)))
+    pos = t > 0
+    E[:, pos] = euler(lambda s: transfer(net, s), t[pos], M)
+    return E
+
+
+def ft(net, t, method=None, M=16):
+    """
+    Cumulative distribution F(t) of the residence time of the network.
+
+    Example:
+        F = ft(net, t)
+    Inputs:
+        net, t, method, M = see et()
+    Output:
+        F = fraction with a residence time less than t, rows = parameter sets,
+            columns = t
+    """
+    t = np.asarray(t, dtype=float)
+    method = method or ('laplace' if net['pfr'].any() else 'expm')
+    if method == 'expm':
+        if net['pfr'].any():
+            raise ValueError('expm needs a network without pfr units')
+        return _expm(net, t, cumulative=True)
+    F = np.zeros((net['tau'].shape[0], len(t)))
+    pos = t > 0
+    F[:, pos] = euler(lambda s: transfer(net, s)/s, t[pos], M)
+    return F
+
+
+def moments(net):
+    """
+    Mean, variance, and skewness of the residence time of the network from the
+    power series of the transfer function H(s) at s = 0, which is exact for
+    both stirred zones and dead times.
+
+    Example:
+        mean, var, skew = moments(net)
+    Inputs:
+        net = network from network()
+    Output:
+        mean = mean residence time for each parameter set, s
+        var = variance of the residence time, s^2
+        skew = skewness of the residence time distribution, (-)
+    """
+    tau = net['tau']
+    W, f, c = net['W'], net['f'], net['c']
+    N = tau.shape[1]
+
+    # series coefficients of G(s) for the powers k = 0 to 3
+    fact = np.array([1, 1, 2, 6])
+    g = [np.where(net['pfr'], (-tau)**k/fact[k], (-tau)**k) for k in range(4)]
+
+    # (I - W*G0)*X[k] = sum of W*G[j]*X[k-j] for j = 1 to k
+    A0 = np.eye(N) - W*g[0][:, None, :]
+    X = [np.linalg.solve(A0, f[..., None])[..., 0]]
+    for k in range(1, 4):
+        rhs = sum(np.einsum('pij,pj->pi', W, g[j]*X[k-j]) for j in range(1, k+1))
+        X.append(np.linalg.solve(A0, rhs[..., None])[..., 0])
+
+    # raw moments from the coefficients of H(s)
+    h = [sum(np.sum(c*g[j]*X[k-j], axis=1) for j in range(k+1))
+         for k in range(4)]
+    m1, m2, m3 = [(-1)**k*fact[k]*h[k] for k in (1, 2, 3)]
+    var = m2 - m1**2
+    skew = (m3 - 3*m1*m2 + 2*m1**3)/var**1.5
+    return m1, var, skew
@@ -0,0 +1,72 @@
+"""
+Residence time distribution of compartment networks from compartment.py. The
+Vusse 1962 stirred tank and the beds in series of Kunii 1991 are compared to
+rtd() and etd(), then a stirred zone with a bypass to the outlet, a plug-flow
+dead time, and a recycle from a second stirred zone is evaluated for several
+recycle fractions.
+"""
+
+import sys
+import numpy as np
+import matplotlib.pyplot as py
+from rtd import rtd
+from compartment import network, vusse, tanks, et, ft, moments
+
+sys.path.append('../Kunii-1991')
+from tanks import etd
+
+# Special cases of Vusse 1962 and Kunii 1991
+#------------------------------------------------------------------------------
+
+t = np.linspace(0, 4, 200)      # time range, s
+
+ev = et(vusse(4, 0.5), t)[0]            # Vusse network, n = 4, tau = 0.5 s
+ek = et(tanks(3, 1.8), t)[0]            # Kunii beds in series, n = 3, tau = 1.8 s
+
+print('max difference to rtd() = {:.2e}'.format(np.abs(ev - rtd(4, 0.5, t)).max()))
+print('max difference to etd() = {:.2e}'.format(np.abs(ek - etd(3, 1.8, t)).max()))
+
+# Stirred zone, bypass, dead time, and recycle for several recycle fractions
+#------------------------------------------------------------------------------
+
+rc = np.array([0.1, 0.3, 0.5])  # recycle fraction of the second zone, (-)
+
+units = {'z1': ('cstr', 0.4), 'dead': ('pfr', 0.3), 'z2': ('cstr', 0.2)}
+links = [('in', 'z1', 1),
+         ('z1', 'dead', 0.8), ('z1', 'out', 0.2),       # bypass of 20%
+         ('dead', 'z2', 1),
+         ('z2', 'z1', rc), ('z2', 'out', 1 - rc)]       # recycle to z1
+net = network(units, links)
+
+E = et(net, t)
+F = ft(net, t)
+mean, var, skew = moments(net)
+for i in range(len(rc)):
+    print('recycle {:.1f}: mean {:.3f} s, var {:.3f} s^2, skew {:.2f}'
+          .format(rc[i], mean[i], var[i], skew[i]))
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+py.plot(t, rtd(4, 0.5, t), 'b-', lw=2, label='rtd()')
+py.plot(t, ev, 'bo', mec='b', mfc='none', label='vusse network')
+py.plot(t, etd(3, 1.8, t), 'g-', lw=2, label='etd()')
+py.plot(t, ek, 'go', mec='g', mfc='none', label='tanks network')
+py.xlabel('Time (s)')
+py.ylabel('RTD function (1/s)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.figure(2)
+for i, col in enumerate(['r', 'g', 'b']):
+    py.plot(t, E[i], col+'-', lw=2, label='recycle {:.1f}'.format(rc[i]))
+    py.plot(t, F[i], col+'--', lw=2)
+py.xlabel('Time (s)')
+py.ylabel('E(t) solid, F(t) dashed')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
@@ -0,0 +1,282 @@
+"""
+Mean residence time, variance, skewness, cumulative distribution F(t), and
+intensity function Lambda(t) = E(t)/(1 - F(t)) of residence time distribution
+(RTD) curves. Measured curves such as the digitized CSV files of the RTD
+folders are noisy, unsorted, do not start at t = 0, and end before the tail
+of the RTD has decayed, so each curve is
+    - sorted by time with negative values set to zero
+    - started at (0, 0) when the first time is above zero
+    - extended past the last point by an exponential a*exp(-k*t) fitted to
+      the last points, whose integrals are added in closed form, unless the
+      last points are flat on the noise floor of the data
+    - normalized by its area so the moments do not depend on the units of E
+The curves are stored as a ragged batch, all the times and values in one
+array with the start index of each curve, and the trapezoid rule is applied
+to all the curves at once with np.add.reduceat.
+
+Model curves have closed form moments from analytic(), and F(t) from
+analytic_cdf() where it is known.
+
+Example:
+    b = batch([load('n4.csv'), load('../Harris-2002/fig15a.csv')])
+    res = moments(b)
+    F = cdf(b)
+    mean, var, skew = analytic('tanks', 3, 1.8)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import sys
+import numpy as np
+from scipy.special import gamma
+from compartment import vusse, moments as network_moments, ft
+
+sys.path.append('../Kunii-1991')
+sys.path.append('../Levenspiel-1999')
+from tanks import moments as tanks_moments, etf
+from dispersion import mvar
+
+# Ragged batch of curves
+# -----------------------------------------------------------------------------
+
+def load(path):
+    """
+    Load a digitized RTD from a CSV file of time and E.
+
+    Example:
+        t, E = load('n4.csv')
+    """
+    t, E = np.loadtxt(path, delimiter=',', unpack=True)
+    return t, E
+
+
+def batch(curves, head=True):
+    """
+    Ragged batch of RTD curves.
+
+    Example:
+        b = batch([(t1, E1), (t2, E2)])
+    Inputs:
+        curves = list of (t, E) of each curve
+        head = add the point (0, 0) to curves that start after t = 0
+    Output:
+        b = dictionary of t and E of all the curves, start index and number
+            of points of each curve
+    """
+    ts = []
+    Es = []
+    for t, E in curves:
+        t = np.asarray(t, dtype=float)
+        E = np.asarray(E, dtype=float)
+        k = np.argsort(t, kind='stable')
+        t, E = t[k], np.maximum(E[k], 0)
+        if head and t[0] > 0:
+            t = np.concatenate([[0], t])
+            E = np.concatenate([[0], E])
+        ts.append(t)
+        Es.append(E)
+    n = np.array([len(t) for t in ts])
+    start = np.concatenate([[0], np.cumsum(n)[:-1]])
+    return {'t': np.concatenate(ts), 'E': np.concatenate(Es), 'start': start,
+            'n': n}
+
+
+def split(b, y):
+    """
+    Split an array of values of all the points of a batch into the curves.
+
+    Example:
+        F1, F2 = split(b, cdf(b))
+    """
+    return np.split(y, b['start'][1:])
+
+
+def _segments(b, y):
+    """
+    Trapezoid areas of y over the segments of each curve, zero for the
+    segment between the last point of a curve and the first of the next.
+    """
+    t = b['t']
+    a = (y[1:] + y[:-1])/2*np.diff(t)
+    last = b['start'][1:] - 1
+    a[last] = 0
+    return a
+
+
+def tail(b, npts=5):
+    """
+    Exponential tail a*exp(-k*t) of each curve fitted by least squares to the
+    log of the last npts positive points. Curves that do not decay faster
+    than the length of the record, k*T < 1, get no tail, a = 0, as their last
+    points are on the noise floor of the digitized data.
+
+    Example:
+        a, k, T = tail(b)
+    Inputs:
+        b = batch from batch()
+        npts = number of points of the fit
+    Output:
+        a = pre-factor of the tail of each curve, 1/s
+        k = decay rate of the tail, 1/s
+        T = last time of each curve, s
+    """
+    nc = len(b['n'])
+    a = np.zeros(nc)
+    k = np.ones(nc)
+    end = b['start'] + b['n']
+    T = b['t'][end - 1]
+    for i in range(nc):
+        t = b['t'][b['start'][i]:end[i]]
+        E = b['E'][b['start'][i]:end[i]]
+        pos = E > 0
+        t, E = t[pos][-npts:], E[pos][-npts:]
+        if len(t) < 2:
+            continue
+        slope, icpt = np.polyfit(t, np.log(E), 1)
+        if -slope*T[i] > 1:
+            a[i] = np.exp(icpt)
+            k[i] = -slope
+    return a, k, T
+
+
+def _tail_moments(a, k, T):
+    """
+    Integrals of t^m * a*exp(-k*t) from T to infinity for m = 0 to 3.
+    """
+    e = a*np.exp(-k*T)
+    m0 = e/k
+    m1 = e*(T/k + 1/k**2)
+    m2 = e*(T**2/k + 2*T/k**2 + 2/k**3)
+    m3 = e*(T**3/k + 3*T**2/k**2 + 6*T/k**3 + 6/k**4)
+    return np.array([m0, m1, m2, m3])
+
+
+def moments(b, extrapolate=True, npts=5):
+    """
+    Area, mean residence time, variance, and skewness of every curve of a
+    batch by the trapezoid rule with the exponential tail.
+
+    Example:
+        res = moments(b)
+    Inputs:
+        b = batch from batch()
+        extrapolate = add the exponential tail past the last point
+        npts = number of points of the tail fit
+    Output:
+        res = dictionary of area (units of E times s), mean (s), var (s^2),
+              skew (-), and tail as the fraction of the area in the tail
+    """
+    t = b['t']
+    E = b['E']
+    M = np.array([np.add.reduceat(np.append(_segments(b, E*t**m), 0),
+                                  b['start']) for m in range(4)])
+    tl = np.zeros(M.shape)
+    if extrapolate:
+        tl = _tail_moments(*tail(b, npts))
+    M = M + tl
+
+    area = M[0]
+    mean = M[1]/area
+    m2 = M[2]/area
+    m3 = M[3]/area
+    var = m2 - mean**2
+    skew = (m3 - 3*mean*m2 + 2*mean**3)/var**1.5
+    return {'area': area, 'mean': mean, 'var': var, 'skew': skew,
+            'tail': tl[0]/area}
+
+
+def cdf(b, extrapolate=True, npts=5):
+    """
+    Cumulative distribution F(t) at every point of a batch by the cumulative
+    trapezoid rule, normalized by the area with the tail so that F goes to
+    one at t = inf.
+
+    Example:
+        F = split(b, cdf(b))
+    """
+    a = _segments(b, b['E'])
+    c = np.concatenate([[0], np.cumsum(a)])
+    F = c - np.repeat(c[b['start']], b['n'])
+    end = b['start'] + b['n'] - 1
+    total = F[end]
+    if extrapolate:
+        total = total + _tail_moments(*tail(b, npts))[0]
+    return F/np.repeat(total, b['n'])
+
+
+def intensity(b, extrapolate=True, npts=5):
+    """
+    Intensity function Lambda(t) = E(t)/(1 - F(t)) at every point of a batch
+    with E normalized like F(t). Lambda is inf where F(t) = 1.
+
+    Example:
+        L = split(b, intensity(b))
+    """
+    F = cdf(b, extrapolate, npts)
+    area = moments(b, extrapolate, npts)['area']
+    E = b['E']/np.repeat(area, b['n'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(F < 1, E/(1 - F), np.inf)
+
+
+# Model curves
+# -----------------------------------------------------------------------------
+
+def analytic(name, *p):
+    """
+    Closed form mean, variance, and skewness of model RTDs. The skewness of
+    the dispersion model is not available and is nan.
+
+    Example:
+        mean, var, skew = analytic('vusse', 4, 0.5)
+    Inputs:
+        name = 'tanks' (n, tau), 'vusse' (n, tau, q=1, r=1), 'weibull'
+               (lam, k), or 'dispersion' (DLu, tau, bc='closed')
+        p = parameters of the model
+    Output:
+        mean = mean residence time, s
+        var = variance, s^2
+        skew = skewness, (-)
+    """
+    if name == 'tanks':
+        return tanks_moments(*p)
+    if name == 'vusse':
+        n, tau = p[:2]
+        mean, var, skew = network_moments(vusse(n, tau, *p[2:]))
+        return mean.squeeze(), var.squeeze(), skew.squeeze()
+    if name == 'weibull':
+        lam, k = [np.asarray(v, dtype=float) for v in p]
+        g1, g2, g3 = [gamma(1 + j/k) for j in (1, 2, 3)]
+        mean = lam*g1
+        var = lam**2*(g2 - g1**2)
+        skew = (g3 - 3*g1*g2 + 2*g1**3)/(g2 - g1**2)**1.5
+        return mean, var, skew
+    if name == 'dispersion':
+        DLu, tau = p[:2]
+        mean, var = mvar(DLu, *p[2:])
+        return mean*tau, var*tau**2, np.nan
+    raise ValueError('unknown model ' + name)
+
+
+def analytic_cdf(name, t, *p):
+    """
+    Closed form F(t) of model RTDs.
+
+    Example:
+        F = analytic_cdf('weibull', t, 0.5, 2)
+    Inputs:
+        name = 'tanks' (n, tau), 'vusse' (n, tau, q=1, r=1), or 'weibull'
+               (lam, k)
+        t = time, s
+        p = parameters of the model
+    Output:
+        F = fraction with a residence time less than t, (-)
+    """
+    t = np.asarray(t, dtype=float)
+    if name == 'tanks':
+        return etf(p[0], p[1], t)
+    if name == 'vusse':
+        return ft(vusse(*p), t).squeeze()
+    if name == 'weibull':
+        return 1 - np.exp(-(t/p[0])**p[1])
+    raise ValueError('no closed form F(t) for ' + name)
@@ -0,0 +1,62 @@
+"""
+Mean residence time, variance, skewness, F(t), and intensity function of the
+digitized RTD curves of the Vusse-1962, Berruti-1988, Bhusarapu-2004,
+Harris-2002, and Smolders-2000 folders in one ragged batch. The Vusse 1962
+curves are compared to the closed form moments of rtd().
+"""
+
+import matplotlib.pyplot as py
+from rtdfit import DATASETS
+from moments import load, batch, split, moments, cdf, intensity, analytic
+
+# Moments of all the digitized curves
+#------------------------------------------------------------------------------
+
+names = sorted(DATASETS)
+b = batch([load(DATASETS[name]) for name in names])
+res = moments(b)
+
+print('{:<12} {:>8} {:>8} {:>8} {:>8} {:>6}'.format(
+    'dataset', 'area', 'mean', 'var', 'skew', 'tail'))
+for i, name in enumerate(names):
+    print('{:<12} {:8.4f} {:8.3f} {:8.3f} {:8.3f} {:6.3f}'.format(
+        name, res['area'][i], res['mean'][i], res['var'][i], res['skew'][i],
+        res['tail'][i]))
+
+# Vusse 1962 curves vs moments of rtd() with tau = 0.5 s
+#------------------------------------------------------------------------------
+
+print('---')
+for n in (1, 2, 4, 10):
+    i = names.index('vusse{}'.format(n))
+    mean, var, skew = analytic('vusse', n, 0.5)
+    print('vusse n={:<2} mean {:.3f} vs {:.3f} s, var {:.3f} vs {:.3f} s^2'
+          .format(n, res['mean'][i], mean, res['var'][i], var))
+
+# Plot
+#------------------------------------------------------------------------------
+
+t = split(b, b['t'])
+F = split(b, cdf(b))
+L = split(b, intensity(b))
+
+py.close('all')
+
+py.figure(1)
+for i, name in enumerate(names):
+    py.plot(t[i]/res['mean'][i], F[i], lw=2, label=name)
+py.xlabel(r'$\Theta$ = t / mean (-)')
+py.ylabel('F (-)')
+py.legend(loc='best', fontsize=8, numpoints=1)
+py.grid()
+
+py.figure(2)
+for i, name in enumerate(names):
+    py.plot(t[i]/res['mean'][i], L[i]*res['mean'][i], lw=2, label=name)
+py.xlabel(r'$\Theta$ = t / mean (-)')
+py.ylabel(r'Intensity function $\Lambda$ * mean (-)')
+py.ylim([0, 5])
+py.legend(loc='best', fontsize=8, numpoints=1)
+py.grid()
+
+py.show()
@@ -0,0 +1,267 @@
+"""
+Monte Carlo particle tracking to check the residence time distribution (RTD)
+models against a stochastic simulation instead of digitized figures. Particles
+are advanced in NumPy chunks with a seeded Generator and their exit times are
+binned into a histogram of E(t). Two kinds of vessel are simulated:
+    track() = compartment network of compartment.py, each particle stays an
+              exponential time in a stirred zone or tau in a dead time, then
+              jumps to the next unit with the probabilities of the links
+    walk() = 1-D dispersion in a vessel of length one as a random walk
+             x += dt + sqrt(2*DLu*dt)*z in units of theta = t/tau with
+             absorption at the outlet and a closed (reflecting) or open inlet
+Each chunk has its own seed from SeedSequence(seed).spawn() so the result is
+the same for any number of worker processes. The histograms and power sums of
+the chunks are merged and the confidence intervals of the moments are from the
+spread of the chunk estimates (batch means).
+
+The random walk gives the first passage time to the outlet, which is not the
+Danckwerts closed-closed E(theta) of dispersion.py. A particle that reaches
+the outlet does not come back, so the mean is 1 - DLu*(1 - exp(-1/DLu)) for a
+closed inlet instead of one. The exact transforms of the walk are hwalk() so
+the histogram is checked with the Laplace inversion of compartment.py. The
+walk is the same as the dispersion models for small D/uL.
+
+Example:
+    res = track(vusse(4, 0.5), 1000000)
+    res = walk(0.1, 1000000, workers=2)
+    res['mean'], res['ci']['mean']
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import t as student
+from compartment import moments
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def _tally(tout, edges):
+    """
+    Histogram counts and power sums of the exit times of one chunk.
+    """
+    counts = np.histogram(tout, edges)[0]
+    sums = np.array([len(tout), tout.sum(), (tout**2).sum(), (tout**3).sum()])
+    return counts, sums
+
+
+def _track_chunk(task):
+    """
+    Exit times of n particles through a compartment network, see track().
+    """
+    tau, pfr, dest, cum, n, seed, edges = task
+    rng = np.random.default_rng(seed)
+    N = len(tau)
+
+    # all particles enter a unit from the feed, the last row
+    k = (rng.random(n)[:, None] >= cum[N]).sum(axis=1)
+    unit = dest[N, k]
+    t = np.zeros(n)
+    tout = []
+    steps = 0
+    mix = np.where(pfr, 0.0, tau)
+    dead = np.where(pfr, tau, 0.0)
+    while len(unit) > 0:
+        steps += len(unit)
+        t += rng.standard_exponential(len(unit))*mix[unit] + dead[unit]
+
+        # next unit or the outlet as index N from the cumulative fractions of
+        # the links that leave each unit
+        u = rng.random(len(unit))
+        k = np.zeros(len(unit), dtype=int)
+        for j in range(cum.shape[1] - 1):
+            k += u >= cum[unit, j]
+        unit = dest[unit, k]
+        out = unit == N
+        tout.append(t[out])
+        unit = unit[~out]
+        t = t[~out]
+
+    counts, sums = _tally(np.concatenate(tout), edges)
+    return counts, sums, steps
+
+
+def _walk_chunk(task):
+    """
+    Exit times of n particles of a random walk in a vessel, see walk().
+    """
+    DLu, dt, closed, n, seed, edges = task
+    rng = np.random.default_rng(seed)
+    sd = np.sqrt(2*DLu*dt)
+
+    # tracer enters at the inlet of the vessel
+    x = np.zeros(n)
+    t = 0.0
+    tout = []
+    steps = 0
+    while len(x) > 0:
+        steps += len(x)
+        x1 = x + dt + sd*rng.standard_normal(len(x))
+        if closed:
+            x1 = np.abs(x1)
+        t += dt
+
+        # exit at the end of the step or within it from the Brownian bridge
+        pin = np.exp(-2*(1 - x)*np.maximum(1 - x1, 0)/sd**2)
+        out = (x1 >= 1) | (rng.random(len(x)) < pin)
+        tout.append(np.full(out.sum(), t - dt/2))
+        x = x1[~out]
+
+    counts, sums = _tally(np.concatenate(tout), edges)
+    return counts, sums, steps
+
+
+def _run(chunk_fun, args, N, chunk, seed, workers, edges):
+    """
+    Run the chunks serially or in a process pool and merge the histograms.
+    """
+    sizes = [chunk]*(int(N)//chunk) + ([int(N) % chunk] if int(N) % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [args + (n, s, edges) for n, s in zip(sizes, seeds)]
+
+    if workers == 1:
+        out = [chunk_fun(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            out = list(pool.map(chunk_fun, tasks))
+
+    counts = np.array([o[0] for o in out])
+    sums = np.array([o[1] for o in out], dtype=float)
+    steps = sum(o[2] for o in out)
+    return summary(edges, counts, sums, steps)
+
+
+def summary(edges, counts, sums, steps=0, level=0.95):
+    """
+    Merge the histograms and power sums of the chunks into E(t) and the
+    moments with confidence intervals from the spread of the chunk estimates.
+
+    Example:
+        res = summary(edges, counts, sums)
+    Inputs:
+        edges = edges of the time bins, s
+        counts = histogram counts, rows = chunks
+        sums = number, sum of t, t^2, and t^3 of the exit times, rows = chunks
+        steps = number of particle steps
+        level = confidence level of the intervals
+    Output:
+        res = dictionary of t (bin centers), E, mean, var, skew, ci as the half
+              widths of the moments, N particles, and steps
+    """
+    def stats(s):
+        n = s[..., 0]
+        m1 = s[..., 1]/n
+        m2 = s[..., 2]/n
+        m3 = s[..., 3]/n
+        var = m2 - m1**2
+        skew = (m3 - 3*m1*m2 + 2*m1**3)/var**1.5
+        return m1, var, skew
+
+    total = sums.sum(axis=0)
+    N = total[0]
+    mean, var, skew = stats(total)
+
+    # batch means over the chunks, no interval for a single chunk
+    nb = len(sums)
+    ci = {}
+    for name, vals in zip(['mean', 'var', 'skew'], stats(sums)):
+        if nb > 1:
+            tq = student.ppf((1 + level)/2, nb - 1)
+            ci[name] = tq*np.std(vals, ddof=1)/np.sqrt(nb)
+        else:
+            ci[name] = np.nan
+
+    E = counts.sum(axis=0)/(N*np.diff(edges))
+    return {'t': (edges[1:] + edges[:-1])/2, 'E': E, 'mean': mean, 'var': var,
+            'skew': skew, 'ci': ci, 'N': int(N), 'steps': steps}
+
+
+def track(net, N=1000000, p=0, chunk=100000, seed=0, workers=1, edges=None):
+    """
+    Monte Carlo RTD of a compartment network by particle tracking.
+
+    Example:
+        res = track(vusse(4, 0.5), 1000000)
+    Inputs:
+        net = network from compartment.py
+        N = number of particles
+        p = index of the parameter set of the network
+        chunk = number of particles of each chunk
+        seed = seed of the random numbers
+        workers = number of processes, 1 to run without a pool
+        edges = edges of the time bins, default is 200 bins up to six times
+                the mean residence time, s
+    Output:
+        res = dictionary of the histogram and moments, see summary()
+    """
+    tau = net['tau'][p]
+    pfr = net['pfr']
+
+    # destinations of the links out of each unit with the outlet as index N
+    # and their cumulative fractions, padded to the most links of a unit, the
+    # last row is the feed
+    frac = np.concatenate([net['W'][p].T, net['c'][p][:, None]], axis=1)
+    frac = np.vstack([frac, np.concatenate([net['f'][p], [0]])])
+    nd = max((frac[i] > 0).sum() for i in range(len(frac)))
+    dest = np.zeros((len(frac), nd), dtype=int)
+    cum = np.ones((len(frac), nd))
+    for i in range(len(frac)):
+        j = np.nonzero(frac[i])[0]
+        dest[i, :len(j)] = j
+        dest[i, len(j):] = j[-1]
+        cum[i, :len(j)] = np.cumsum(frac[i, j])
+
+    if edges is None:
+        edges = np.linspace(0, 6*moments(net)[0][p], 201)
+    return _run(_track_chunk, (tau, pfr, dest, cum), N, chunk, seed, workers,
+                edges)
+
+
+def walk(DLu, N=1000000, bc='closed', dt=None, chunk=100000, seed=0,
+         workers=1, edges=None):
+    """
+    Monte Carlo RTD of a dispersion vessel by a random walk in dimensionless
+    time theta, see hwalk() for the exact transform.
+
+    Example:
+        res = walk(0.1, 1000000)
+    Inputs:
+        DLu = D/uL = dimensionless vessel dispersion number, (-)
+        bc = 'closed' for a reflecting inlet or 'open' for a free inlet
+        N = number of particles
+        dt = time step in theta, default gives a step of sd = 0.02
+        chunk = number of particles of each chunk
+        seed = seed of the random numbers
+        workers = number of processes, 1 to run without a pool
+        edges = edges of the theta bins, default is 200 bins up to theta = 4
+    Output:
+        res = dictionary of the histogram and moments in theta, see summary()
+    """
+    if dt is None:
+        dt = min(0.02**2/(2*DLu), 0.01)
+    if edges is None:
+        edges = np.linspace(0, 4, 201)
+    return _run(_walk_chunk, (DLu, dt, bc == 'closed'), N, chunk, seed,
+                workers, edges)
+
+
+def hwalk(DLu, s, bc='closed'):
+    """
+    Laplace transform of the first passage time of the random walk of walk()
+    with q = sqrt(1 + 4*DLu*s). The open inlet is the inverse Gaussian.
+
+    Example:
+        E = euler(lambda s: hwalk(0.1, s)[None], theta)[0]
+    Inputs:
+        DLu = D/uL = dimensionless vessel dispersion number, (-)
+        s = Laplace variable of theta, (-)
+        bc = 'closed' or 'open'
+    Output:
+        H = transform of the first passage time, (-)
+    """
+    Pe = 1/DLu
+    q = np.sqrt(1 + 4*s/Pe)
+    if bc == 'closed':
+        return 2*q*np.exp(Pe*(1 - q)/2)/((1 + q) - (1 - q)*np.exp(-q*Pe))
+    return np.exp(Pe*(1 - q)/2)
@@ -0,0 +1,72 @@
+"""
+Check the residence time distribution (RTD) models with the Monte Carlo
+particle tracking of montecarlo.py. The Vusse 1962 stirred tank and a network
+with a dead time and a recycle are compared to rtd() and compartment.py, and a
+random walk of the dispersion model to the exact first passage distribution.
+"""
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+from rtd import rtd
+from compartment import network, vusse, et, moments, euler
+from montecarlo import track, walk, hwalk
+
+# Vusse 1962 stirred tank, n = 4 and tau = 0.5 s
+#------------------------------------------------------------------------------
+
+t0 = time.time()
+rv = track(vusse(4, 0.5), 1000000)
+dt = time.time() - t0
+print('vusse: mean {:.4f} +/- {:.4f} s, exact 1, {:.1f} million steps/s'
+      .format(rv['mean'], rv['ci']['mean'], rv['steps']/dt/1e6))
+
+# Stirred zone, dead time, and recycle
+#------------------------------------------------------------------------------
+
+units = {'z1': ('cstr', 0.4), 'dead': ('pfr', 0.3), 'z2': ('cstr', 0.2)}
+links = [('in', 'z1', 1), ('z1', 'dead', 0.8), ('z1', 'out', 0.2),
+         ('dead', 'z2', 1), ('z2', 'z1', 0.3), ('z2', 'out', 0.7)]
+net = network(units, links)
+rn = track(net, 1000000)
+mean, var, skew = moments(net)
+print('network: mean {:.4f} +/- {:.4f} s, exact {:.4f} s'
+      .format(rn['mean'], rn['ci']['mean'], mean[0]))
+print('network: var {:.4f} +/- {:.4f} s^2, exact {:.4f} s^2'
+      .format(rn['var'], rn['ci']['var'], var[0]))
+
+# Random walk of the dispersion model with D/uL = 0.1
+#------------------------------------------------------------------------------
+
+t0 = time.time()
+rw = walk(0.1, 300000)
+dt = time.time() - t0
+Ew = euler(lambda s: hwalk(0.1, s)[None], rw['t'])[0]
+print('walk: mean {:.4f} +/- {:.4f}, exact {:.4f}, {:.1f} million steps/s'
+      .format(rw['mean'], rw['ci']['mean'], 1 - 0.1*(1 - np.exp(-10)),
+              rw['steps']/dt/1e6))
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+py.plot(rv['t'], rv['E'], 'b.', label='monte carlo vusse')
+py.plot(rv['t'], rtd(4, 0.5, rv['t']), 'b-', lw=2, label='rtd()')
+py.plot(rn['t'], rn['E'], 'g.', label='monte carlo network')
+py.plot(rn['t'], et(net, rn['t'])[0], 'g-', lw=2, label='compartment')
+py.xlabel('Time (s)')
+py.ylabel('RTD function (1/s)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.figure(2)
+py.plot(rw['t'], rw['E'], 'r.', label='random walk')
+py.plot(rw['t'], Ew, 'r-', lw=2, label='first passage')
+py.xlabel(r'$\Theta$ (-)')
+py.ylabel(r'E($\Theta$)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
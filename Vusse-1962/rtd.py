@@ -0,0 +1,120 @@
+"""
+Residence time distribution (RTD) functions shared by the RTD comparisons in
+the Vusse-1962, Harris-2002, Berruti-1988, Bhusarapu-2004, and Smolders-2000
+folders. Scripts in the other folders import them with
+    import sys
+    sys.path.append('../Vusse-1962')
+    from rtd import rtd, weibull
+
+The Vusse 1962 RTD of Eq. 30 is
+    R(t) = q/(r+q) * ((r+q)/r)^((n-1)/n) * (n/tau) * exp(-n*t/tau) * g(a*t)
+where g(x) of Eq. 31 is written as a sum of complex exponentials over the n
+roots of unity. The same sum is the real series
+    g(x) = sum over m >= 1 of x^(mn-1) / (mn-1)!
+which is evaluated here in log-space from the terms near the largest one so
+it is stable for n up to hundreds and for t much larger than tau. When the
+terms of the roots other than one are below round-off, g(x) = exp(x)/n.
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+from scipy.special import gammaln, logsumexp, xlogy
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def logg(n, x, c=10):
+    """
+    Logarithm of g(x) from Eq. 31 in Vusse 1962 as the real series
+    g(x) = sum of x^(mn-1)/(mn-1)! for m >= 1. Only the terms within c
+    standard deviations of the largest term are summed.
+
+    Example:
+        lg = logg(4, np.linspace(0, 10))
+    Inputs:
+        n = number of mixing stages, integer scalar or array, (-)
+        x = argument a*t, scalar or array that broadcasts with n, (-)
+        c = half width of the window of terms in standard deviations
+    Output:
+        lg = log of g(x), -inf where g(x) = 0
+    """
+    n, x = np.broadcast_arrays(np.asarray(n, dtype=float),
+                               np.asarray(x, dtype=float))
+    lg = np.empty(n.shape)
+
+    # terms of the roots other than one are exp(-x*(1 - cos(2*pi/n))) smaller
+    big = (n == 1) | (x*(1 - np.cos(2*np.pi/n)) >= 40 + np.log(n))
+    lg[big] = x[big] - np.log(n[big])
+
+    small = ~big
+    if small.any():
+        ns = n[small][:, None]
+        xs = x[small][:, None]
+
+        # window of m around the largest term j = mn-1 near x
+        w = c*(np.sqrt(xs) + 1)
+        m0 = np.maximum(1, np.floor((xs + 1 - w)/ns))
+        K = int(np.ceil(np.max(2*w/ns))) + 2
+        m = m0 + np.arange(K)
+        j = m*ns - 1
+
+        with np.errstate(divide='ignore'):
+            terms = xlogy(j, xs) - gammaln(j + 1)
+        lg[small] = logsumexp(terms, axis=1)
+
+    return lg
+
+
+def logrtd(n, tau, t, q=1, r=1):
+    """
+    Logarithm of the residence time distribution function from Vusse 1962,
+    see rtd(). All inputs broadcast against each other.
+
+    Example:
+        lr = logrtd(4, 0.5, t)
+    Inputs:
+        n, tau, t, q, r = see rtd()
+    Output:
+        lr = log of the residence time distribution, log(1/s)
+    """
+    n, tau, t, q, r = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                            for v in (n, tau, t, q, r)])
+
+    # log of a from Eq. 30 then log of R(t) from Eq. 30
+    la = np.log(n/tau) + np.log(r/(r + q))/n
+    lr = (np.log(q/(r + q)) + (n - 1)/n*np.log((r + q)/r) + np.log(n/tau)
+          - n*t/tau + logg(n, np.exp(la)*t))
+    return lr
+
+
+def rtd(n, tau, t, q=1, r=1):
+    """
+    Residence time distribution function for stirred tank reactor from paper by
+    Vusse 1962. Assumes circulating flow, pumping action of stirrer, isotropic
+    homogeneous turbulence in the circulating fluid. Evaluated in log-space
+    from the real series of g(at) so the result is real and non-negative.
+    INPUTS:
+    n = number of mixing stages, integer scalar or array, (-)
+    tau = circulation time, s
+    t = time vector, s
+    q = feed rate, m^3/s
+    r = circulation rate, m^3/s
+    OUTPUT:
+    rt = residence time distribution, 1/s
+    EXAMPLE:
+    r = rtd(n, tau, t) or rtd(n, tau, t, q=2, r=3)
+    r = rtd(np.array([1, 2, 4, 10])[:, None], tau, t) for rows of n
+    """
+    return np.exp(logrtd(n, tau, t, q, r))
+
+
+def weibull(x, lam, k):
+    """
+    Weibull distribution function.
+    x = time parameter
+    k = shape parameter
+    lam = lambda as scale parameter
+    """
+    w = (k/lam)*((x/lam)**(k-1))*np.exp(-(x/lam)**k)
+    return w
@@ -0,0 +1,208 @@
+"""
+Memoization of residence time distribution (RTD) evaluations such as rtd(),
+weibull(), eth(), and etd() for scripts that evaluate the same parameters on
+the same time grid many times. A result is stored under the key
+    (model name, hash of the parameters, hash of the time grid)
+in an in-memory least recently used (LRU) store that evicts the oldest results
+when the total size is above maxbytes. With a path the results are also saved
+as .npy files and loaded as read-only memory maps, so they are shared between
+runs and processes. The store on disk is pruned by modification time when it
+is above maxdisk bytes.
+
+Caching is opt-in for each function by wrapping it, the position of the time
+argument is given so it is hashed on its own
+    from rtd import rtd
+    from rtdcache import cached
+    rtd = cached(rtd, 2)
+    rtd(4, 0.5, t)
+    rtd.cache.stats()
+
+The cached results are read-only arrays so they can not be changed in place by
+the caller.
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import os
+import hashlib
+import numpy as np
+from collections import OrderedDict
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def digest(*args, **kwargs):
+    """
+    Hash of scalars and arrays from their dtype, shape, and bytes.
+
+    Example:
+        h = digest(4, 0.5, q=1)
+    """
+    h = hashlib.sha1()
+
+    def update(a):
+        a = np.asarray(a)
+        h.update(str(a.dtype).encode())
+        h.update(str(a.shape).encode())
+        h.update(np.ascontiguousarray(a).tobytes())
+
+    for a in args:
+        update(a)
+    for k in sorted(kwargs):
+        h.update(k.encode())
+        update(kwargs[k])
+    return h.hexdigest()
+
+
+class Cache(object):
+    """
+    LRU store of arrays in memory with an optional store of .npy files.
+
+    Example:
+        cache = Cache(maxbytes=2**28, path='rtdcache')
+        y = cache.get(key)
+        cache.put(key, y)
+        cache.stats()
+    Inputs:
+        maxbytes = largest total size of the arrays in memory, bytes
+        path = folder of the .npy files, None to keep results in memory only
+        maxdisk = largest total size of the .npy files, bytes
+    """
+
+    def __init__(self, maxbytes=2**28, path=None, maxdisk=2**30):
+        self.maxbytes = maxbytes
+        self.path = path
+        self.maxdisk = maxdisk
+        self.store = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.disk = 0
+        self.misses = 0
+        self.evictions = 0
+        if path is not None and not os.path.isdir(path):
+            os.makedirs(path)
+
+    def _file(self, key):
+        return os.path.join(self.path, '_'.join(key) + '.npy')
+
+    def get(self, key):
+        """
+        Cached array of the key or None. A hit moves the key to the end of the
+        LRU order.
+        """
+        if key in self.store:
+            self.store.move_to_end(key)
+            self.hits += 1
+            return self.store[key]
+        if self.path is not None and os.path.exists(self._file(key)):
+            y = np.load(self._file(key), mmap_mode='r')
+            os.utime(self._file(key))
+            self.disk += 1
+            self._keep(key, y)
+            return y
+        self.misses += 1
+        return None
+
+    def put(self, key, y):
+        """
+        Store a read-only copy of the array in memory and on disk.
+        """
+        y = np.array(y)
+        y.flags.writeable = False
+        if self.path is not None:
+            np.save(self._file(key), y)
+            self._prune()
+        self._keep(key, y)
+        return y
+
+    def _keep(self, key, y):
+        """
+        Keep the array in memory and evict the least recently used arrays
+        while the total size is above maxbytes.
+        """
+        if y.nbytes > self.maxbytes:
+            return
+        if key in self.store:
+            self.nbytes -= self.store.pop(key).nbytes
+        self.store[key] = y
+        self.nbytes += y.nbytes
+        while self.nbytes > self.maxbytes:
+            old, z = self.store.popitem(last=False)
+            self.nbytes -= z.nbytes
+            self.evictions += 1
+
+    def _prune(self):
+        """
+        Remove the oldest .npy files while the folder is above maxdisk.
+        """
+        files = [os.path.join(self.path, f) for f in os.listdir(self.path)
+                 if f.endswith('.npy')]
+        sizes = dict((f, os.path.getsize(f)) for f in files)
+        total = sum(sizes.values())
+        for f in sorted(files, key=os.path.getmtime):
+            if total <= self.maxdisk:
+                break
+            os.remove(f)
+            total -= sizes[f]
+
+    def clear(self, disk=False):
+        """
+        Remove the arrays in memory, and the .npy files with disk=True.
+        """
+        self.store.clear()
+        self.nbytes = 0
+        if disk and self.path is not None:
+            for f in os.listdir(self.path):
+                if f.endswith('.npy'):
+                    os.remove(os.path.join(self.path, f))
+
+    def stats(self):
+        """
+        Hit statistics as a dictionary of memory hits, disk hits, misses,
+        evictions, hit rate, number of entries, and bytes in memory.
+        """
+        calls = self.hits + self.disk + self.misses
+        rate = (self.hits + self.disk)/calls if calls else 0.0
+        return {'hits': self.hits, 'disk': self.disk, 'misses': self.misses,
+                'evictions': self.evictions, 'rate': rate,
+                'entries': len(self.store), 'nbytes': self.nbytes}
+
+
+# shared store of the cached functions when no cache is given
+CACHE = Cache()
+
+
+def cached(fun, targ, name=None, cache=None):
+    """
+    Wrap an RTD function so its results are cached by model name, hash of the
+    parameters, and hash of the time grid.
+
+    Example:
+        rtd = cached(rtd, 2)
+        etd = cached(etd, 2, cache=Cache(path='rtdcache'))
+        weibull = cached(weibull, 0)
+    Inputs:
+        fun = function that returns an array
+        targ = position of the time argument, which is passed by position
+        name = model name of the key, default is the name of the function
+        cache = Cache object, default is the shared CACHE
+    Output:
+        wrapper = function with the same arguments as fun and the cache as
+                  wrapper.cache
+    """
+    name = name or fun.__name__
+    cache = cache or CACHE
+
+    def wrapper(*args, **kwargs):
+        t = args[targ]
+        p = args[:targ] + args[targ+1:]
+        key = (name, digest(*p, **kwargs), digest(t))
+        y = cache.get(key)
+        if y is None:
+            y = cache.put(key, fun(*args, **kwargs))
+        return y
+
+    wrapper.cache = cache
+    wrapper.__name__ = name
+    wrapper.__doc__ = fun.__doc__
+    return wrapper
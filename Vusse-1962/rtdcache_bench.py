@@ -0,0 +1,60 @@
+"""
+Timing of the RTD cache of rtdcache.py for a sweep that evaluates rtd() of
+Vusse 1962 and etd() of Kunii 1991 for the same parameters and time grid many
+times, such as the reactor averages of a mixing study, with and without the
+cache and with the store on disk.
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+import numpy as np
+from rtd import rtd
+from rtdcache import Cache, cached
+
+sys.path.append('../Kunii-1991')
+from tanks import etd
+
+# Parameters
+#------------------------------------------------------------------------------
+
+t = np.linspace(0, 20, 2000)    # time grid, s
+ns = np.arange(1, 41)           # number of stages, (-)
+taus = [0.5, 1.0, 2.0]          # circulation and residence times, s
+repeats = 10                    # times the sweep is evaluated
+
+def sweep(frtd, fetd):
+    for k in range(repeats):
+        for tau in taus:
+            for n in ns:
+                frtd(n, tau, t)
+                fetd(n, tau, t)
+
+# Without cache, in memory, and on disk
+#------------------------------------------------------------------------------
+
+t0 = time.time()
+sweep(rtd, etd)
+print('no cache: {:.3f} s'.format(time.time() - t0))
+
+cache = Cache()
+t0 = time.time()
+sweep(cached(rtd, 2, cache=cache), cached(etd, 2, cache=cache))
+print('memory cache: {:.3f} s, {}'.format(time.time() - t0, cache.stats()))
+
+# a new cache with the same folder loads the results of the first one
+path = tempfile.mkdtemp()
+first = Cache(path=path)
+sweep(cached(rtd, 2, cache=first), cached(etd, 2, cache=first))
+second = Cache(path=path)
+t0 = time.time()
+sweep(cached(rtd, 2, cache=second), cached(etd, 2, cache=second))
+print('disk cache: {:.3f} s, {}'.format(time.time() - t0, second.stats()))
+
+# small memory store evicts the least recently used results
+small = Cache(maxbytes=50*t.nbytes)
+sweep(cached(rtd, 2, cache=small), cached(etd, 2, cache=small))
+print('small cache: {}'.format(small.stats()))
+
+shutil.rmtree(path)
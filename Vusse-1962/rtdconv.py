@@ -0,0 +1,202 @@
+"""
+Convolution of inlet tracer signals with a residence time distribution (RTD)
+and regularized deconvolution to recover the RTD from measured inlet and
+outlet signals. The outlet of a vessel with RTD E(t) is
+    cout(t) = integral from 0 to t of cin(t - s) * E(s) ds
+which is evaluated with the FFT on a uniform time grid with the trapezoid
+rule. Signals on non-uniform grids, such as the digitized CSV data, are
+resampled to a uniform grid first and the FFT length is zero-padded so there
+is no wrap-around.
+
+The deconvolution solves cout = cin * E for E with Tikhonov regularization in
+the frequency domain
+    E = conj(Cin) * Cout / (|Cin|^2 + lam * max|Cin|^2 * |D|^2)
+where D is the frequency response of the identity (order 0) or of the second
+difference (order 2) which favours a smooth E(t). It inverts the same
+trapezoid rule as the convolution. With the first samples of cin and E
+halved the trapezoid rule is a plain discrete convolution except at t = 0,
+where cout is zero, so that sample is corrected with one more solve for the
+first value of E. Then deconvolve(convolve(cin, E)) recovers E.
+
+Example:
+    tu, cout = convolve(t, cin, lambda t: rtd(4, 0.5, t))
+    tu, E = deconvolve(t, cin, cout, lam=10)
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import numpy as np
+from scipy import fft
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def resample(t, y, dt=None):
+    """
+    Resample a signal onto a uniform time grid starting at t = 0 by linear
+    interpolation. The signal is zero outside the range of t.
+
+    Example:
+        tu, yu = resample(t, y)
+    Inputs:
+        t = time of the samples in increasing order, s
+        y = signal at each time
+        dt = time step of the uniform grid, default is the median step of t
+    Output:
+        tu = uniform time grid, s
+        yu = signal on the uniform grid
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if dt is None:
+        dt = np.median(np.diff(t))
+    tu = np.arange(0, t[-1] + dt/2, dt)
+    yu = np.interp(tu, t, y, left=0, right=0)
+    return tu, yu
+
+
+def uniform(t):
+    """
+    True if the time grid starts at zero and has a uniform time step.
+
+    Example:
+        uniform(np.linspace(0, 2, 100))
+    """
+    t = np.asarray(t, dtype=float)
+    dt = np.diff(t)
+    return t[0] == 0 and np.allclose(dt, dt[0], rtol=1e-9, atol=0)
+
+
+def convolve(t, cin, E, tE=None, full=False, dt=None):
+    """
+    Outlet signal as the convolution of the inlet signal with the RTD using
+    the FFT with automatic zero-padding.
+
+    Example:
+        tu, cout = convolve(t, cin, lambda t: rtd(4, 0.5, t))
+        tu, cout = convolve(t, cin, E, tE)
+    Inputs:
+        t = time of the inlet signal, s
+        cin = inlet signal at each time
+        E = RTD as a function E(t) or as values at the times tE, 1/s
+        tE = time of the RTD values, default is t, s
+        full = return the full length of the convolution instead of the length
+               of the inlet signal
+        dt = time step to resample a non-uniform t, see resample()
+    Output:
+        tu = uniform time grid, s
+        cout = outlet signal on the uniform grid
+    """
+    t = np.asarray(t, dtype=float)
+    if uniform(t):
+        tu, cu = t, np.asarray(cin, dtype=float)
+    else:
+        tu, cu = resample(t, cin, dt)
+    dt = tu[1] - tu[0]
+
+    # RTD on the same time step, from the function or resampled from values
+    if callable(E):
+        Eu = E(tu)
+    else:
+        tE = t if tE is None else np.asarray(tE, dtype=float)
+        if len(tE) != len(E):
+            raise ValueError('E has {} values but tE has {} times, give tE for '
+                             'the values of E'.format(len(E), len(tE)))
+        Eu = np.interp(np.arange(0, tE[-1] + dt/2, dt), tE, E, left=0, right=0)
+
+    n = len(cu) + len(Eu) - 1
+    nfft = fft.next_fast_len(n, real=True)
+    cout = fft.irfft(fft.rfft(cu, nfft) * fft.rfft(Eu, nfft), nfft)[:n]
+
+    # trapezoid rule takes half of the end points of each integral
+    cp = np.zeros(n)
+    Ep = np.zeros(n)
+    cp[:len(cu)] = cu
+    Ep[:len(Eu)] = Eu
+    cout = (cout - (cp*Eu[0] + Ep*cu[0])/2) * dt
+
+    if full:
+        return np.arange(n)*dt, cout
+    return tu, cout[:len(tu)]
+
+
+def deconvolve(t, cin, cout, lam=1, order=2, dt=None):
+    """
+    Recover the RTD from measured inlet and outlet signals by Tikhonov
+    regularized deconvolution in the frequency domain.
+
+    Example:
+        tu, E = deconvolve(t, cin, cout, lam=10)
+    Inputs:
+        t = time of the inlet and outlet signals, s
+        cin = inlet signal at each time
+        cout = outlet signal at each time
+        lam = regularization parameter relative to the largest |Cin|^2, the
+              second difference penalty is small at low frequency so it
+              needs a larger lam than the identity, about 1-100 vs 0.01
+        order = 0 for the identity or 2 for the second difference penalty
+        dt = time step to resample a non-uniform t, see resample()
+    Output:
+        tu = uniform time grid, s
+        E = recovered RTD on the uniform grid, 1/s
+    """
+    t = np.asarray(t, dtype=float)
+    if uniform(t):
+        tu, ci, co = t, np.asarray(cin, dtype=float), np.asarray(cout, dtype=float)
+    else:
+        tu, ci = resample(t, cin, dt)
+        tu, co = resample(t, cout, dt)
+    dt = tu[1] - tu[0]
+
+    # trapezoid rule of convolve() as a convolution with the first samples of
+    # cin and of the unknown F = E halved
+    ch = ci.copy()
+    ch[0] = ch[0]/2
+
+    # zero-pad to twice the length so the circular convolution is linear
+    nfft = fft.next_fast_len(2*len(tu), real=True)
+    Ci = fft.rfft(ch, nfft) * dt
+
+    # frequency response of the penalty operator
+    w = 2*np.pi*np.arange(len(Ci))/nfft
+    D2 = np.ones(len(Ci)) if order == 0 else (2 - 2*np.cos(w))**2
+
+    reg = lam * np.max(np.abs(Ci))**2 * D2
+
+    def solve(y):
+        Y = fft.rfft(y, nfft)
+        return fft.irfft(np.conj(Ci) * Y / (np.abs(Ci)**2 + reg), nfft)[:len(tu)]
+
+    # the convolution gives dt*ch[0]*F[0] at t = 0 where the trapezoid rule
+    # gives zero, so add it back to cout, which is linear in F[0]
+    F = solve(co)
+    e0 = np.zeros(len(tu))
+    e0[0] = dt*ch[0]
+    g = solve(e0)
+    F = F + F[0]/(1 - g[0])*g
+
+    E = F
+    E[0] = 2*F[0]
+    return tu, E
+
+
+def step(t, t0=0):
+    """
+    Step inlet signal from 0 to 1 at time t0.
+
+    Example:
+        cin = step(t, 1.0)
+    """
+    return (np.asarray(t, dtype=float) >= t0).astype(float)
+
+
+def pulse(t, t0, width):
+    """
+    Rectangular inlet pulse of unit area starting at time t0, such as a
+    non-ideal tracer injection.
+
+    Example:
+        cin = pulse(t, 0.1, 0.2)
+    """
+    t = np.asarray(t, dtype=float)
+    return ((t >= t0) & (t < t0 + width)) / width
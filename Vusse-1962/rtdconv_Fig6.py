@@ -0,0 +1,72 @@
+"""
+Outlet responses of the Vusse 1962 stirred tank (n = 4, tau = 0.5 s) to a
+non-ideal tracer injection, a step, and a periodic feed disturbance from the
+FFT convolution in rtdconv.py. The RTD is then recovered from the noisy inlet
+and outlet signals of the injection by regularized deconvolution.
+"""
+
+import numpy as np
+import matplotlib.pyplot as py
+from rtd import rtd
+from rtdconv import convolve, deconvolve, step
+
+# Parameters
+#------------------------------------------------------------------------------
+
+n = 4                           # number of mixing stages, (-)
+tau = 0.5                       # circulation time, s
+t = np.linspace(0, 6, 1201)     # time range, s
+
+E = lambda t: rtd(n, tau, t)    # RTD of the stirred tank, 1/s
+
+# Inlet signals
+#------------------------------------------------------------------------------
+
+# tracer injection spread over about 0.2 s, unit area
+cinj = np.exp(-(t-0.3)**2/(2*0.05**2))/(np.sqrt(2*np.pi)*0.05)
+
+# step and periodic feed disturbance
+cstep = step(t, 0.5)
+cper = 1 + 0.2*np.sin(2*np.pi*t/1.5)
+
+# Outlet signals by convolution
+#------------------------------------------------------------------------------
+
+tu, oinj = convolve(t, cinj, E)
+tu, ostep = convolve(t, cstep, E)
+tu, oper = convolve(t, cper, E)
+
+# Recover the RTD from noisy measurements of the injection
+#------------------------------------------------------------------------------
+
+rng = np.random.default_rng(1)
+noise = 0.005*rng.standard_normal(len(t))
+tu, Er = deconvolve(t, cinj, oinj + noise, lam=10)
+print('max error of recovered RTD = {:.4f} 1/s'.format(np.abs(Er - E(t)).max()))
+
+# Plot
+#------------------------------------------------------------------------------
+
+py.close('all')
+
+py.figure(1)
+py.plot(t, cinj, 'k--', lw=2, label='inlet injection')
+py.plot(t, oinj, 'k-', lw=2, label='outlet injection')
+py.plot(t, cstep, 'b--', lw=2, label='inlet step')
+py.plot(t, ostep, 'b-', lw=2, label='outlet step')
+py.plot(t, cper, 'r--', lw=2, label='inlet periodic')
+py.plot(t, oper, 'r-', lw=2, label='outlet periodic')
+py.xlabel('Time (s)')
+py.ylabel('Tracer signal (-)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.figure(2)
+py.plot(t, E(t), 'b-', lw=2, label='rtd')
+py.plot(tu, Er, 'g--', lw=2, label='deconvolution')
+py.xlabel('Time (s)')
+py.ylabel('RTD function (1/s)')
+py.legend(loc='best', numpoints=1)
+py.grid()
+
+py.show()
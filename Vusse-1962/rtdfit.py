@@ -0,0 +1,281 @@
+"""
+Fit residence time distribution (RTD) models to the digitized RTD data of the
+Vusse-1962, Berruti-1988, Bhusarapu-2004, Harris-2002, and Smolders-2000
+folders and rank the models by AIC and BIC. The models are
+    vusse = rtd(n, tau, t) from Vusse 1962
+    tanks = etd(n, tau, t) tanks-in-series from Kunii 1991
+    gamma = etd(n, tau, t) with a real number of stages n
+    weibull = weibull(t, lam, k)
+    dispersion = et(D, L, u, t) open vessel from Levenspiel 1999 as
+                 E(t) = eth(D/uL, t/tau)/tau with tau = L/u
+The number of stages n of the vusse and tanks models is an integer so it is
+found by an outer search over n = 1 to nmax where the continuous parameters are
+fitted for each n, while the gamma model relaxes n of the tanks to a real
+value. The continuous parameters are fitted by least squares in log-space
+from several random starts. All the local fits of all datasets and models are
+run in one process pool.
+
+Example:
+    t, E = load('berruti5')
+    res = compare(t, E)
+    res = fit_all()
+"""
+
+# Modules
+# -----------------------------------------------------------------------------
+import sys
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import least_squares
+from rtd import rtd, weibull
+
+sys.path.append('../Levenspiel-1999')
+sys.path.append('../Kunii-1991')
+from dispersion import eth
+from tanks import etd
+
+# Models and datasets
+# -----------------------------------------------------------------------------
+
+# model name: (integer n, names of the continuous parameters)
+MODELS = {
+    'vusse': (True, ['tau']),
+    'tanks': (True, ['tau']),
+    'gamma': (False, ['n', 'tau']),
+    'weibull': (False, ['lam', 'k']),
+    'dispersion': (False, ['DLu', 'tau'])
+}
+
+# dataset name: csv file of time and RTD
+DATASETS = {
+    'berruti5': '../Berruti-1988/fig5.csv',
+    'berruti6': '../Berruti-1988/fig6.csv',
+    'berruti7': '../Berruti-1988/fig7.csv',
+    'bhusarapu3a': '../Bhusarapu-2004/fig3a.csv',
+    'bhusarapu3b': '../Bhusarapu-2004/fig3b.csv',
+    'harris15a': '../Harris-2002/fig15a.csv',
+    'harris15b': '../Harris-2002/fig15b.csv',
+    'harris15c': '../Harris-2002/fig15c.csv',
+    'harris15d': '../Harris-2002/fig15d.csv',
+    'smolders6a': '../Smolders-2000/fig6a.csv',
+    'smolders6b': '../Smolders-2000/fig6b.csv',
+    'smolders6c': '../Smolders-2000/fig6c.csv',
+    'vusse1': 'n1.csv',
+    'vusse2': 'n2.csv',
+    'vusse4': 'n4.csv',
+    'vusse10': 'n10.csv'
+}
+
+# Functions
+# -----------------------------------------------------------------------------
+
+def load(name):
+    """
+    Load a bundled RTD dataset sorted by time.
+
+    Example:
+        t, E = load('smolders6c')
+    Inputs:
+        name = dataset name from DATASETS
+    Output:
+        t = time, s
+        E = residence time distribution, 1/s
+    """
+    t, E = np.loadtxt(DATASETS[name], delimiter=',', unpack=True)
+    k = np.argsort(t)
+    return t[k], E[k]
+
+
+def model(name, n, p, t):
+    """
+    Evaluate an RTD model.
+
+    Example:
+        E = model('vusse', 9, [2.2], t)
+    Inputs:
+        name = model name from MODELS
+        n = number of stages for the vusse and tanks models, None for others
+        p = continuous parameters in the order of MODELS
+        t = time, s
+    Output:
+        E = residence time distribution, 1/s
+    """
+    t = np.asarray(t, dtype=float)
+    if name == 'vusse':
+        return rtd(n, p[0], t)
+    if name == 'tanks':
+        return etd(int(n), p[0], t)
+    if name == 'gamma':
+        return etd(p[0], p[1], t)
+    if name == 'weibull':
+        return weibull(t, p[0], p[1])
+    if name == 'dispersion':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            E = eth(p[0], t/p[1])/p[1]
+        return np.where(t > 0, E, 0)
+    raise ValueError('unknown model ' + name)
+
+
+def bounds(name, t):
+    """
+    Lower and upper bounds of the continuous parameters of a model from the
+    time range of the data.
+
+    Example:
+        lo, hi = bounds('weibull', t)
+    """
+    tmax = np.max(t)
+    b = {'tau': (tmax/1000, tmax*10),
+         'n': (0.2, 100),
+         'lam': (tmax/1000, tmax*10),
+         'k': (0.2, 50),
+         'DLu': (1e-4, 100)}
+    names = MODELS[name][1]
+    lo = np.array([b[p][0] for p in names])
+    hi = np.array([b[p][1] for p in names])
+    return lo, hi
+
+
+def local(task):
+    """
+    Local least squares fit of the continuous parameters in log-space from
+    one start. Used as the task of the process pool.
+
+    Example:
+        key, n, p, rss = local((key, 'weibull', None, t, E, x0))
+    Inputs:
+        task = tuple of (key, model name, n, t, E, log of start parameters)
+    Output:
+        key, n = same as the task
+        p = fitted continuous parameters
+        rss = residual sum of squares
+    """
+    key, name, n, t, E, x0 = task
+    lo, hi = bounds(name, t)
+
+    def res(x):
+        with np.errstate(all='ignore'):
+            r = model(name, n, np.exp(x), t) - E
+        return np.nan_to_num(r, nan=1e3, posinf=1e3, neginf=-1e3)
+
+    sol = least_squares(res, x0, bounds=(np.log(lo), np.log(hi)))
+    return key, n, np.exp(sol.x), np.sum(sol.fun**2)
+
+
+def tasks(key, name, t, E, starts=4, nmax=30, rng=None):
+    """
+    Local fit tasks of one model and dataset as random starts that are
+    log-uniform within the bounds, for each n = 1 to nmax of the integer
+    models.
+
+    Example:
+        tk = tasks('smolders6c', 'weibull', t, E)
+    """
+    rng = rng or np.random.default_rng(0)
+    lo, hi = bounds(name, t)
+    ns = range(1, nmax+1) if MODELS[name][0] else [None]
+    tk = []
+    for n in ns:
+        for k in range(starts):
+            x0 = rng.uniform(np.log(lo), np.log(hi))
+            tk.append((key, name, n, t, E, x0))
+    return tk
+
+
+def criteria(rss, N, k):
+    """
+    Akaike (AIC) and Bayesian (BIC) information criteria of a least squares
+    fit with N points and k parameters.
+
+    Example:
+        aic, bic = criteria(rss, len(t), 2)
+    """
+    ll = N*np.log(rss/N)
+    return ll + 2*k, ll + k*np.log(N)
+
+
+def run(items, models=None, starts=4, nmax=30, workers=None, seed=0):
+    """
+    Fit the models to several datasets with all the local fits in one process
+    pool and rank the models of each dataset by AIC.
+
+    Example:
+        res = run({'a': (t, E)})
+    Inputs:
+        items = dictionary of dataset name: (t, E)
+        models = list of model names, default is all of MODELS
+        starts = number of random starts for each model and n
+        nmax = largest number of stages for the vusse and tanks models
+        workers = number of processes, 1 to run without a pool
+        seed = seed of the random starts
+    Output:
+        res = dictionary of dataset name: list of fits sorted by AIC where each
+              fit is a dictionary of model, n, params, rss, aic, bic
+    """
+    models = models or sorted(MODELS)
+    rng = np.random.default_rng(seed)
+
+    tk = []
+    for key in sorted(items):
+        t, E = items[key]
+        for name in models:
+            tk += tasks((key, name), name, t, E, starts, nmax, rng)
+
+    if workers == 1:
+        out = [local(task) for task in tk]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            out = list(pool.map(local, tk, chunksize=16))
+
+    # best local fit of each dataset and model
+    best = {}
+    for key, n, p, rss in out:
+        if key not in best or rss < best[key][2]:
+            best[key] = (n, p, rss)
+
+    res = {}
+    for (key, name), (n, p, rss) in best.items():
+        N = len(items[key][0])
+        k = len(p) + (1 if MODELS[name][0] else 0)
+        aic, bic = criteria(rss, N, k)
+        fit = {'model': name, 'n': n, 'params': dict(zip(MODELS[name][1], p)),
+               'rss': rss, 'aic': aic, 'bic': bic}
+        res.setdefault(key, []).append(fit)
+
+    for key in res:
+        res[key].sort(key=lambda fit: fit['aic'])
+    return res
+
+
+def compare(t, E, models=None, **kwargs):
+    """
+    Fit the models to one RTD dataset and rank them by AIC.
+
+    Example:
+        fits = compare(t, E, ['vusse', 'weibull'])
+    Inputs:
+        t = time, s
+        E = residence time distribution, 1/s
+        models = list of model names, default is all of MODELS
+        kwargs = options of run()
+    Output:
+        fits = list of fits sorted by AIC, see run()
+    """
+    return run({'data': (t, E)}, models, **kwargs)['data']
+
+
+def fit_all(datasets=None, models=None, **kwargs):
+    """
+    Fit the models to the bundled datasets in one call.
+
+    Example:
+        res = fit_all()
+    Inputs:
+        datasets = list of dataset names, default is all of DATASETS
+        models = list of model names, default is all of MODELS
+        kwargs = options of run()
+    Output:
+        res = dictionary of dataset name: list of fits sorted by AIC
+    """
+    datasets = datasets or sorted(DATASETS)
+    return run(dict((name, load(name)) for name in datasets), models, **kwargs)
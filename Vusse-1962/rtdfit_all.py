@@ -0,0 +1,48 @@
+"""
+Fit the Vusse, tanks-in-series, gamma, Weibull, and dispersion RTD models to
+all the bundled RTD datasets and rank the models by AIC. Plots the best fit of
+each model for every dataset.
+"""
+
+import time
+import numpy as np
+import matplotlib.pyplot as py
+from rtdfit import MODELS, fit_all, load, model
+
+if __name__ == '__main__':
+
+    # Fit all datasets and models in one process pool
+    # -------------------------------------------------------------------------
+
+    t0 = time.time()
+    res = fit_all()
+    print('fit of {} datasets = {:.2f} s'.format(len(res), time.time()-t0))
+
+    for name in sorted(res):
+        print('\n' + name)
+        for fit in res[name]:
+            params = ', '.join('{} = {:.4g}'.format(p, v)
+                               for p, v in sorted(fit['params'].items()))
+            n = '' if fit['n'] is None else 'n = {}, '.format(fit['n'])
+            print('  {:<11} AIC = {:8.2f}  BIC = {:8.2f}  {}{}'.format(
+                  fit['model'], fit['aic'], fit['bic'], n, params))
+
+    # Plot
+    # -------------------------------------------------------------------------
+
+    py.close('all')
+
+    fig, axes = py.subplots(4, 4, figsize=(14, 12))
+    for ax, name in zip(axes.ravel(), sorted(res)):
+        t, E = load(name)
+        tm = np.linspace(t.max()/1000, t.max()*1.1, 300)
+        ax.plot(t, E, 'o', mec='k', mfc='none')
+        for fit in res[name]:
+            p = [fit['params'][k] for k in MODELS[fit['model']][1]]
+            ax.plot(tm, model(fit['model'], fit['n'], p, tm), lw=2, label=fit['model'])
+        ax.set_title(name)
+        ax.grid()
+    axes[0, 0].legend(loc='best', numpoints=1)
+    py.tight_layout()
+
+    py.show()